@@ -1,5 +1,8 @@
 """The format analyzer."""
 
+import collections
+import threading
+
 import pysigscan
 
 from dfvfs.analyzer import specification
@@ -10,59 +13,29 @@ from dfvfs.resolver import resolver
 class Analyzer:
     """Format analyzer."""
 
+    # The maximum number of cached signature scanners, which allows for
+    # the signature scanner of every format category and a previous signature
+    # scanner of each.
+    _MAXIMUM_NUMBER_OF_SIGNATURE_SCANNERS = 2 * len(definitions.FORMAT_CATEGORIES)
+
     _SCAN_BUFFER_SIZE = 33 * 1024
 
     _analyzer_helpers = {}
 
-    # The archive format category analyzer helpers that do not have
-    # a format specification.
-    _archive_remainder_list = None
-
-    # The archive format category signature scanner.
-    _archive_scanner = None
-
-    # The archive format category specification store.
-    _archive_store = None
-
-    # The compressed stream format category analyzer helpers that do not have
-    # a format specification.
-    _compressed_stream_remainder_list = None
-
-    # The compressed stream format category signature scanner.
-    _compressed_stream_scanner = None
-
-    # The compressed stream format category specification store.
-    _compressed_stream_store = None
-
-    # The file system format category analyzer helpers that do not have
-    # a format specification.
-    _file_system_remainder_list = None
-
-    # The file system format category signature scanner.
-    _file_system_scanner = None
+    # The prebuilt signature scanners per signature table, of which the most
+    # recently used are retained. The signature scanners are retained when
+    # analyzer helpers are registered or deregistered so that they are only
+    # rebuilt when the signatures change.
+    _signature_scanners = collections.OrderedDict()
 
-    # The file system format category specification store.
-    _file_system_store = None
+    # The signature scanners, specification stores and analyzer helpers that do
+    # not have a format specification per format category.
+    _category_scanners = {}
 
-    # The storage media image format category analyzer helpers that do not have
-    # a format specification.
-    _storage_media_image_remainder_list = None
-
-    # The storage media image format category signature scanner.
-    _storage_media_image_scanner = None
-
-    # The storage media image format category specification store.
-    _storage_media_image_store = None
-
-    # The volume system format category analyzer helpers that do not have
-    # a format specification.
-    _volume_system_remainder_list = None
-
-    # The volume system format category signature scanner.
-    _volume_system_scanner = None
-
-    # The volume system format category specification store.
-    _volume_system_store = None
+    # The lock that guards the cached signature scanners, since scans can run
+    # concurrently on different threads. The lock is reentrant since the
+    # signature scanner of a format category is retrieved while holding it.
+    _cache_lock = threading.RLock()
 
     @classmethod
     def _FlushCache(cls, format_categories):
@@ -71,34 +44,46 @@ class Analyzer:
         Args:
           format_categories (set[str]): format categories.
         """
-        if definitions.FORMAT_CATEGORY_ARCHIVE in format_categories:
-            cls._archive_remainder_list = None
-            cls._archive_scanner = None
-            cls._archive_store = None
-
-        if definitions.FORMAT_CATEGORY_COMPRESSED_STREAM in format_categories:
-            cls._compressed_stream_remainder_list = None
-            cls._compressed_stream_scanner = None
-            cls._compressed_stream_store = None
-
-        if definitions.FORMAT_CATEGORY_FILE_SYSTEM in format_categories:
-            cls._file_system_remainder_list = None
-            cls._file_system_scanner = None
-            cls._file_system_store = None
-
-        if definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE in format_categories:
-            cls._storage_media_image_remainder_list = None
-            cls._storage_media_image_scanner = None
-            cls._storage_media_image_store = None
-
-        if definitions.FORMAT_CATEGORY_VOLUME_SYSTEM in format_categories:
-            cls._volume_system_remainder_list = None
-            cls._volume_system_scanner = None
-            cls._volume_system_store = None
+        with cls._cache_lock:
+            for format_category in format_categories:
+                cls._category_scanners.pop(format_category, None)
+
+    @classmethod
+    def _GetCategoryScanner(cls, format_category):
+        """Retrieves the signature scanner of a format category.
+
+        Args:
+          format_category (int): format category.
+
+        Returns:
+          tuple[pysigscan.scanner, FormatSpecificationStore, list[AnalyzerHelper]]:
+              signature scanner, format specification store and remaining analyzer
+              helpers that do not have a format specification.
+        """
+        with cls._cache_lock:
+            category_scanner = cls._category_scanners.get(format_category, None)
+            if category_scanner is None:
+                specification_store, remainder_list = cls._GetSpecificationStore(
+                    format_category
+                )
+                signature_scanner = cls._GetSignatureScanner(specification_store)
+
+                category_scanner = (
+                    signature_scanner,
+                    specification_store,
+                    remainder_list,
+                )
+                cls._category_scanners[format_category] = category_scanner
+
+        return category_scanner
 
     @classmethod
     def _GetSignatureScanner(cls, specification_store):
-        """Initializes a signature scanner based on a specification store.
+        """Retrieves a signature scanner based on a specification store.
+
+        Building the scan tree of a signature scanner is expensive, hence
+        the most recently used signature scanners are cached per signature table
+        and their scan tree is built before the signature scanner is returned.
 
         Args:
           specification_store (FormatSpecificationStore): specification store.
@@ -106,30 +91,62 @@ class Analyzer:
         Returns:
           pysigscan.scanner: signature scanner.
         """
-        signature_scanner = pysigscan.scanner()
-        signature_scanner.set_scan_buffer_size(cls._SCAN_BUFFER_SIZE)
-
-        for format_specification in specification_store.specifications:
-            for signature in format_specification.signatures:
-                pattern_offset = signature.offset
-
-                if pattern_offset is None:
-                    signature_flags = pysigscan.signature_flags.NO_OFFSET
-                elif pattern_offset < 0:
-                    pattern_offset *= -1
-                    signature_flags = pysigscan.signature_flags.RELATIVE_FROM_END
-                else:
-                    signature_flags = pysigscan.signature_flags.RELATIVE_FROM_START
-
-                signature_scanner.add_signature(
-                    signature.identifier,
-                    pattern_offset,
-                    signature.pattern,
-                    signature_flags,
-                )
+        signature_table = cls._GetSignatureTable(specification_store)
+
+        with cls._cache_lock:
+            signature_scanner = cls._signature_scanners.get(signature_table, None)
+            if signature_scanner is not None:
+                cls._signature_scanners.move_to_end(signature_table)
+
+            else:
+                signature_scanner = pysigscan.scanner()
+                signature_scanner.set_scan_buffer_size(cls._SCAN_BUFFER_SIZE)
+
+                for signature_identifier, pattern_offset, pattern in signature_table:
+                    if pattern_offset is None:
+                        signature_flags = pysigscan.signature_flags.NO_OFFSET
+                    elif pattern_offset < 0:
+                        pattern_offset *= -1
+                        signature_flags = pysigscan.signature_flags.RELATIVE_FROM_END
+                    else:
+                        signature_flags = pysigscan.signature_flags.RELATIVE_FROM_START
+
+                    signature_scanner.add_signature(
+                        signature_identifier, pattern_offset, pattern, signature_flags
+                    )
+
+                # The scan tree is built when a scan is started.
+                scan_state = pysigscan.scan_state()
+                signature_scanner.scan_start(scan_state)
+                signature_scanner.scan_stop(scan_state)
+
+                if (
+                    len(cls._signature_scanners)
+                    >= cls._MAXIMUM_NUMBER_OF_SIGNATURE_SCANNERS
+                ):
+                    cls._signature_scanners.popitem(last=False)
+
+                cls._signature_scanners[signature_table] = signature_scanner
 
         return signature_scanner
 
+    @classmethod
+    def _GetSignatureTable(cls, specification_store):
+        """Retrieves the signature table of a specification store.
+
+        Args:
+          specification_store (FormatSpecificationStore): specification store.
+
+        Returns:
+          tuple[tuple[str, int, bytes]]: signature identifier, offset and pattern
+              of the signatures in the specification store.
+        """
+        return tuple(
+            (signature.identifier, signature.offset, signature.pattern)
+            for format_specification in specification_store.specifications
+            for signature in format_specification.signatures
+        )
+
     @classmethod
     def _GetSpecificationStore(cls, format_category):
         """Retrieves the specification store for specified format category.
@@ -145,7 +162,9 @@ class Analyzer:
         specification_store = specification.FormatSpecificationStore()
         remainder_list = []
 
-        for analyzer_helper in cls._analyzer_helpers.values():
+        # The analyzer helpers are sorted by type indicator so that the signature
+        # table does not depend on the order in which they were registered.
+        for _, analyzer_helper in sorted(cls._analyzer_helpers.items()):
             if not analyzer_helper.IsEnabled():
                 continue
 
@@ -160,33 +179,22 @@ class Analyzer:
         return specification_store, remainder_list
 
     @classmethod
-    def _GetTypeIndicators(
-        cls,
-        signature_scanner,
-        specification_store,
-        remainder_list,
-        path_spec,
-        resolver_context=None,
-    ):
-        """Determines if a file contains a supported format types.
+    def _GetTypeIndicators(cls, file_object, format_category):
+        """Determines if a file contains supported format types of a format category.
 
         Args:
-          signature_scanner (pysigscan.scanner): signature scanner.
-          specification_store (FormatSpecificationStore): specification store.
-          remainder_list (list[AnalyzerHelper]): remaining analyzer helpers that do not
-              have a format specification.
-          path_spec (PathSpec): path specification.
-          resolver_context (Optional[Context]): resolver context, where None represents
-              the built-in context which is not multi process safe.
+          file_object (FileIO): file-like object.
+          format_category (int): format category.
 
         Returns:
           list[str]: supported format type indicators.
         """
+        signature_scanner, specification_store, remainder_list = (
+            cls._GetCategoryScanner(format_category)
+        )
+
         type_indicator_list = []
 
-        file_object = resolver.Resolver.OpenFileObject(
-            path_spec, resolver_context=resolver_context
-        )
         scan_state = pysigscan.scan_state()
 
         signature_scanner.scan_file_object(scan_state, file_object)
@@ -204,8 +212,26 @@ class Analyzer:
             if result is not None:
                 type_indicator_list.append(result)
 
+        if format_category == definitions.FORMAT_CATEGORY_VOLUME_SYSTEM:
+            cls._RemoveFallbackTypeIndicators(type_indicator_list)
+
         return type_indicator_list
 
+    @classmethod
+    def _RemoveFallbackTypeIndicators(cls, type_indicators):
+        """Removes fallback type indicators if an alternative was detected.
+
+        Args:
+          type_indicators (list[str]): supported format type indicators.
+        """
+        if (
+            len(type_indicators) > 1
+            and definitions.TYPE_INDICATOR_TSK_PARTITION in type_indicators
+        ):
+            # The TSK partition analyzer is used as a fallback, remove it if
+            # an alternative analyzer detected a supported volume system.
+            type_indicators.remove(definitions.TYPE_INDICATOR_TSK_PARTITION)
+
     @classmethod
     def DeregisterHelper(cls, analyzer_helper):
         """Deregisters a format analyzer helper.
@@ -235,29 +261,16 @@ class Analyzer:
 
         Args:
           path_spec (PathSpec): path specification.
-          resolver_context (Optional[Context]): resolver context, where None represents
-              the built-in context which is not multi process safe.
+          resolver_context (Optional[Context]): resolver context, where None
+              represents the built-in context which is not multi process safe.
 
         Returns:
           list[str]: supported format type indicators.
         """
-        if cls._archive_remainder_list is None or cls._archive_store is None:
-            specification_store, remainder_list = cls._GetSpecificationStore(
-                definitions.FORMAT_CATEGORY_ARCHIVE
-            )
-            cls._archive_remainder_list = remainder_list
-            cls._archive_store = specification_store
-
-        if cls._archive_scanner is None:
-            cls._archive_scanner = cls._GetSignatureScanner(cls._archive_store)
-
-        return cls._GetTypeIndicators(
-            cls._archive_scanner,
-            cls._archive_store,
-            cls._archive_remainder_list,
-            path_spec,
-            resolver_context=resolver_context,
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=resolver_context
         )
+        return cls._GetTypeIndicators(file_object, definitions.FORMAT_CATEGORY_ARCHIVE)
 
     @classmethod
     def GetCompressedStreamTypeIndicators(cls, path_spec, resolver_context=None):
@@ -271,27 +284,11 @@ class Analyzer:
         Returns:
           list[str]: supported format type indicators.
         """
-        if (
-            cls._compressed_stream_remainder_list is None
-            or cls._compressed_stream_store is None
-        ):
-            specification_store, remainder_list = cls._GetSpecificationStore(
-                definitions.FORMAT_CATEGORY_COMPRESSED_STREAM
-            )
-            cls._compressed_stream_remainder_list = remainder_list
-            cls._compressed_stream_store = specification_store
-
-        if cls._compressed_stream_scanner is None:
-            cls._compressed_stream_scanner = cls._GetSignatureScanner(
-                cls._compressed_stream_store
-            )
-
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=resolver_context
+        )
         return cls._GetTypeIndicators(
-            cls._compressed_stream_scanner,
-            cls._compressed_stream_store,
-            cls._compressed_stream_remainder_list,
-            path_spec,
-            resolver_context=resolver_context,
+            file_object, definitions.FORMAT_CATEGORY_COMPRESSED_STREAM
         )
 
     @classmethod
@@ -306,22 +303,11 @@ class Analyzer:
         Returns:
           list[str]: supported format type indicators.
         """
-        if cls._file_system_remainder_list is None or cls._file_system_store is None:
-            specification_store, remainder_list = cls._GetSpecificationStore(
-                definitions.FORMAT_CATEGORY_FILE_SYSTEM
-            )
-            cls._file_system_remainder_list = remainder_list
-            cls._file_system_store = specification_store
-
-        if cls._file_system_scanner is None:
-            cls._file_system_scanner = cls._GetSignatureScanner(cls._file_system_store)
-
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=resolver_context
+        )
         return cls._GetTypeIndicators(
-            cls._file_system_scanner,
-            cls._file_system_store,
-            cls._file_system_remainder_list,
-            path_spec,
-            resolver_context=resolver_context,
+            file_object, definitions.FORMAT_CATEGORY_FILE_SYSTEM
         )
 
     @classmethod
@@ -336,28 +322,79 @@ class Analyzer:
         Returns:
           list[str]: supported format type indicators.
         """
-        if (
-            cls._storage_media_image_remainder_list is None
-            or cls._storage_media_image_store is None
-        ):
-            specification_store, remainder_list = cls._GetSpecificationStore(
-                definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=resolver_context
+        )
+        return cls._GetTypeIndicators(
+            file_object, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE
+        )
+
+    @classmethod
+    def GetTypeIndicatorsForCategories(
+        cls, path_spec, format_categories, probe_cache=None, resolver_context=None
+    ):
+        """Determines if a file contains supported format types of format categories.
+
+        The file is opened once and scanned with the signature scanner of every
+        format category. Note that the file is not scanned once for the signatures
+        of all the format categories, since the scan tree of such a signature
+        scanner does not report every matching signature. For example a GPT
+        signature at offset 512 is not reported when a FAT signature at offset
+        510 matches.
+
+        The source scanner passes a single format category, together with a probe
+        cache. The type indicators are only grouped by format category for
+        callers that pass multiple format categories.
+
+        Args:
+          path_spec (PathSpec): path specification.
+          format_categories (list[int]): format categories, such as file system
+              and volume system, as defined in definitions.FORMAT_CATEGORIES.
+          probe_cache (Optional[ProbeCache]): probe cache, where None represents
+              the file is read directly.
+          resolver_context (Optional[Context]): resolver context, where None
+              represents the built-in context which is not multi process safe.
+
+        Returns:
+          dict[int, list[str]]: supported format type indicators per format
+              category.
+
+        Raises:
+          ValueError: if a format category is not supported.
+        """
+        format_categories = frozenset(format_categories)
+
+        if not format_categories.issubset(definitions.FORMAT_CATEGORIES):
+            raise ValueError("Unsupported format categories.")
+
+        if probe_cache is None:
+            file_object = resolver.Resolver.OpenFileObject(
+                path_spec, resolver_context=resolver_context
+            )
+        else:
+            file_object = probe_cache.GetFileObject(
+                path_spec, resolver_context=resolver_context
             )
-            cls._storage_media_image_remainder_list = remainder_list
-            cls._storage_media_image_store = specification_store
 
-        if cls._storage_media_image_scanner is None:
-            cls._storage_media_image_scanner = cls._GetSignatureScanner(
-                cls._storage_media_image_store
+        type_indicators = {}
+        for format_category in sorted(format_categories):
+            if probe_cache is not None:
+                _, specification_store, _ = cls._GetCategoryScanner(format_category)
+
+                # Also cache signatures at known offsets outside the cached head
+                # and tail of the file.
+                for format_specification in specification_store.specifications:
+                    for signature in format_specification.signatures:
+                        if signature.offset is not None and signature.offset >= 0:
+                            file_object.CacheRange(
+                                signature.offset, len(signature.pattern)
+                            )
+
+            type_indicators[format_category] = cls._GetTypeIndicators(
+                file_object, format_category
             )
 
-        return cls._GetTypeIndicators(
-            cls._storage_media_image_scanner,
-            cls._storage_media_image_store,
-            cls._storage_media_image_remainder_list,
-            path_spec,
-            resolver_context=resolver_context,
-        )
+        return type_indicators
 
     @classmethod
     def GetVolumeSystemTypeIndicators(cls, path_spec, resolver_context=None):
@@ -371,37 +408,37 @@ class Analyzer:
         Returns:
           list[str]: supported format type indicators.
         """
-        if (
-            cls._volume_system_remainder_list is None
-            or cls._volume_system_store is None
-        ):
-            specification_store, remainder_list = cls._GetSpecificationStore(
-                definitions.FORMAT_CATEGORY_VOLUME_SYSTEM
-            )
-            cls._volume_system_remainder_list = remainder_list
-            cls._volume_system_store = specification_store
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=resolver_context
+        )
+        return cls._GetTypeIndicators(
+            file_object, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM
+        )
 
-        if cls._volume_system_scanner is None:
-            cls._volume_system_scanner = cls._GetSignatureScanner(
-                cls._volume_system_store
-            )
+    @classmethod
+    def PrebuildSignatureScanner(cls, format_categories):
+        """Prebuilds the signature scanner of format categories.
 
-        type_indicators = cls._GetTypeIndicators(
-            cls._volume_system_scanner,
-            cls._volume_system_store,
-            cls._volume_system_remainder_list,
-            path_spec,
-            resolver_context=resolver_context,
-        )
-        if (
-            len(type_indicators) > 1
-            and definitions.TYPE_INDICATOR_TSK_PARTITION in type_indicators
-        ):
-            # The TSK partition analyzer is used as a fallback, remove it if
-            # an alternative analyzer detected a supported volume system.
-            type_indicators.remove(definitions.TYPE_INDICATOR_TSK_PARTITION)
+        Building a signature scanner is expensive for a large number of
+        signatures. A process that prebuilds the signature scanner before it
+        starts worker processes, for example using fork, shares the signature
+        scanner with its worker processes instead of every worker process
+        building it again.
 
-        return type_indicators
+        Args:
+          format_categories (list[int]): format categories, such as file system
+              and volume system, as defined in definitions.FORMAT_CATEGORIES.
+
+        Raises:
+          ValueError: if a format category is not supported.
+        """
+        format_categories = frozenset(format_categories)
+
+        if not format_categories.issubset(definitions.FORMAT_CATEGORIES):
+            raise ValueError("Unsupported format categories.")
+
+        for format_category in format_categories:
+            cls._GetCategoryScanner(format_category)
 
     @classmethod
     def RegisterHelper(cls, analyzer_helper):
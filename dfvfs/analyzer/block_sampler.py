@@ -0,0 +1,284 @@
+"""Sampler that classifies a sparse set of blocks of a file-like object."""
+
+import collections
+import math
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from dfvfs.lib import definitions
+
+
+class BlockSample:
+    """Sampled block.
+
+    Attributes:
+      block_type (str): block type, as defined in definitions.BLOCK_TYPE_*.
+      entropy (float): Shannon entropy of the block in bits per byte.
+      offset (int): offset of the block.
+    """
+
+    def __init__(self, offset, block_type, entropy):
+        """Initializes a sampled block.
+
+        Args:
+          offset (int): offset of the block.
+          block_type (str): block type, as defined in definitions.BLOCK_TYPE_*.
+          entropy (float): Shannon entropy of the block in bits per byte.
+        """
+        super().__init__()
+        self.block_type = block_type
+        self.entropy = entropy
+        self.offset = offset
+
+
+class BlockMap:
+    """Map of the sampled blocks of a file-like object.
+
+    Attributes:
+      block_size (int): size of a sampled block.
+      samples (list[BlockSample]): sampled blocks, sorted by offset.
+      size (int): size of the file-like object.
+    """
+
+    def __init__(self, size, block_size, samples):
+        """Initializes a block map.
+
+        Args:
+          size (int): size of the file-like object.
+          block_size (int): size of a sampled block.
+          samples (list[BlockSample]): sampled blocks, sorted by offset.
+        """
+        super().__init__()
+        self.block_size = block_size
+        self.samples = samples
+        self.size = size
+
+    def GetRegions(self):
+        """Retrieves the regions of the file-like object by block type.
+
+        Every sampled block is representative for the data up to the next
+        sampled block. Consecutive sampled blocks of the same block type are
+        combined into a single region.
+
+        Yields:
+          tuple[int, int, str]: offset, size and block type of the region.
+        """
+        region_offset = 0
+        region_block_type = None
+
+        for sample in self.samples:
+            if region_block_type is None:
+                region_block_type = sample.block_type
+
+            elif sample.block_type != region_block_type:
+                yield region_offset, sample.offset - region_offset, region_block_type
+
+                region_offset = sample.offset
+                region_block_type = sample.block_type
+
+        if region_block_type is not None:
+            yield region_offset, self.size - region_offset, region_block_type
+
+
+class BlockSampler:
+    """Sampler that classifies a sparse set of blocks of a file-like object.
+
+    The sampled blocks are spread evenly over the file-like object and are
+    classified as:
+
+    * zero, if the block only contains 0-byte values;
+    * high entropy, if the block is likely encrypted or compressed;
+    * structured, otherwise.
+
+    The classification is computed with NumPy when available.
+    """
+
+    def __init__(
+        self, block_size=4096, entropy_threshold=7.5, maximum_number_of_samples=256
+    ):
+        """Initializes a block sampler.
+
+        Args:
+          block_size (Optional[int]): size of a sampled block.
+          entropy_threshold (Optional[float]): Shannon entropy, in bits per byte,
+              from which a block is considered high entropy.
+          maximum_number_of_samples (Optional[int]): maximum number of blocks to
+              sample.
+
+        Raises:
+          ValueError: if the block size, entropy threshold or maximum number of
+              samples is invalid.
+        """
+        if block_size < 1:
+            raise ValueError("Invalid block size value.")
+
+        if entropy_threshold < 0.0 or entropy_threshold > 8.0:
+            raise ValueError("Invalid entropy threshold value.")
+
+        if maximum_number_of_samples < 1:
+            raise ValueError("Invalid maximum number of samples value.")
+
+        super().__init__()
+        self._block_size = block_size
+        self._entropy_threshold = entropy_threshold
+        self._maximum_number_of_samples = maximum_number_of_samples
+
+    def _ClassifyBlocks(self, blocks):
+        """Classifies blocks.
+
+        Args:
+          blocks (list[bytes]): data of the blocks, which are all the same size.
+
+        Returns:
+          list[tuple[str, float]]: block type and Shannon entropy of every block.
+        """
+        if numpy is not None:
+            return self._ClassifyBlocksWithNumPy(blocks)
+
+        results = []
+        for block_data in blocks:
+            block_size = len(block_data)
+
+            entropy = 0.0
+            for count in collections.Counter(block_data).values():
+                probability = count / block_size
+                entropy -= probability * math.log2(probability)
+
+            results.append((self._GetBlockType(block_data, entropy), entropy))
+
+        return results
+
+    def _ClassifyBlocksWithNumPy(self, blocks):
+        """Classifies blocks with NumPy.
+
+        Args:
+          blocks (list[bytes]): data of the blocks, which are all the same size.
+
+        Returns:
+          list[tuple[str, float]]: block type and Shannon entropy of every block.
+        """
+        number_of_blocks = len(blocks)
+        block_size = len(blocks[0])
+
+        data = numpy.frombuffer(b"".join(blocks), dtype=numpy.uint8)
+        data = data.reshape(number_of_blocks, block_size)
+
+        is_zero = ~data.any(axis=1)
+
+        # Count the byte values of all blocks at once, by giving every block its
+        # own range of 256 values.
+        block_offsets = numpy.arange(number_of_blocks, dtype=numpy.int64) * 256
+        counts = numpy.bincount(
+            (data + block_offsets[:, numpy.newaxis]).ravel(),
+            minlength=number_of_blocks * 256,
+        )
+        probabilities = counts.reshape(number_of_blocks, 256) / block_size
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            entropies = -numpy.nansum(probabilities * numpy.log2(probabilities), axis=1)
+
+        results = []
+        for block_is_zero, entropy in zip(is_zero.tolist(), entropies.tolist()):
+            if block_is_zero:
+                block_type = definitions.BLOCK_TYPE_ZERO
+            elif entropy >= self._entropy_threshold:
+                block_type = definitions.BLOCK_TYPE_HIGH_ENTROPY
+            else:
+                block_type = definitions.BLOCK_TYPE_STRUCTURED
+
+            # Note that abs() is used to prevent an entropy of -0.0.
+            results.append((block_type, abs(entropy)))
+
+        return results
+
+    def _GetBlockOffsets(self, size):
+        """Retrieves the offsets of the blocks to sample.
+
+        Args:
+          size (int): size of the file-like object.
+
+        Returns:
+          list[int]: offsets of the blocks to sample, which are aligned to
+              the block size.
+        """
+        number_of_blocks = size // self._block_size
+        if number_of_blocks <= 1 or self._maximum_number_of_samples == 1:
+            return [0]
+
+        if number_of_blocks <= self._maximum_number_of_samples:
+            block_numbers = range(number_of_blocks)
+        else:
+            # Include the first and last block.
+            last_block_number = number_of_blocks - 1
+            block_numbers = sorted(
+                {
+                    (last_block_number * sample_index)
+                    // (self._maximum_number_of_samples - 1)
+                    for sample_index in range(self._maximum_number_of_samples)
+                }
+            )
+
+        return [block_number * self._block_size for block_number in block_numbers]
+
+    def _GetBlockType(self, block_data, entropy):
+        """Determines the block type.
+
+        Args:
+          block_data (bytes): data of the block.
+          entropy (float): Shannon entropy of the block in bits per byte.
+
+        Returns:
+          str: block type, as defined in definitions.BLOCK_TYPE_*.
+        """
+        if block_data.count(0) == len(block_data):
+            return definitions.BLOCK_TYPE_ZERO
+
+        if entropy >= self._entropy_threshold:
+            return definitions.BLOCK_TYPE_HIGH_ENTROPY
+
+        return definitions.BLOCK_TYPE_STRUCTURED
+
+    def SampleFileObject(self, file_object):
+        """Samples blocks of a file-like object.
+
+        Args:
+          file_object (FileIO): file-like object.
+
+        Returns:
+          BlockMap: map of the sampled blocks or None if the file-like object
+              is empty.
+
+        Raises:
+          OSError: if the file-like object cannot be read.
+        """
+        size = file_object.get_size()
+        if not size:
+            return None
+
+        block_offsets = self._GetBlockOffsets(size)
+        block_size = min(size, self._block_size)
+
+        blocks = []
+        for block_offset in block_offsets:
+            file_object.seek(block_offset, os.SEEK_SET)
+            block_data = file_object.read(block_size)
+            if len(block_data) != block_size:
+                raise OSError(
+                    f"Unable to read block at offset: {block_offset:d} (0x"
+                    f"{block_offset:08x})."
+                )
+
+            blocks.append(block_data)
+
+        samples = [
+            BlockSample(block_offset, block_type, entropy)
+            for block_offset, (block_type, entropy) in zip(
+                block_offsets, self._ClassifyBlocks(blocks)
+            )
+        ]
+
+        return BlockMap(size, block_size, samples)
@@ -0,0 +1,238 @@
+"""Cache of the data of file-like objects that is probed by format analysis."""
+
+import os
+
+from dfvfs.resolver import resolver
+
+
+class ProbeFileObject:
+    """File-like object that serves probed data from a cache.
+
+    Format analysis, such as signature scanning, mainly reads the start and end
+    of a file-like object, possibly multiple times. These ranges are read once
+    from the underlying file-like object and cached. Reads of data that is not
+    cached are passed through to the underlying file-like object.
+    """
+
+    def __init__(self, file_object, head_size=64 * 1024, tail_size=64 * 1024):
+        """Initializes a probe file-like object.
+
+        Args:
+          file_object (FileIO): file-like object.
+          head_size (Optional[int]): size of the data at the start of the file-like
+              object to cache.
+          tail_size (Optional[int]): size of the data at the end of the file-like
+              object to cache.
+
+        Raises:
+          ValueError: if the head or tail size is invalid.
+        """
+        if head_size < 0:
+            raise ValueError("Invalid head size value.")
+
+        if tail_size < 0:
+            raise ValueError("Invalid tail size value.")
+
+        super().__init__()
+        self._cached_ranges = []
+        self._current_offset = 0
+        self._file_object = file_object
+        self._size = file_object.get_size()
+
+        self.CacheRange(0, head_size)
+        self.CacheRange(self._size - tail_size, tail_size)
+
+    def _GetCachedData(self, offset, size):
+        """Retrieves cached data.
+
+        Args:
+          offset (int): offset of the data.
+          size (int): size of the data.
+
+        Returns:
+          bytes: data or None if the data is not (entirely) cached.
+        """
+        for range_offset, range_data in self._cached_ranges:
+            range_end_offset = range_offset + len(range_data)
+            if range_offset <= offset and offset + size <= range_end_offset:
+                relative_offset = offset - range_offset
+                return range_data[relative_offset : relative_offset + size]
+
+        return None
+
+    def CacheRange(self, offset, size):
+        """Caches a range of data.
+
+        Args:
+          offset (int): offset of the range, which is relative from the start of
+              the file-like object.
+          size (int): size of the range.
+        """
+        offset = max(offset, 0)
+        size = min(size, self._size - offset)
+        if size <= 0 or self._GetCachedData(offset, size) is not None:
+            return
+
+        self._file_object.seek(offset, os.SEEK_SET)
+        range_data = self._file_object.read(size)
+
+        self._cached_ranges.append((offset, range_data))
+
+    # Note: that the following functions do not follow the style guide
+    # because they are part of the file-like object interface.
+    # pylint: disable=invalid-name
+
+    def close(self):
+        """Closes the file-like object.
+
+        The underlying file-like object is not closed, since it is owned by
+        the resolver context.
+        """
+        return
+
+    def get_offset(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+        """
+        return self._current_offset
+
+    def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the file-like object data.
+        """
+        return self._size
+
+    def read(self, size=None):
+        """Reads a byte string from the file-like object at the current offset.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where None is all
+              remaining data.
+
+        Returns:
+          bytes: data read.
+
+        Raises:
+          OSError: if the read failed.
+        """
+        if self._current_offset >= self._size:
+            return b""
+
+        remaining_size = self._size - self._current_offset
+        if size is None or size > remaining_size:
+            size = remaining_size
+
+        if size <= 0:
+            return b""
+
+        data = self._GetCachedData(self._current_offset, size)
+        if data is None:
+            self._file_object.seek(self._current_offset, os.SEEK_SET)
+            data = self._file_object.read(size)
+
+        self._current_offset += len(data)
+
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Seeks to an offset within the file-like object.
+
+        Args:
+          offset (int): offset to seek to.
+          whence (Optional(int)): value that indicates whether offset is an absolute
+              or relative position within the file.
+
+        Raises:
+          OSError: if the seek failed.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._current_offset
+        elif whence == os.SEEK_END:
+            offset += self._size
+        elif whence != os.SEEK_SET:
+            raise OSError("Unsupported whence.")
+
+        if offset < 0:
+            raise OSError("Invalid offset value less than zero.")
+
+        self._current_offset = offset
+
+    def tell(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+        """
+        return self._current_offset
+
+
+class ProbeCache:
+    """Cache of the data of file-like objects that is probed by format analysis.
+
+    Scanning a source for supported formats probes the same data of a path
+    specification multiple times, for example for different format categories.
+    The cache is intended to be used for the duration of a single scan.
+    """
+
+    def __init__(self, head_size=64 * 1024, tail_size=64 * 1024):
+        """Initializes a probe cache.
+
+        Args:
+          head_size (Optional[int]): size of the data at the start of a file-like
+              object to cache.
+          tail_size (Optional[int]): size of the data at the end of a file-like
+              object to cache.
+
+        Raises:
+          ValueError: if the head or tail size is invalid.
+        """
+        if head_size < 0:
+            raise ValueError("Invalid head size value.")
+
+        if tail_size < 0:
+            raise ValueError("Invalid tail size value.")
+
+        super().__init__()
+        self._file_objects = {}
+        self._head_size = head_size
+        self._tail_size = tail_size
+
+    def Empty(self):
+        """Empties the cache."""
+        self._file_objects = {}
+
+    def GetFileObject(self, path_spec, resolver_context=None):
+        """Retrieves a probe file-like object.
+
+        Args:
+          path_spec (PathSpec): path specification.
+          resolver_context (Optional[Context]): resolver context, where None
+              represents the built-in context which is not multi process safe.
+
+        Returns:
+          ProbeFileObject: probe file-like object, of which the current offset
+              is 0.
+
+        Raises:
+          BackEndError: if the file-like object could not be opened.
+          OSError: if the data could not be read.
+        """
+        lookup_key = path_spec.comparable
+
+        file_object = self._file_objects.get(lookup_key, None)
+        if file_object is None:
+            file_object = resolver.Resolver.OpenFileObject(
+                path_spec, resolver_context=resolver_context
+            )
+            file_object = ProbeFileObject(
+                file_object, head_size=self._head_size, tail_size=self._tail_size
+            )
+            self._file_objects[lookup_key] = file_object
+
+        file_object.seek(0, os.SEEK_SET)
+
+        return file_object
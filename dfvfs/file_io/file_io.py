@@ -3,11 +3,13 @@
 import abc
 import os
 
+from dfvfs.lib import definitions
+
 
 class FileIO:
     """VFS file input/output (IO) object interface."""
 
-    # pylint: disable=redundant-returns-doc
+    # pylint: disable=redundant-returns-doc,unused-argument
 
     def __init__(self, resolver_context, path_spec):
         """Initializes a file input/output (IO) object.
@@ -37,6 +39,26 @@ class FileIO:
           OSError: if the close failed.
         """
 
+    def _GetParentFileObjects(self):
+        """Retrieves the parent file input/output (IO) objects.
+
+        Only parent file input/output (IO) objects that are cached by the resolver
+        context are retrieved, since a parent that is no longer used does not
+        need to be opened.
+
+        Returns:
+          list[FileIO]: parent file input/output (IO) objects.
+        """
+        parent_path_spec = getattr(self._path_spec, "parent", None)
+        if not parent_path_spec:
+            return []
+
+        file_object = self._resolver_context.GetFileObject(parent_path_spec)
+        if not file_object:
+            return []
+
+        return [file_object]
+
     @abc.abstractmethod
     def _Open(self):
         """Opens the file input/output (IO) object defined by path specification.
@@ -48,6 +70,15 @@ class FileIO:
           ValueError: if the path specification is invalid.
         """
 
+    def _SetAccessPattern(self, access_pattern):
+        """Sets the expected access pattern of the file data.
+
+        Args:
+          access_pattern (str): access pattern, such as
+              definitions.ACCESS_PATTERN_SEQUENTIAL.
+        """
+        return
+
     # Note that path_spec is kept as the second argument for backwards
     # compatibility.
     def Open(self, path_spec=None, mode="rb"):
@@ -79,6 +110,32 @@ class FileIO:
         self._Open()
         self._is_open = True
 
+    def SetAccessPattern(self, access_pattern):
+        """Sets the expected access pattern of the file data.
+
+        The access pattern is a hint to the operating system, for example to read
+        ahead for sequential access or not to cache data that is read once, and
+        is propagated to the parent file input/output (IO) objects.
+
+        Args:
+          access_pattern (str): access pattern, such as
+              definitions.ACCESS_PATTERN_SEQUENTIAL.
+
+        Raises:
+          OSError: if the file input/output (IO) object has not been opened.
+          ValueError: if the access pattern is unsupported.
+        """
+        if not self._is_open:
+            raise OSError("Not opened.")
+
+        if access_pattern not in definitions.ACCESS_PATTERNS:
+            raise ValueError(f"Unsupported access pattern: {access_pattern!s}")
+
+        self._SetAccessPattern(access_pattern)
+
+        for file_object in self._GetParentFileObjects():
+            file_object.SetAccessPattern(access_pattern)
+
     # Note: that the following functions do not follow the style guide
     # because they are part of the file-like object interface.
     # pylint: disable=invalid-name
@@ -1,7 +1,9 @@
 """The operating system file-like object implementation."""
 
+import mmap
 import stat
 import os
+import sys
 
 import pysmdev
 
@@ -13,6 +15,24 @@ from dfvfs.lib import errors
 class OSFile(file_io.FileIO):
     """File input/output (IO) object that uses the operating system."""
 
+    # The names of the madvise options per access pattern.
+    _MADVISE_OPTIONS = {
+        definitions.ACCESS_PATTERN_DONTNEED: "MADV_DONTNEED",
+        definitions.ACCESS_PATTERN_NORMAL: "MADV_NORMAL",
+        definitions.ACCESS_PATTERN_RANDOM: "MADV_RANDOM",
+        definitions.ACCESS_PATTERN_SEQUENTIAL: "MADV_SEQUENTIAL",
+        definitions.ACCESS_PATTERN_WILLNEED: "MADV_WILLNEED",
+    }
+
+    # The names of the posix_fadvise options per access pattern.
+    _POSIX_FADVISE_OPTIONS = {
+        definitions.ACCESS_PATTERN_DONTNEED: "POSIX_FADV_DONTNEED",
+        definitions.ACCESS_PATTERN_NORMAL: "POSIX_FADV_NORMAL",
+        definitions.ACCESS_PATTERN_RANDOM: "POSIX_FADV_RANDOM",
+        definitions.ACCESS_PATTERN_SEQUENTIAL: "POSIX_FADV_SEQUENTIAL",
+        definitions.ACCESS_PATTERN_WILLNEED: "POSIX_FADV_WILLNEED",
+    }
+
     def __init__(self, resolver_context, path_spec):
         """Initializes a file input/output (IO) object.
 
@@ -21,14 +41,53 @@ class OSFile(file_io.FileIO):
           path_spec (PathSpec): a path specification.
         """
         super().__init__(resolver_context, path_spec)
+        self._current_offset = 0
         self._file_object = None
+        self._is_device = False
+        self._memory_map = None
         self._size = 0
+        self._use_memory_map = False
 
     def _Close(self):
         """Closes the file-like object."""
+        if self._memory_map:
+            try:
+                self._memory_map.close()
+            except BufferError:
+                # The memory map is released when it is no longer referenced.
+                pass
+
+            self._memory_map = None
+
         self._file_object.close()
         self._file_object = None
 
+        self._current_offset = 0
+        self._use_memory_map = False
+
+    def _MapFile(self):
+        """Maps the file data into memory.
+
+        Devices, empty files and files that are larger than the address space,
+        such as on 32-bit systems, are not memory mapped.
+
+        Returns:
+          bool: True if the file data is memory mapped.
+        """
+        if (
+            self._memory_map is None
+            and not self._is_device
+            and 0 < self._size <= sys.maxsize
+        ):
+            try:
+                self._memory_map = mmap.mmap(
+                    self._file_object.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (OSError, OverflowError, ValueError):
+                pass
+
+        return self._memory_map is not None
+
     def _Open(self):
         """Opens the file-like object defined by path specification.
 
@@ -107,6 +166,7 @@ class OSFile(file_io.FileIO):
             smdev_handle.open(location, mode="r")
 
             self._file_object = smdev_handle
+            self._is_device = True
             self._size = smdev_handle.media_size
 
         else:
@@ -117,6 +177,73 @@ class OSFile(file_io.FileIO):
             )
             self._size = stat_info.st_size
 
+            if definitions.OS_FILE_USE_MEMORY_MAP:
+                self._use_memory_map = self._MapFile()
+
+    def _SetAccessPattern(self, access_pattern):
+        """Sets the expected access pattern of the file data.
+
+        The access pattern is passed to posix_fadvise and, if the file data is
+        memory mapped, to madvise, on platforms that support these. Devices are
+        opened with libsmdev, which does not expose a file descriptor, and
+        therefore do not support access patterns.
+
+        Args:
+          access_pattern (str): access pattern, such as
+              definitions.ACCESS_PATTERN_SEQUENTIAL.
+        """
+        if self._is_device:
+            return
+
+        option_name = self._POSIX_FADVISE_OPTIONS.get(access_pattern, None)
+        option = getattr(os, option_name, None)
+        if option is not None and hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(self._file_object.fileno(), 0, 0, option)
+            except OSError:
+                # The access pattern is only a hint and can be ignored.
+                pass
+
+        if self._memory_map is not None:
+            option_name = self._MADVISE_OPTIONS.get(access_pattern, None)
+            option = getattr(mmap, option_name, None)
+            if option is not None and hasattr(self._memory_map, "madvise"):
+                try:
+                    self._memory_map.madvise(option)
+                except OSError:
+                    pass
+
+    def GetMemoryMap(self):
+        """Retrieves a read-only memory map of the file data.
+
+        Returns:
+          mmap.mmap: memory map of the file data or None if the file cannot be
+              memory mapped, for example if it is a device or empty.
+
+        Raises:
+          OSError: if the file-like object has not been opened.
+        """
+        if not self._is_open:
+            raise OSError("Not opened.")
+
+        self._MapFile()
+
+        return self._memory_map
+
+    def IsMemoryMapped(self):
+        """Determines if the file data is read via a memory map.
+
+        Returns:
+          bool: True if the file data is read via a memory map.
+
+        Raises:
+          OSError: if the file-like object has not been opened.
+        """
+        if not self._is_open:
+            raise OSError("Not opened.")
+
+        return self._use_memory_map
+
     # Note: that the following functions do not follow the style guide
     # because they are part of the file-like object interface.
     # pylint: disable=invalid-name
@@ -140,6 +267,18 @@ class OSFile(file_io.FileIO):
         if not self._is_open:
             raise OSError("Not opened.")
 
+        if self._use_memory_map:
+            if self._current_offset >= self._size:
+                return b""
+
+            if size is None or size < 0:
+                size = self._size - self._current_offset
+
+            data = self._memory_map[self._current_offset : self._current_offset + size]
+            self._current_offset += len(data)
+
+            return data
+
         if size is None:
             size = self._size - self._file_object.tell()
 
@@ -165,7 +304,19 @@ class OSFile(file_io.FileIO):
         if whence not in (os.SEEK_CUR, os.SEEK_END, os.SEEK_SET):
             raise OSError("Unsupported whence.")
 
-        self._file_object.seek(offset, whence)
+        if not self._use_memory_map:
+            self._file_object.seek(offset, whence)
+            return
+
+        if whence == os.SEEK_CUR:
+            offset += self._current_offset
+        elif whence == os.SEEK_END:
+            offset += self._size
+
+        if offset < 0:
+            raise OSError("Invalid offset value less than zero.")
+
+        self._current_offset = offset
 
     def get_offset(self):
         """Retrieves the current offset into the file-like object.
@@ -179,6 +330,9 @@ class OSFile(file_io.FileIO):
         if not self._is_open:
             raise OSError("Not opened.")
 
+        if self._use_memory_map:
+            return self._current_offset
+
         return self._file_object.tell()
 
     def get_size(self):
@@ -5,6 +5,7 @@ import pysmraw
 from dfvfs.file_io import file_object_io
 from dfvfs.lib import errors
 from dfvfs.lib import raw_helper
+from dfvfs.lib import segment_helper
 from dfvfs.resolver import resolver
 
 
@@ -20,6 +21,7 @@ class RawFile(file_object_io.FileObjectIO):
         """
         super().__init__(resolver_context, path_spec)
         self._file_objects = []
+        self._segment_file_object_pool = None
 
     def _Close(self):
         """Closes the file-like object."""
@@ -27,6 +29,21 @@ class RawFile(file_object_io.FileObjectIO):
         super()._Close()
         self._file_objects = []
 
+        if self._segment_file_object_pool:
+            self._segment_file_object_pool.Empty()
+            self._segment_file_object_pool = None
+
+    def _GetParentFileObjects(self):
+        """Retrieves the parent file input/output (IO) objects.
+
+        Returns:
+          list[FileIO]: parent file input/output (IO) objects.
+        """
+        if self._segment_file_object_pool:
+            return self._segment_file_object_pool.GetOpenFileObjects()
+
+        return super()._GetParentFileObjects()
+
     def _OpenFileObject(self, path_spec):
         """Opens the file-like object defined by path specification.
 
@@ -63,9 +80,14 @@ class RawFile(file_object_io.FileObjectIO):
             if not segment_file_path_specs:
                 return None
 
+            # The segment files are opened on demand, to limit the number of
+            # segment files that are open at the same time.
+            self._segment_file_object_pool = segment_helper.SegmentFileObjectPool(
+                self._resolver_context
+            )
             for segment_file_path_spec in segment_file_path_specs:
-                file_object = resolver.Resolver.OpenFileObject(
-                    segment_file_path_spec, resolver_context=self._resolver_context
+                file_object = self._segment_file_object_pool.GetFileObject(
+                    segment_file_path_spec
                 )
                 self._file_objects.append(file_object)
 
@@ -1,5 +1,6 @@
 """The SleuthKit (TSK) file-like object implementation."""
 
+import bisect
 import os
 
 import pytsk3
@@ -12,6 +13,23 @@ from dfvfs.resolver import resolver
 class TSKFile(file_io.FileIO):
     """File input/output (IO) object using pytsk3."""
 
+    # Data attribute types of the default (nameless) data stream.
+    _DEFAULT_DATA_ATTRIBUTE_TYPES = [
+        pytsk3.TSK_FS_ATTR_TYPE_DEFAULT,
+        pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA,
+        pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA,
+    ]
+
+    # Attribute flags that prevent the data to be read directly from the extents.
+    _UNSUPPORTED_EXTENT_MAP_ATTRIBUTE_FLAGS = (
+        pytsk3.TSK_FS_ATTR_COMP | pytsk3.TSK_FS_ATTR_ENC
+    )
+
+    # Run flags that prevent the data to be read directly from the extents.
+    _UNSUPPORTED_EXTENT_MAP_RUN_FLAGS = (
+        pytsk3.TSK_FS_ATTR_RUN_FLAG_ENCRYPTED | pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER
+    )
+
     def __init__(self, resolver_context, path_spec):
         """Initializes a file input/output (IO) object.
 
@@ -21,6 +39,8 @@ class TSKFile(file_io.FileIO):
         """
         super().__init__(resolver_context, path_spec)
         self._current_offset = 0
+        self._extent_map = None
+        self._extent_map_offsets = None
         self._file_system = None
         self._size = 0
         self._tsk_attribute = None
@@ -31,8 +51,88 @@ class TSKFile(file_io.FileIO):
         self._tsk_attribute = None
         self._tsk_file = None
 
+        self._extent_map = None
+        self._extent_map_offsets = None
         self._file_system = None
 
+    def _GetExtentMap(self, file_system, tsk_file, tsk_attribute, data_size):
+        """Retrieves an extent map of a non-resident data attribute.
+
+        The extent map allows the data to be read directly from the file system
+        image instead of through pytsk3.
+
+        Args:
+          file_system (TSKFileSystem): file system.
+          tsk_file (pytsk3.File): TSK file.
+          tsk_attribute (pytsk3.Attribute): TSK attribute of the data stream or
+              None for the default data stream.
+          data_size (int): size of the data stream.
+
+        Returns:
+          list[tuple[int, int, int]]: data stream offset, size and file system
+              image offset of the extents, where the file system image offset is
+              None for sparse extents, or None if the data stream cannot be read
+              directly from the extents.
+        """
+        # pytsk3 does not expose the initialized data size of a NTFS data stream,
+        # beyond which data should be read as zero bytes.
+        if file_system.IsNTFS():
+            return None
+
+        if not tsk_attribute:
+            for pytsk_attribute in tsk_file:
+                attribute_info = getattr(pytsk_attribute, "info", None)
+                if not attribute_info or getattr(attribute_info, "name", None):
+                    continue
+
+                attribute_type = getattr(attribute_info, "type", None)
+                if attribute_type in self._DEFAULT_DATA_ATTRIBUTE_TYPES:
+                    tsk_attribute = pytsk_attribute
+                    break
+
+        if not tsk_attribute or tsk_attribute.info.size != data_size:
+            return None
+
+        attribute_flags = int(getattr(tsk_attribute.info, "flags", 0))
+        if (
+            not attribute_flags & pytsk3.TSK_FS_ATTR_NONRES
+            or attribute_flags & self._UNSUPPORTED_EXTENT_MAP_ATTRIBUTE_FLAGS
+        ):
+            return None
+
+        tsk_fs_info = file_system.GetFsInfo()
+        block_size = getattr(tsk_fs_info.info, "block_size", None)
+        if not block_size:
+            return None
+
+        extent_map = []
+        data_offset = 0
+        for tsk_attr_run in tsk_attribute:
+            if data_offset >= data_size:
+                break
+
+            run_flags = int(tsk_attr_run.flags)
+            if (
+                run_flags & self._UNSUPPORTED_EXTENT_MAP_RUN_FLAGS
+                or tsk_attr_run.offset * block_size != data_offset
+            ):
+                return None
+
+            extent_size = min(tsk_attr_run.len * block_size, data_size - data_offset)
+
+            if run_flags & pytsk3.TSK_FS_ATTR_RUN_FLAG_SPARSE:
+                image_offset = None
+            else:
+                image_offset = tsk_attr_run.addr * block_size
+
+            extent_map.append((data_offset, extent_size, image_offset))
+            data_offset += extent_size
+
+        if data_offset < data_size:
+            return None
+
+        return extent_map
+
     def _Open(self):
         """Opens the file-like object defined by path specification.
 
@@ -141,6 +241,54 @@ class TSKFile(file_io.FileIO):
         else:
             self._size = self._tsk_file.info.meta.size
 
+        self._extent_map = self._GetExtentMap(
+            file_system, tsk_file, tsk_attribute, self._size
+        )
+        if self._extent_map is not None:
+            self._extent_map_offsets = [
+                data_offset for data_offset, _, _ in self._extent_map
+            ]
+
+    def _ReadFromExtentMap(self, size):
+        """Reads a byte string directly from the extents of the data stream.
+
+        Args:
+          size (int): number of bytes to read.
+
+        Returns:
+          bytes: data read.
+        """
+        file_object = self._file_system.GetImageFileObject()
+
+        extent_index = (
+            bisect.bisect_right(self._extent_map_offsets, self._current_offset) - 1
+        )
+        current_offset = self._current_offset
+
+        data_segments = []
+        while size > 0 and extent_index < len(self._extent_map):
+            data_offset, extent_size, image_offset = self._extent_map[extent_index]
+
+            relative_offset = current_offset - data_offset
+            read_size = min(size, extent_size - relative_offset)
+
+            if image_offset is None:
+                data_segment = bytes(read_size)
+            else:
+                file_object.seek(image_offset + relative_offset, os.SEEK_SET)
+                data_segment = file_object.read(read_size)
+
+            data_segments.append(data_segment)
+            current_offset += len(data_segment)
+            size -= len(data_segment)
+
+            if len(data_segment) < read_size:
+                break
+
+            extent_index += 1
+
+        return b"".join(data_segments)
+
     # Note: that the following functions do not follow the style guide
     # because they are part of the file-like object interface.
     # pylint: disable=invalid-name
@@ -175,7 +323,10 @@ class TSKFile(file_io.FileIO):
         if size is None or self._current_offset + size > self._size:
             size = self._size - self._current_offset
 
-        if self._tsk_attribute:
+        if self._extent_map is not None:
+            data = self._ReadFromExtentMap(size)
+
+        elif self._tsk_attribute:
             data = self._tsk_file.read_random(
                 self._current_offset,
                 size,
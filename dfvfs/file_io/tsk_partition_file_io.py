@@ -38,7 +38,7 @@ class TSKPartitionFile(data_range_io.DataRange):
             self._path_spec, resolver_context=self._resolver_context
         )
         tsk_volume = self._file_system.GetTSKVolume()
-        tsk_vs, _ = tsk_partition.GetTSKVsPartByPathSpec(tsk_volume, self._path_spec)
+        tsk_vs, _ = self._file_system.GetTSKVsPartByPathSpec(self._path_spec)
 
         if tsk_vs is None:
             raise errors.PathSpecError(
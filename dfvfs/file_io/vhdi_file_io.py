@@ -32,6 +32,19 @@ class VHDIFile(file_object_io.FileObjectIO):
         self._parent_vhdi_files = []
         self._sub_file_objects = []
 
+    def _GetParentFileObjects(self):
+        """Retrieves the parent file input/output (IO) objects.
+
+        Returns:
+          list[FileIO]: parent file input/output (IO) objects.
+        """
+        parent_file_objects = super()._GetParentFileObjects()
+        for file_object in self._sub_file_objects:
+            if file_object not in parent_file_objects:
+                parent_file_objects.append(file_object)
+
+        return parent_file_objects
+
     def _OpenFileObject(self, path_spec):
         """Opens the file-like object defined by path specification.
 
@@ -0,0 +1,600 @@
+"""Helper to use dfVFS from asyncio code."""
+
+import asyncio
+import concurrent.futures
+import functools
+import itertools
+import os
+
+from dfvfs.helpers import file_system_searcher
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+class _AsyncWorker:
+    """Worker thread with its own resolver context.
+
+    The dfVFS objects that are opened with the resolver context of a worker are
+    only accessed on the thread of the worker, since resolver contexts and the
+    objects they cache are not thread safe.
+
+    Attributes:
+      resolver_context (Context): resolver context of the worker.
+    """
+
+    def __init__(self, batch_size, semaphore):
+        """Initializes a worker.
+
+        Args:
+          batch_size (int): maximum number of items that are retrieved from an
+              iterator on the worker thread at once.
+          semaphore (asyncio.Semaphore): semaphore that limits the number of
+              pending calls of all workers.
+        """
+        super().__init__()
+        self._batch_size = batch_size
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dfvfs_async_worker"
+        )
+        self._semaphore = semaphore
+        self.resolver_context = context.Context()
+
+    def _GetNextItems(self, iterator):
+        """Retrieves the next items of an iterator.
+
+        Args:
+          iterator (iterator): iterator.
+
+        Returns:
+          list[object]: next items, which is empty if the iterator is exhausted.
+        """
+        return list(itertools.islice(iterator, self._batch_size))
+
+    async def Call(self, function, *args, **kwargs):
+        """Calls a function on the worker thread.
+
+        Args:
+          function (function): function to call.
+          args (list[object]): positional arguments of the function.
+          kwargs (dict[str, object]): keyword arguments of the function.
+
+        Returns:
+          object: value returned by the function.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(function, *args, **kwargs)
+            )
+
+    async def Close(self):
+        """Closes the worker."""
+        await self.Call(self.resolver_context.Empty)
+        self._executor.shutdown(wait=False)
+
+    async def Iterate(self, function, *args):
+        """Iterates the items of an iterator on the worker thread.
+
+        The items are retrieved in batches, where the next batch is only
+        retrieved when all items of the previous batch have been consumed.
+
+        Args:
+          function (function): function that returns the iterator, which is
+              called on the worker thread.
+          args (list[object]): positional arguments of the function.
+
+        Yields:
+          object: item of the iterator.
+        """
+        iterator = await self.Call(function, *args)
+        try:
+            while True:
+                items = await self.Call(self._GetNextItems, iterator)
+                if not items:
+                    break
+
+                for item in items:
+                    yield item
+
+        finally:
+            close_function = getattr(iterator, "close", None)
+            if close_function:
+                await self.Call(close_function)
+
+
+class AsyncFileIO:
+    """Asynchronous file input/output (IO) object."""
+
+    def __init__(self, worker, file_object):
+        """Initializes an asynchronous file input/output (IO) object.
+
+        Args:
+          worker (_AsyncWorker): worker that opened the file-like object.
+          file_object (FileIO): file-like object.
+        """
+        super().__init__()
+        self._file_object = file_object
+        self._worker = worker
+
+    # Note: that the following functions do not follow the style guide
+    # because they are part of the file-like object interface.
+    # pylint: disable=invalid-name
+
+    async def close(self):
+        """Closes the file-like object."""
+        self._file_object = None
+
+    async def get_offset(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+
+        Raises:
+          OSError: if the file-like object has been closed.
+        """
+        if not self._file_object:
+            raise OSError("Not opened.")
+
+        return await self._worker.Call(self._file_object.get_offset)
+
+    async def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the file-like object data.
+
+        Raises:
+          OSError: if the file-like object has been closed.
+        """
+        if not self._file_object:
+            raise OSError("Not opened.")
+
+        return await self._worker.Call(self._file_object.get_size)
+
+    async def read(self, size=None):
+        """Reads a byte string from the file-like object at the current offset.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where None is all
+              remaining data.
+
+        Returns:
+          bytes: data read.
+
+        Raises:
+          OSError: if the file-like object has been closed or the read failed.
+        """
+        if not self._file_object:
+            raise OSError("Not opened.")
+
+        return await self._worker.Call(self._file_object.read, size)
+
+    async def seek(self, offset, whence=os.SEEK_SET):
+        """Seeks to an offset within the file-like object.
+
+        Args:
+          offset (int): offset to seek to.
+          whence (Optional(int)): value that indicates whether offset is an absolute
+              or relative position within the file.
+
+        Raises:
+          OSError: if the file-like object has been closed or the seek failed.
+        """
+        if not self._file_object:
+            raise OSError("Not opened.")
+
+        await self._worker.Call(self._file_object.seek, offset, whence)
+
+
+class AsyncFileEntry:
+    """Asynchronous file entry.
+
+    Attributes:
+      entry_type (str): file entry type, such as "directory", or None if not
+          available.
+      name (str): name of the file entry, without the full path.
+      path_spec (PathSpec): path specification.
+    """
+
+    def __init__(self, worker, file_entry):
+        """Initializes an asynchronous file entry.
+
+        Note that the asynchronous file entry must be initialized on the worker
+        thread, since retrieving the name can require access to the back-end.
+
+        Args:
+          worker (_AsyncWorker): worker that opened the file entry.
+          file_entry (FileEntry): file entry.
+        """
+        super().__init__()
+        self._file_entry = file_entry
+        self._worker = worker
+        self.entry_type = file_entry.entry_type
+        self.name = file_entry.name
+        self.path_spec = file_entry.path_spec
+
+    def _GetFileObject(self, data_stream_name):
+        """Retrieves a file-like object on the worker thread.
+
+        Args:
+          data_stream_name (str): name of the data stream, where an empty string
+              represents the default data stream.
+
+        Returns:
+          AsyncFileIO: file-like object or None if not available.
+        """
+        file_object = self._file_entry.GetFileObject(data_stream_name=data_stream_name)
+        if not file_object:
+            return None
+
+        return AsyncFileIO(self._worker, file_object)
+
+    def _GetSubFileEntries(self):
+        """Retrieves the sub file entries on the worker thread.
+
+        Yields:
+          AsyncFileEntry: sub file entry.
+        """
+        for sub_file_entry in self._file_entry.sub_file_entries:
+            yield AsyncFileEntry(self._worker, sub_file_entry)
+
+    async def Call(self, function, *args):
+        """Calls a function with the file entry on the worker thread.
+
+        This can be used to access the file entry functionality that does not
+        have an asynchronous equivalent.
+
+        Args:
+          function (function): function to call, which is called with the file
+              entry as its first argument.
+          args (list[object]): additional positional arguments of the function.
+
+        Returns:
+          object: value returned by the function.
+        """
+        return await self._worker.Call(function, self._file_entry, *args)
+
+    async def GetFileObject(self, data_stream_name=""):
+        """Retrieves a file-like object of a data stream.
+
+        Args:
+          data_stream_name (Optional[str]): name of the data stream, where an
+              empty string represents the default data stream.
+
+        Returns:
+          AsyncFileIO: file-like object or None if not available.
+        """
+        return await self._worker.Call(self._GetFileObject, data_stream_name)
+
+    async def GetStatAttribute(self):
+        """Retrieves a stat attribute.
+
+        Returns:
+          StatAttribute: a stat attribute or None if not available.
+        """
+        return await self._worker.Call(self._file_entry.GetStatAttribute)
+
+    async def GetSubFileEntries(self):
+        """Retrieves the sub file entries.
+
+        Yields:
+          AsyncFileEntry: sub file entry.
+        """
+        async for sub_file_entry in self._worker.Iterate(self._GetSubFileEntries):
+            yield sub_file_entry
+
+
+class AsyncFileSystem:
+    """Asynchronous file system."""
+
+    def __init__(self, worker, file_system, path_spec):
+        """Initializes an asynchronous file system.
+
+        Args:
+          worker (_AsyncWorker): worker that opened the file system.
+          file_system (FileSystem): file system.
+          path_spec (PathSpec): path specification the file system was opened
+              with.
+        """
+        super().__init__()
+        self._file_system = file_system
+        self._path_spec = path_spec
+        self._worker = worker
+
+    def _Find(self, find_specs, mount_point):
+        """Searches for matching file entries on the worker thread.
+
+        Args:
+          find_specs (list[FindSpec]): find specifications, where None will
+              return all allocated file entries.
+          mount_point (PathSpec): mount point path specification that refers to
+              the base location of the file system.
+
+        Returns:
+          generator[PathSpec]: path specifications of the matching file entries.
+        """
+        searcher = file_system_searcher.FileSystemSearcher(
+            self._file_system, mount_point
+        )
+        return searcher.Find(find_specs=find_specs)
+
+    def _GetFileEntryByPathSpec(self, path_spec):
+        """Retrieves a file entry for a path specification on the worker thread.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileEntry: file entry or None if not available.
+        """
+        file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+        if not file_entry:
+            return None
+
+        return AsyncFileEntry(self._worker, file_entry)
+
+    def _GetRootFileEntry(self):
+        """Retrieves the root file entry on the worker thread.
+
+        Returns:
+          AsyncFileEntry: file entry or None if not available.
+        """
+        file_entry = self._file_system.GetRootFileEntry()
+        if not file_entry:
+            return None
+
+        return AsyncFileEntry(self._worker, file_entry)
+
+    async def FileEntryExistsByPathSpec(self, path_spec):
+        """Determines if a file entry for a path specification exists.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          bool: True if the file entry exists.
+        """
+        return await self._worker.Call(
+            self._file_system.FileEntryExistsByPathSpec, path_spec
+        )
+
+    async def Find(self, find_specs=None, mount_point=None):
+        """Searches for matching file entries within the file system.
+
+        Args:
+          find_specs (Optional[list[FindSpec]]): find specifications, where None
+              will return all allocated file entries.
+          mount_point (Optional[PathSpec]): mount point path specification that
+              refers to the base location of the file system, where None
+              represents the parent of the path specification the file system
+              was opened with, or the path specification itself if it has no
+              parent.
+
+        Yields:
+          PathSpec: path specification of a matching file entry.
+        """
+        if mount_point is None:
+            mount_point = self._path_spec.parent or self._path_spec
+
+        async for path_spec in self._worker.Iterate(
+            self._Find, find_specs, mount_point
+        ):
+            yield path_spec
+
+    async def GetFileEntryByPathSpec(self, path_spec):
+        """Retrieves a file entry for a path specification.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileEntry: file entry or None if not available.
+        """
+        return await self._worker.Call(self._GetFileEntryByPathSpec, path_spec)
+
+    async def GetRootFileEntry(self):
+        """Retrieves the root file entry.
+
+        Returns:
+          AsyncFileEntry: file entry or None if not available.
+        """
+        return await self._worker.Call(self._GetRootFileEntry)
+
+
+class AsyncResolver:
+    """Helper to use dfVFS from asyncio code.
+
+    The blocking back-end functionality, such as that of pytsk3 and the libyal
+    libraries, is run on a bounded pool of worker threads, so that it does not
+    block the event loop. Each worker thread uses its own resolver context,
+    since resolver contexts are not thread safe, and an object that is opened
+    by a worker is only accessed on the thread of that worker. The number of
+    pending calls of all workers is bounded to provide backpressure.
+    """
+
+    def __init__(
+        self,
+        batch_size=128,
+        maximum_number_of_pending_calls=None,
+        maximum_number_of_workers=4,
+    ):
+        """Initializes an asynchronous resolver.
+
+        Args:
+          batch_size (Optional[int]): maximum number of items, such as sub file
+              entries, that are retrieved on a worker thread at once.
+          maximum_number_of_pending_calls (Optional[int]): maximum number of
+              calls that are pending on the workers at the same time, where None
+              represents twice the maximum number of workers.
+          maximum_number_of_workers (Optional[int]): maximum number of worker
+              threads.
+
+        Raises:
+          ValueError: if the batch size, maximum number of pending calls or
+              workers is invalid.
+        """
+        if batch_size < 1:
+            raise ValueError("Invalid batch size value.")
+
+        if maximum_number_of_workers < 1:
+            raise ValueError("Invalid maximum number of workers value.")
+
+        if maximum_number_of_pending_calls is None:
+            maximum_number_of_pending_calls = maximum_number_of_workers * 2
+
+        if maximum_number_of_pending_calls < 1:
+            raise ValueError("Invalid maximum number of pending calls value.")
+
+        super().__init__()
+        self._batch_size = batch_size
+        self._maximum_number_of_workers = maximum_number_of_workers
+        self._next_worker_index = 0
+        self._semaphore = asyncio.Semaphore(maximum_number_of_pending_calls)
+        self._workers = []
+
+    async def __aenter__(self):
+        """Enters an async with statement."""
+        return self
+
+    async def __aexit__(self, exception_type, value, traceback):
+        """Exits an async with statement."""
+        await self.Close()
+
+    def _GetWorker(self):
+        """Retrieves the worker to open a dfVFS object with.
+
+        Returns:
+          _AsyncWorker: worker.
+        """
+        if len(self._workers) < self._maximum_number_of_workers:
+            worker = _AsyncWorker(self._batch_size, self._semaphore)
+            self._workers.append(worker)
+            return worker
+
+        worker = self._workers[self._next_worker_index]
+        self._next_worker_index = (
+            self._next_worker_index + 1
+        ) % self._maximum_number_of_workers
+        return worker
+
+    def _OpenFileEntry(self, worker, path_spec):
+        """Opens a file entry on the worker thread.
+
+        Args:
+          worker (_AsyncWorker): worker.
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileEntry: file entry or None if the path specification could not
+              be resolved.
+        """
+        file_entry = resolver.Resolver.OpenFileEntry(
+            path_spec, resolver_context=worker.resolver_context
+        )
+        if not file_entry:
+            return None
+
+        return AsyncFileEntry(worker, file_entry)
+
+    def _OpenFileObject(self, worker, path_spec):
+        """Opens a file-like object on the worker thread.
+
+        Args:
+          worker (_AsyncWorker): worker.
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileIO: file-like object or None if the path specification could
+              not be resolved.
+        """
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=worker.resolver_context
+        )
+        if not file_object:
+            return None
+
+        return AsyncFileIO(worker, file_object)
+
+    def _OpenFileSystem(self, worker, path_spec):
+        """Opens a file system on the worker thread.
+
+        Args:
+          worker (_AsyncWorker): worker.
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileSystem: file system or None if the path specification could
+              not be resolved.
+        """
+        file_system = resolver.Resolver.OpenFileSystem(
+            path_spec, resolver_context=worker.resolver_context
+        )
+        if not file_system:
+            return None
+
+        return AsyncFileSystem(worker, file_system, path_spec)
+
+    async def Close(self):
+        """Closes the workers.
+
+        Objects that were opened with the asynchronous resolver cannot be used
+        after it has been closed.
+        """
+        workers = self._workers
+        self._next_worker_index = 0
+        self._workers = []
+
+        for worker in workers:
+            await worker.Close()
+
+    async def OpenFileEntry(self, path_spec):
+        """Opens a file entry defined by path specification.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileEntry: file entry or None if the path specification could not
+              be resolved.
+
+        Raises:
+          BackEndError: if the file entry cannot be opened.
+          PathSpecError: if the path specification is incorrect.
+        """
+        worker = self._GetWorker()
+        return await worker.Call(self._OpenFileEntry, worker, path_spec)
+
+    async def OpenFileObject(self, path_spec):
+        """Opens a file-like object defined by path specification.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileIO: file-like object or None if the path specification could
+              not be resolved.
+
+        Raises:
+          BackEndError: if the file-like object cannot be opened.
+          PathSpecError: if the path specification is incorrect.
+        """
+        worker = self._GetWorker()
+        return await worker.Call(self._OpenFileObject, worker, path_spec)
+
+    async def OpenFileSystem(self, path_spec):
+        """Opens a file system defined by path specification.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          AsyncFileSystem: file system or None if the path specification could
+              not be resolved.
+
+        Raises:
+          BackEndError: if the file system cannot be opened.
+          PathSpecError: if the path specification is incorrect.
+        """
+        worker = self._GetWorker()
+        return await worker.Call(self._OpenFileSystem, worker, path_spec)
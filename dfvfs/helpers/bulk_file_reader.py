@@ -0,0 +1,319 @@
+"""Helper to read many files with extent ordered input/output (IO) scheduling."""
+
+import concurrent.futures
+import hashlib
+import threading
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+class BulkFileReadResult:
+    """Result of reading a file.
+
+    Attributes:
+      error (Exception): error that occurred while reading the file or None if
+          the file was read successfully.
+      path_spec (PathSpec): path specification of the file.
+      result (object): value returned by the read function or None if an error
+          occurred.
+    """
+
+    def __init__(self, path_spec, error=None, result=None):
+        """Initializes a file read result.
+
+        Args:
+          path_spec (PathSpec): path specification of the file.
+          error (Optional[Exception]): error that occurred while reading the file.
+          result (Optional[object]): value returned by the read function.
+        """
+        super().__init__()
+        self.error = error
+        self.path_spec = path_spec
+        self.result = result
+
+
+class _WorkerResolverContexts:
+    """Resolver contexts of worker threads.
+
+    Each worker thread uses its own resolver context, since resolver contexts
+    are not thread safe. The file systems are kept open for the lifetime of
+    the worker thread so that subsequent reads from the same file system reuse
+    the cached file system and parent file-like objects.
+    """
+
+    def __init__(self):
+        """Initializes the resolver contexts of worker threads."""
+        super().__init__()
+        self._lock = threading.Lock()
+        self._resolver_contexts = []
+        self._worker_state = threading.local()
+
+    def Empty(self):
+        """Closes the file systems and empties the resolver contexts."""
+        with self._lock:
+            for file_systems, resolver_context in self._resolver_contexts:
+                file_systems.clear()
+                resolver_context.Empty()
+
+            self._resolver_contexts = []
+
+    def GetResolverContext(self, path_spec):
+        """Retrieves the resolver context of the current worker thread.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          Context: resolver context, in which the file system of the path
+              specification is open.
+        """
+        resolver_context = getattr(self._worker_state, "resolver_context", None)
+        if resolver_context is None:
+            file_systems = {}
+            resolver_context = context.Context()
+
+            self._worker_state.file_systems = file_systems
+            self._worker_state.resolver_context = resolver_context
+
+            with self._lock:
+                self._resolver_contexts.append((file_systems, resolver_context))
+
+        file_systems = self._worker_state.file_systems
+
+        parent_path_spec = getattr(path_spec, "parent", None)
+        parent_comparable = getattr(parent_path_spec, "comparable", "")
+        if parent_comparable not in file_systems:
+            file_systems[parent_comparable] = resolver.Resolver.OpenFileSystem(
+                path_spec, resolver_context=resolver_context
+            )
+
+        return resolver_context
+
+
+class BulkFileReader:
+    """Helper to read many files with extent ordered input/output (IO) scheduling.
+
+    Reading many files independently in an arbitrary order results in random
+    access of the underlying storage media image. The bulk file reader sorts the
+    files by the offset of their first data extent, where supported by the file
+    system, and reads them in that order on a bounded pool of worker threads. Each
+    worker thread uses its own resolver context, since resolver contexts are not
+    thread safe.
+    """
+
+    _HASH_READ_SIZE = 1024 * 1024
+
+    def __init__(
+        self, maximum_number_of_queued_reads=None, maximum_number_of_workers=4
+    ):
+        """Initializes a bulk file reader.
+
+        Args:
+          maximum_number_of_queued_reads (Optional[int]): maximum number of reads
+              that are scheduled on the worker pool at the same time, where None
+              represents twice the maximum number of workers.
+          maximum_number_of_workers (Optional[int]): maximum number of worker
+              threads.
+
+        Raises:
+          ValueError: if the maximum number of queued reads or workers is invalid.
+        """
+        if maximum_number_of_workers < 1:
+            raise ValueError("Invalid maximum number of workers value.")
+
+        if maximum_number_of_queued_reads is None:
+            maximum_number_of_queued_reads = maximum_number_of_workers * 2
+
+        if maximum_number_of_queued_reads < 1:
+            raise ValueError("Invalid maximum number of queued reads value.")
+
+        super().__init__()
+        self._maximum_number_of_queued_reads = maximum_number_of_queued_reads
+        self._maximum_number_of_workers = maximum_number_of_workers
+
+    def _GetReadOrderKey(self, file_entry):
+        """Retrieves the read order key of a file entry.
+
+        Args:
+          file_entry (FileEntry): file entry.
+
+        Returns:
+          tuple[str, int]: comparable of the parent path specification and offset
+              of the first data extent. The offset is -1 if the file entry does
+              not have data extents.
+        """
+        parent_path_spec = getattr(file_entry.path_spec, "parent", None)
+        parent_comparable = getattr(parent_path_spec, "comparable", "")
+
+        try:
+            extents = file_entry.GetExtents()
+        except errors.BackEndError:
+            extents = []
+
+        for extent in extents:
+            if extent.extent_type == definitions.EXTENT_TYPE_DATA:
+                return parent_comparable, extent.offset
+
+        return parent_comparable, -1
+
+    def _ReadFile(self, worker_resolver_contexts, path_spec, read_function):
+        """Reads a file on a worker thread.
+
+        Args:
+          worker_resolver_contexts (_WorkerResolverContexts): resolver contexts of
+              the worker threads.
+          path_spec (PathSpec): path specification of the file.
+          read_function (function): function that reads the file, which is called
+              with the file-like object of the file as its argument.
+
+        Returns:
+          BulkFileReadResult: file read result.
+        """
+        try:
+            resolver_context = worker_resolver_contexts.GetResolverContext(path_spec)
+
+            file_object = resolver.Resolver.OpenFileObject(
+                path_spec, resolver_context=resolver_context
+            )
+            if not file_object:
+                raise errors.BackEndError("Unable to open file-like object.")
+
+            result = read_function(file_object)
+
+        except (OSError, errors.Error) as exception:
+            return BulkFileReadResult(path_spec, error=exception)
+
+        return BulkFileReadResult(path_spec, result=result)
+
+    def _ScheduleReads(self, path_specs):
+        """Determines the order in which files should be read.
+
+        Args:
+          path_specs (list[PathSpec]): path specifications of the files.
+
+        Returns:
+          list[PathSpec]: path specifications of the files in read order.
+        """
+        file_systems = {}
+        resolver_context = context.Context()
+
+        read_order = []
+        for index, path_spec in enumerate(path_specs):
+            parent_path_spec = getattr(path_spec, "parent", None)
+            parent_comparable = getattr(parent_path_spec, "comparable", "")
+
+            try:
+                file_system = file_systems.get(parent_comparable, None)
+                if not file_system:
+                    file_system = resolver.Resolver.OpenFileSystem(
+                        path_spec, resolver_context=resolver_context
+                    )
+                    file_systems[parent_comparable] = file_system
+
+                file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+            except (OSError, errors.Error):
+                file_entry = None
+
+            if file_entry:
+                parent_comparable, extent_offset = self._GetReadOrderKey(file_entry)
+            else:
+                parent_comparable, extent_offset = "", -1
+
+            read_order.append((parent_comparable, extent_offset, index, path_spec))
+
+        file_systems.clear()
+        resolver_context.Empty()
+
+        return [path_spec for _, _, _, path_spec in sorted(read_order)]
+
+    def HashFiles(self, path_specs, hash_algorithm="sha256"):
+        """Calculates the hashes of files.
+
+        Args:
+          path_specs (list[PathSpec]): path specifications of the files.
+          hash_algorithm (Optional[str]): name of the hash algorithm supported by
+              hashlib.
+
+        Yields:
+          BulkFileReadResult: file read result, with the hexadecimal digest as
+              result, in order of completion.
+
+        Raises:
+          ValueError: if the hash algorithm is not supported.
+        """
+        if hash_algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm:s}.")
+
+        def _HashFileObject(file_object):
+            """Calculates the hash of a file-like object.
+
+            Args:
+              file_object (FileIO): file-like object.
+
+            Returns:
+              str: hexadecimal digest.
+            """
+            hasher = hashlib.new(hash_algorithm)
+
+            data = file_object.read(self._HASH_READ_SIZE)
+            while data:
+                hasher.update(data)
+                data = file_object.read(self._HASH_READ_SIZE)
+
+            return hasher.hexdigest()
+
+        yield from self.ReadFiles(path_specs, _HashFileObject)
+
+    def ReadFiles(self, path_specs, read_function):
+        """Reads files.
+
+        The files are read in order of the offset of their first data extent
+        and the results are yielded in order of completion.
+
+        Args:
+          path_specs (list[PathSpec]): path specifications of the files.
+          read_function (function): function that reads a file, which is called
+              on a worker thread with the file-like object of the file as its
+              argument. The value returned by the function is stored as the
+              result of the file read result.
+
+        Yields:
+          BulkFileReadResult: file read result in order of completion.
+        """
+        scheduled_path_specs = self._ScheduleReads(path_specs)
+
+        # The resolver contexts are scoped to this call so that concurrent calls
+        # do not empty the resolver contexts of each other.
+        worker_resolver_contexts = _WorkerResolverContexts()
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._maximum_number_of_workers
+            ) as executor:
+                pending_futures = set()
+                for path_spec in scheduled_path_specs:
+                    if len(pending_futures) >= self._maximum_number_of_queued_reads:
+                        done_futures, pending_futures = concurrent.futures.wait(
+                            pending_futures,
+                            return_when=concurrent.futures.FIRST_COMPLETED,
+                        )
+                        for future in done_futures:
+                            yield future.result()
+
+                    future = executor.submit(
+                        self._ReadFile,
+                        worker_resolver_contexts,
+                        path_spec,
+                        read_function,
+                    )
+                    pending_futures.add(future)
+
+                for future in concurrent.futures.as_completed(pending_futures):
+                    yield future.result()
+
+        finally:
+            worker_resolver_contexts.Empty()
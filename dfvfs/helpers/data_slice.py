@@ -1,26 +1,146 @@
 """A data slice interface for file-like objects."""
 
+import collections
 import os
 
+from dfvfs.file_io import os_file_io
+
 
 class DataSlice:
-    """Data slice interface for file-like objects."""
+    """Data slice interface for file-like objects.
+
+    The file data is read in pages, of which the most recently used are cached,
+    so that many small reads do not each result in a read of the file-like
+    object. If the file-like object is an operating system file that is read
+    via a memory map, the file data is accessed via the memory map instead.
+    """
 
-    def __init__(self, file_object):
+    # The size of the data that is scanned at once by find.
+    _FIND_READ_SIZE = 1024 * 1024
+
+    def __init__(
+        self, file_object, maximum_number_of_cached_pages=256, page_size=64 * 1024
+    ):
         """Initializes the data slice.
 
         Args:
           file_object (FileIO): a file-like object to read from.
+          maximum_number_of_cached_pages (Optional[int]): maximum number of pages
+              of file data that are cached.
+          page_size (Optional[int]): size of a page of file data.
+
+        Raises:
+          ValueError: if the maximum number of cached pages or page size is
+              invalid.
         """
+        if maximum_number_of_cached_pages < 1:
+            raise ValueError("Invalid maximum number of cached pages value.")
+
+        if page_size < 1:
+            raise ValueError("Invalid page size value.")
+
         super().__init__()
-        self._buffer = b""
+        self._cached_pages = collections.OrderedDict()
         self._file_object = file_object
         self._file_object_size = file_object.get_size()
+        self._maximum_number_of_cached_pages = maximum_number_of_cached_pages
+        self._memory_map = None
+        self._page_size = page_size
+
+        if isinstance(file_object, os_file_io.OSFile) and file_object.IsMemoryMapped():
+            self._memory_map = file_object.GetMemoryMap()
+
+    def _GetPage(self, page_index):
+        """Retrieves a page of file data.
+
+        Args:
+          page_index (int): index of the page.
+
+        Returns:
+          bytes: page of file data.
+        """
+        page_data = self._cached_pages.get(page_index, None)
+        if page_data is not None:
+            self._cached_pages.move_to_end(page_index)
+            return page_data
+
+        self._file_object.seek(page_index * self._page_size, os.SEEK_SET)
+        page_data = self._file_object.read(self._page_size)
+
+        if len(self._cached_pages) >= self._maximum_number_of_cached_pages:
+            self._cached_pages.popitem(last=False)
+
+        self._cached_pages[page_index] = page_data
+
+        return page_data
+
+    def _ReadData(self, offset, size):
+        """Reads file data.
+
+        Args:
+          offset (int): offset of the file data.
+          size (int): size of the file data.
+
+        Returns:
+          bytes: file data.
+        """
+        if offset < 0 or offset >= self._file_object_size or size <= 0:
+            return b""
+
+        size = min(size, self._file_object_size - offset)
+
+        if self._memory_map is not None:
+            return self._memory_map[offset : offset + size]
+
+        first_page_index = offset // self._page_size
+        last_page_index = (offset + size - 1) // self._page_size
+        page_offset = offset - (first_page_index * self._page_size)
+
+        if first_page_index == last_page_index:
+            page_data = self._GetPage(first_page_index)
+            return page_data[page_offset : page_offset + size]
+
+        number_of_pages = last_page_index - first_page_index + 1
+        if number_of_pages > self._maximum_number_of_cached_pages:
+            # Read data that does not fit in the cache directly, to prevent the
+            # cached pages from being evicted.
+            self._file_object.seek(offset, os.SEEK_SET)
+            return self._file_object.read(size)
+
+        page_data = b"".join(
+            [
+                self._GetPage(page_index)
+                for page_index in range(first_page_index, last_page_index + 1)
+            ]
+        )
+        return page_data[page_offset : page_offset + size]
 
     # Since this class implements Python interface functions, the following
     # functions are in lower case as an exception to the normal naming
     # convention.
 
+    def __buffer__(self, unused_flags):
+        """Retrieves a buffer of the file data.
+
+        Args:
+          unused_flags (int): buffer flags.
+
+        Returns:
+          memoryview: file data.
+
+        Raises:
+          BufferError: if the file data is not memory mapped and does not fit in
+              the page cache.
+        """
+        if self._memory_map is not None:
+            return memoryview(self._memory_map)
+
+        maximum_cached_size = self._page_size * self._maximum_number_of_cached_pages
+        if self._file_object_size > maximum_cached_size:
+            raise BufferError("File data does not fit in the page cache.")
+
+        return memoryview(self._ReadData(0, self._file_object_size))
+
     def __enter__(self):
         """Enters a with statement."""
         return self
@@ -44,11 +164,9 @@ class DataSlice:
         """
         if isinstance(key, int):
             if key < 0:
-                self._file_object.seek(key, os.SEEK_END)
-            else:
-                self._file_object.seek(key, os.SEEK_SET)
+                key += self._file_object_size
 
-            return self._file_object.read(1)
+            return self._ReadData(key, 1)
 
         if not isinstance(key, slice):
             key_type = type(key)
@@ -57,18 +175,9 @@ class DataSlice:
         if key.step is not None:
             raise ValueError(f"Unsupported slice step: {key.step!s}")
 
-        start_offset = max(key.start or 0, 0)
-        end_offset = key.stop or self._file_object_size
+        start_offset, end_offset, _ = key.indices(self._file_object_size)
 
-        if end_offset < 0:
-            self._file_object.seek(end_offset, os.SEEK_END)
-            read_size = -(start_offset - end_offset)
-
-        else:
-            self._file_object.seek(start_offset, os.SEEK_SET)
-            read_size = end_offset - start_offset
-
-        return self._file_object.read(read_size)
+        return self._ReadData(start_offset, end_offset - start_offset)
 
     def __len__(self):
         """Retrieves the file data size.
@@ -77,3 +186,46 @@ class DataSlice:
           int: file data size.
         """
         return self._file_object_size
+
+    # Note: that the following function does not follow the style guide
+    # because it is part of the bytes-like object interface.
+    # pylint: disable=invalid-name
+
+    def find(self, sub, start=None, end=None):
+        """Finds the first occurrence of a byte pattern in the file data.
+
+        The file data is scanned in chunks, which overlap by the size of the byte
+        pattern minus 1, so that matches that cross chunks are found.
+
+        Args:
+          sub (bytes): byte pattern to find.
+          start (Optional[int]): offset to start the search at.
+          end (Optional[int]): offset to end the search at, where None
+              represents the end of the file data.
+
+        Returns:
+          int: offset of the first occurrence of the byte pattern or -1 if the
+              byte pattern was not found.
+        """
+        start_offset, end_offset, _ = slice(start, end).indices(self._file_object_size)
+
+        if self._memory_map is not None:
+            return self._memory_map.find(sub, start_offset, end_offset)
+
+        sub_size = len(sub)
+        read_size = max(self._FIND_READ_SIZE, sub_size)
+
+        offset = start_offset
+        while offset + sub_size <= end_offset:
+            data = self._ReadData(offset, min(read_size, end_offset - offset))
+
+            data_offset = data.find(sub)
+            if data_offset != -1:
+                return offset + data_offset
+
+            if len(data) < sub_size or offset + len(data) >= end_offset:
+                break
+
+            offset += len(data) - sub_size + 1
+
+        return -1
@@ -0,0 +1,656 @@
+"""Persistent index of the directory tree of file systems."""
+
+import hashlib
+import os
+import sqlite3
+
+from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver
+from dfvfs.serializer import binary_serializer
+
+
+class _IndexedFileEntry:
+    """File entry stored in a file system index.
+
+    The indexed file entry provides the subset of the file entry interface that
+    is used by the file system searcher.
+
+    Attributes:
+      entry_type (str): file entry type, such as directory or file.
+      name (str): name of the file entry, which does not include the full path.
+      path_spec (PathSpec): path specification of the file entry in the indexed
+          file system.
+    """
+
+    def __init__(
+        self, file_system, identifier, entry_type, is_allocated, name, path_spec
+    ):
+        """Initializes an indexed file entry.
+
+        Args:
+          file_system (_IndexedFileSystem): indexed file system.
+          identifier (int): identifier of the file entry within the index.
+          entry_type (str): file entry type, such as directory or file.
+          is_allocated (bool): True if the file entry is allocated.
+          name (str): name of the file entry, which does not include the full
+              path.
+          path_spec (PathSpec): path specification of the file entry in the
+              indexed file system.
+        """
+        super().__init__()
+        self._file_system = file_system
+        self._identifier = identifier
+        self._is_allocated = is_allocated
+        self.entry_type = entry_type
+        self.name = name
+        self.path_spec = path_spec
+
+    @property
+    def sub_file_entries(self):
+        """generator[_IndexedFileEntry]: sub file entries."""
+        return self._file_system.GetSubFileEntries(self._identifier)
+
+    def IsAllocated(self):
+        """Determines if the file entry is allocated.
+
+        Returns:
+          bool: True if the file entry is allocated.
+        """
+        return self._is_allocated
+
+    def IsDevice(self):
+        """Determines if the file entry is a device.
+
+        Returns:
+          bool: True if the file entry is a device.
+        """
+        return self.entry_type in (
+            definitions.FILE_ENTRY_TYPE_BLOCK_DEVICE,
+            definitions.FILE_ENTRY_TYPE_CHARACTER_DEVICE,
+            definitions.FILE_ENTRY_TYPE_DEVICE,
+        )
+
+    def IsDirectory(self):
+        """Determines if the file entry is a directory.
+
+        Returns:
+          bool: True if the file entry is a directory.
+        """
+        return self.entry_type == definitions.FILE_ENTRY_TYPE_DIRECTORY
+
+    def IsFile(self):
+        """Determines if the file entry is a file.
+
+        Returns:
+          bool: True if the file entry is a file.
+        """
+        return self.entry_type == definitions.FILE_ENTRY_TYPE_FILE
+
+    def IsLink(self):
+        """Determines if the file entry is a link.
+
+        Returns:
+          bool: True if the file entry is a link.
+        """
+        return self.entry_type == definitions.FILE_ENTRY_TYPE_LINK
+
+    def IsPipe(self):
+        """Determines if the file entry is a pipe.
+
+        Returns:
+          bool: True if the file entry is a pipe.
+        """
+        return self.entry_type == definitions.FILE_ENTRY_TYPE_PIPE
+
+    def IsSocket(self):
+        """Determines if the file entry is a socket.
+
+        Returns:
+          bool: True if the file entry is a socket.
+        """
+        return self.entry_type == definitions.FILE_ENTRY_TYPE_SOCKET
+
+
+class _IndexedFileSystem:
+    """File system stored in a file system index.
+
+    The indexed file system provides the subset of the file system interface that
+    is used by the file system searcher.
+
+    Attributes:
+      PATH_SEPARATOR (str): path segment separator.
+    """
+
+    _GET_FILE_ENTRY_BY_LOCATION_QUERY = (
+        "SELECT identifier, entry_type, is_allocated, name, path_spec "
+        "FROM file_entries WHERE file_system = ? AND location = ? "
+        "ORDER BY identifier LIMIT 1"
+    )
+
+    _GET_ROOT_FILE_ENTRY_QUERY = (
+        "SELECT identifier, entry_type, is_allocated, name, path_spec "
+        "FROM file_entries WHERE file_system = ? AND parent IS NULL"
+    )
+
+    _GET_SUB_FILE_ENTRIES_QUERY = (
+        "SELECT identifier, entry_type, is_allocated, name, path_spec "
+        "FROM file_entries WHERE file_system = ? AND parent = ? "
+        "ORDER BY identifier"
+    )
+
+    def __init__(self, connection, identifier, path_separator, type_indicator):
+        """Initializes an indexed file system.
+
+        Args:
+          connection (sqlite3.Connection): connection to the index database.
+          identifier (int): identifier of the file system within the index.
+          path_separator (str): path segment separator.
+          type_indicator (str): type indicator of the indexed file system.
+        """
+        super().__init__()
+        self._connection = connection
+        self._identifier = identifier
+        self._type_indicator = type_indicator
+        self.PATH_SEPARATOR = path_separator  # pylint: disable=invalid-name
+
+    @property
+    def type_indicator(self):
+        """str: type indicator."""
+        return self._type_indicator
+
+    def _GetFileEntryFromRow(self, row):
+        """Retrieves a file entry from an index database row.
+
+        Args:
+          row (tuple): index database row.
+
+        Returns:
+          _IndexedFileEntry: file entry.
+        """
+        identifier, entry_type, is_allocated, name, serialized_path_spec = row
+
+        path_spec = binary_serializer.BinaryPathSpecSerializer.ReadSerialized(
+            serialized_path_spec
+        )
+        return _IndexedFileEntry(
+            self, identifier, entry_type, bool(is_allocated), name, path_spec
+        )
+
+    def GetFileEntryByPathSpec(self, path_spec):
+        """Retrieves a file entry for a path specification.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          _IndexedFileEntry: file entry or None if not available.
+        """
+        location = getattr(path_spec, "location", None)
+        if location is None:
+            return None
+
+        cursor = self._connection.execute(
+            self._GET_FILE_ENTRY_BY_LOCATION_QUERY, (self._identifier, location)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        return self._GetFileEntryFromRow(row)
+
+    def GetRootFileEntry(self):
+        """Retrieves the root file entry.
+
+        Returns:
+          _IndexedFileEntry: file entry or None if not available.
+        """
+        cursor = self._connection.execute(
+            self._GET_ROOT_FILE_ENTRY_QUERY, (self._identifier,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        return self._GetFileEntryFromRow(row)
+
+    def GetSubFileEntries(self, identifier):
+        """Retrieves the sub file entries of a file entry.
+
+        Args:
+          identifier (int): identifier of the file entry within the index.
+
+        Yields:
+          _IndexedFileEntry: sub file entry.
+        """
+        cursor = self._connection.execute(
+            self._GET_SUB_FILE_ENTRIES_QUERY, (self._identifier, identifier)
+        )
+        for row in cursor.fetchall():
+            yield self._GetFileEntryFromRow(row)
+
+    def JoinPath(self, path_segments):
+        """Joins the path segments into a path.
+
+        Args:
+          path_segments (list[str]): path segments.
+
+        Returns:
+          str: joined path segments prefixed with the path separator.
+        """
+        path_segments = [
+            segment.split(self.PATH_SEPARATOR) for segment in path_segments
+        ]
+
+        # Flatten the sublists into one list.
+        path_segments = [element for sublist in path_segments for element in sublist]
+
+        # Remove empty path segments.
+        path_segments = list(filter(None, path_segments))
+
+        return "".join([self.PATH_SEPARATOR, self.PATH_SEPARATOR.join(path_segments)])
+
+    def SplitPath(self, path):
+        """Splits the path into path segments.
+
+        Args:
+          path (str): path.
+
+        Returns:
+          list[str]: path segments without the root path segment, which is an
+              empty string.
+        """
+        return list(filter(None, path.split(self.PATH_SEPARATOR)))
+
+
+class FileSystemIndex:
+    """Persistent index of the directory tree of file systems.
+
+    The index records the directory tree of a file system once, after which
+    searches over the same file system are answered from the index without
+    reading the storage media image. File systems are identified by their path
+    specification and the identity of the storage media image that contains
+    them, which consists of the size, modification time and a hash of the first
+    and last part of the image file. If the image file changes, the file system
+    is indexed again.
+
+    The index is stored in a SQLite database.
+    """
+
+    _FORMAT_VERSION = 1
+
+    _IMAGE_IDENTITY_READ_SIZE = 64 * 1024
+
+    _CREATE_TABLE_QUERIES = [
+        "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)",
+        (
+            "CREATE TABLE IF NOT EXISTS file_systems ("
+            "identifier INTEGER PRIMARY KEY, key TEXT UNIQUE, "
+            "image_identity TEXT, path_separator TEXT, type_indicator TEXT)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS file_entries ("
+            "file_system INTEGER, identifier INTEGER, parent INTEGER, "
+            "entry_type TEXT, is_allocated INTEGER, location TEXT, name TEXT, "
+            "path_spec BLOB, PRIMARY KEY (file_system, identifier))"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS file_entries_parent "
+            "ON file_entries (file_system, parent)"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS file_entries_location "
+            "ON file_entries (file_system, location)"
+        ),
+    ]
+
+    _DELETE_FILE_ENTRIES_QUERY = "DELETE FROM file_entries WHERE file_system = ?"
+
+    _DELETE_FILE_SYSTEM_QUERY = "DELETE FROM file_systems WHERE identifier = ?"
+
+    _GET_FILE_SYSTEM_QUERY = (
+        "SELECT identifier, image_identity, path_separator, type_indicator "
+        "FROM file_systems WHERE key = ?"
+    )
+
+    _GET_FORMAT_VERSION_QUERY = "SELECT value FROM metadata WHERE key = 'version'"
+
+    _INSERT_FILE_ENTRY_QUERY = (
+        "INSERT INTO file_entries (file_system, identifier, parent, entry_type, "
+        "is_allocated, location, name, path_spec) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    _INSERT_FILE_SYSTEM_QUERY = (
+        "INSERT INTO file_systems (key, image_identity, path_separator, "
+        "type_indicator) VALUES (?, ?, ?, ?)"
+    )
+
+    _INSERT_FORMAT_VERSION_QUERY = (
+        "INSERT INTO metadata (key, value) VALUES ('version', ?)"
+    )
+
+    def __init__(self, path):
+        """Initializes a file system index.
+
+        Args:
+          path (str): path of the index database file.
+        """
+        super().__init__()
+        self._connection = None
+        self._path = path
+
+    def _GetFileEntryType(self, file_entry):
+        """Retrieves the type of a file entry.
+
+        Args:
+          file_entry (FileEntry): file entry.
+
+        Returns:
+          str: file entry type, such as directory or file, or None if not
+              available.
+        """
+        if file_entry.entry_type:
+            return file_entry.entry_type
+
+        if file_entry.IsDirectory():
+            return definitions.FILE_ENTRY_TYPE_DIRECTORY
+
+        if file_entry.IsFile():
+            return definitions.FILE_ENTRY_TYPE_FILE
+
+        if file_entry.IsLink():
+            return definitions.FILE_ENTRY_TYPE_LINK
+
+        if file_entry.IsDevice():
+            return definitions.FILE_ENTRY_TYPE_DEVICE
+
+        if file_entry.IsPipe():
+            return definitions.FILE_ENTRY_TYPE_PIPE
+
+        if file_entry.IsSocket():
+            return definitions.FILE_ENTRY_TYPE_SOCKET
+
+        return None
+
+    def _GetFileSystemKey(self, path_spec):
+        """Retrieves the key of a file system.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system.
+
+        Returns:
+          str: key of the file system.
+        """
+        parent_path_spec = getattr(path_spec, "parent", None)
+        parent_comparable = getattr(parent_path_spec, "comparable", "")
+
+        return "".join([f"type: {path_spec.type_indicator:s}\n", parent_comparable])
+
+    def _GetImageIdentity(self, path_spec):
+        """Retrieves the identity of the storage media image of a file system.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system.
+
+        Returns:
+          str: identity of the storage media image.
+
+        Raises:
+          BackEndError: if the identity of the storage media image cannot be
+              determined.
+        """
+        image_path_spec = path_spec
+        while image_path_spec.HasParent():
+            image_path_spec = image_path_spec.parent
+
+        if image_path_spec.type_indicator != definitions.TYPE_INDICATOR_OS:
+            raise errors.BackEndError(
+                f"Unsupported storage media image type: "
+                f"{image_path_spec.type_indicator:s}."
+            )
+
+        location = getattr(image_path_spec, "location", None)
+
+        try:
+            stat_object = os.stat(location)
+
+            hasher = hashlib.sha256()
+            with open(location, "rb") as file_object:
+                hasher.update(file_object.read(self._IMAGE_IDENTITY_READ_SIZE))
+
+                if stat_object.st_size > self._IMAGE_IDENTITY_READ_SIZE:
+                    file_object.seek(-self._IMAGE_IDENTITY_READ_SIZE, os.SEEK_END)
+                    hasher.update(file_object.read(self._IMAGE_IDENTITY_READ_SIZE))
+
+        except (OSError, TypeError) as exception:
+            raise errors.BackEndError(
+                f"Unable to determine storage media image identity with error: "
+                f"{exception!s}"
+            )
+
+        return (
+            f"{stat_object.st_size:d}:{stat_object.st_mtime_ns:d}:"
+            f"{hasher.hexdigest():s}"
+        )
+
+    def _GetIndexedFileSystem(self, path_spec):
+        """Retrieves an indexed file system.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system.
+
+        Returns:
+          _IndexedFileSystem: indexed file system or None if the file system is
+              not indexed or the index is outdated.
+
+        Raises:
+          BackEndError: if the identity of the storage media image cannot be
+              determined.
+        """
+        file_system_key = self._GetFileSystemKey(path_spec)
+
+        cursor = self._connection.execute(
+            self._GET_FILE_SYSTEM_QUERY, (file_system_key,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        identifier, image_identity, path_separator, type_indicator = row
+        if image_identity != self._GetImageIdentity(path_spec):
+            return None
+
+        return _IndexedFileSystem(
+            self._connection, identifier, path_separator, type_indicator
+        )
+
+    def _IndexFileEntries(self, file_system, file_system_identifier):
+        """Indexes the file entries of a file system.
+
+        Args:
+          file_system (FileSystem): file system.
+          file_system_identifier (int): identifier of the file system within the
+              index.
+        """
+        # Note that APFS can have a volume without a root directory.
+        file_entry = file_system.GetRootFileEntry()
+        if not file_entry:
+            return
+
+        serializer = binary_serializer.BinaryPathSpecSerializer
+        next_identifier = 1
+
+        file_entries = [(0, None, file_entry)]
+        while file_entries:
+            identifier, parent_identifier, file_entry = file_entries.pop()
+
+            self._connection.execute(
+                self._INSERT_FILE_ENTRY_QUERY,
+                (
+                    file_system_identifier,
+                    identifier,
+                    parent_identifier,
+                    self._GetFileEntryType(file_entry),
+                    file_entry.IsAllocated(),
+                    getattr(file_entry.path_spec, "location", None),
+                    file_entry.name,
+                    serializer.WriteSerialized(file_entry.path_spec),
+                ),
+            )
+
+            try:
+                # Note that identifiers are assigned in the order of the sub file
+                # entries, which is used to preserve the order when searching.
+                for sub_file_entry in file_entry.sub_file_entries:
+                    file_entries.append((next_identifier, identifier, sub_file_entry))
+                    next_identifier += 1
+
+            except errors.AccessError:
+                pass
+
+    def Close(self):
+        """Closes the file system index."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def Find(self, path_spec, find_specs=None, resolver_context=None):
+        """Searches for matching file entries within a file system.
+
+        The file system is indexed first if it is not indexed or if the index of
+        the file system is outdated.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system.
+          find_specs (Optional[list[FindSpec]]): find specifications, where None
+              will return all allocated file entries.
+          resolver_context (Optional[Context]): resolver context, where None
+              represents the built-in context which is not multi process safe.
+
+        Yields:
+          PathSpec: path specification of a matching file entry.
+
+        Raises:
+          BackEndError: if the file system cannot be indexed.
+          OSError: if the file system index has not been opened.
+        """
+        if not self._connection:
+            raise OSError("Not opened.")
+
+        indexed_file_system = self._GetIndexedFileSystem(path_spec)
+        if not indexed_file_system:
+            self.IndexFileSystem(path_spec, resolver_context=resolver_context)
+            indexed_file_system = self._GetIndexedFileSystem(path_spec)
+
+        searcher = file_system_searcher.FileSystemSearcher(
+            indexed_file_system, path_spec.parent
+        )
+        yield from searcher.Find(find_specs=find_specs)
+
+    def HasFileSystem(self, path_spec):
+        """Determines if a file system is indexed and the index is up to date.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system.
+
+        Returns:
+          bool: True if the file system is indexed and the index is up to date.
+
+        Raises:
+          BackEndError: if the identity of the storage media image cannot be
+              determined.
+          OSError: if the file system index has not been opened.
+        """
+        if not self._connection:
+            raise OSError("Not opened.")
+
+        return self._GetIndexedFileSystem(path_spec) is not None
+
+    def IndexFileSystem(self, path_spec, resolver_context=None):
+        """Indexes the directory tree of a file system.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system.
+          resolver_context (Optional[Context]): resolver context, where None
+              represents the built-in context which is not multi process safe.
+
+        Raises:
+          BackEndError: if the file system cannot be indexed.
+          OSError: if the file system index has not been opened.
+          ValueError: if the path specification refers to a system level file
+              system.
+        """
+        if not self._connection:
+            raise OSError("Not opened.")
+
+        if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+            path_spec.type_indicator
+        ):
+            raise ValueError("Unsupported system level file system.")
+
+        image_identity = self._GetImageIdentity(path_spec)
+
+        file_system = resolver.Resolver.OpenFileSystem(
+            path_spec, resolver_context=resolver_context
+        )
+
+        file_system_key = self._GetFileSystemKey(path_spec)
+
+        with self._connection:
+            cursor = self._connection.execute(
+                self._GET_FILE_SYSTEM_QUERY, (file_system_key,)
+            )
+            row = cursor.fetchone()
+            if row:
+                self._connection.execute(self._DELETE_FILE_ENTRIES_QUERY, (row[0],))
+                self._connection.execute(self._DELETE_FILE_SYSTEM_QUERY, (row[0],))
+
+            cursor = self._connection.execute(
+                self._INSERT_FILE_SYSTEM_QUERY,
+                (
+                    file_system_key,
+                    image_identity,
+                    file_system.PATH_SEPARATOR,
+                    file_system.type_indicator,
+                ),
+            )
+            self._IndexFileEntries(file_system, cursor.lastrowid)
+
+    def Open(self):
+        """Opens the file system index.
+
+        Raises:
+          BackEndError: if the format version of the index is not supported.
+          OSError: if the file system index is already opened or cannot be
+              opened.
+        """
+        if self._connection:
+            raise OSError("Already opened.")
+
+        try:
+            connection = sqlite3.connect(self._path)
+
+            with connection:
+                for query in self._CREATE_TABLE_QUERIES:
+                    connection.execute(query)
+
+                cursor = connection.execute(self._GET_FORMAT_VERSION_QUERY)
+                row = cursor.fetchone()
+                if not row:
+                    connection.execute(
+                        self._INSERT_FORMAT_VERSION_QUERY,
+                        (f"{self._FORMAT_VERSION:d}",),
+                    )
+
+        except sqlite3.Error as exception:
+            raise OSError(f"Unable to open file system index with error: {exception!s}")
+
+        if row and row[0] != f"{self._FORMAT_VERSION:d}":
+            connection.close()
+            raise errors.BackEndError(
+                f"Unsupported file system index format version: {row[0]!s}."
+            )
+
+        self._connection = connection
@@ -1,5 +1,6 @@
 """A searcher to find file entries within a file system."""
 
+import concurrent.futures
 import re
 
 try:
@@ -7,10 +8,15 @@ try:
 except ImportError:
     import sre_constants  # pylint: disable=deprecated-module
 
+import queue
+import threading
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import glob2regex
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
 
 class FindSpec:
@@ -89,6 +95,7 @@ class FindSpec:
         self._location = None
         self._location_regex = None
         self._location_segments = None
+        self._location_segments_definition = None
         self._number_of_location_segments = None
 
         if location is not None:
@@ -150,6 +157,9 @@ class FindSpec:
             )
 
         if self._location_segments is not None:
+            # A copy of the location segments is kept since the segments are
+            # replaced by their compiled or lower case form when compared.
+            self._location_segments_definition = list(self._location_segments)
             self._number_of_location_segments = len(self._location_segments)
 
         # TODO: add support for name
@@ -493,6 +503,19 @@ class FindSpec:
 
         return True
 
+    def GetLocationSegments(self):
+        """Retrieves the location segments.
+
+        Returns:
+          list[str]: location segments, which are regular expression patterns if
+              the find specification has a location glob or regular expression
+              defined, or None if no location is defined.
+        """
+        if self._location_segments_definition is None:
+            return None
+
+        return list(self._location_segments_definition)
+
     def HasLocation(self):
         """Determines if the find specification has a location defined.
 
@@ -501,6 +524,14 @@ class FindSpec:
         """
         return bool(self._location_segments)
 
+    def IsCaseSensitive(self):
+        """Determines if the find specification location is case sensitive.
+
+        Returns:
+          bool: True if location segments should be compared case sensitive.
+        """
+        return self._is_case_sensitive
+
     def IsLastLocationSegment(self, segment_index):
         """Determines if the a location segment is the last one.
 
@@ -515,10 +546,284 @@ class FindSpec:
             and segment_index == self._number_of_location_segments
         )
 
+    def IsRegex(self):
+        """Determines if the find specification location is a regular expression.
+
+        Returns:
+          bool: True if the location segments are regular expression patterns,
+              which is also the case for a location glob.
+        """
+        return self._is_regex
+
+
+class _FindSpecTrieNode:
+    """Node of a find specification location segment trie.
+
+    Attributes:
+      case_insensitive_literals (dict[str, _FindSpecTrieNode]): child nodes of
+          case insensitive literal location segments, where the key is the lower
+          case location segment.
+      case_sensitive_literals (dict[str, _FindSpecTrieNode]): child nodes of case
+          sensitive literal location segments.
+      find_specs (list[FindSpec]): find specifications of which the location
+          ends at the node.
+      patterns (dict[tuple[str, bool], tuple[re.Pattern, _FindSpecTrieNode]]):
+          compiled regular expression and child node of regular expression
+          location segments, where the key is the regular expression pattern and
+          if it is case sensitive.
+    """
+
+    # Regular expression to detect patterns with back references or global
+    # flags, which cannot be safely combined into an alternation.
+    _UNCOMBINABLE_PATTERN_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+    def __init__(self):
+        """Initializes a find specification location segment trie node."""
+        super().__init__()
+        self._patterns_alternation = None
+        self._patterns_alternation_is_stale = False
+        self.case_insensitive_literals = {}
+        self.case_sensitive_literals = {}
+        self.find_specs = []
+        self.patterns = {}
+
+    def _GetPatternsAlternation(self):
+        """Retrieves an alternation of the regular expression patterns.
+
+        The alternation is used to quickly determine if a name matches none of the
+        regular expression patterns.
+
+        Returns:
+          re.Pattern: compiled alternation of the regular expression patterns or
+              None if not available.
+        """
+        if self._patterns_alternation_is_stale:
+            self._patterns_alternation = None
+            self._patterns_alternation_is_stale = False
+
+            if len(self.patterns) > 1:
+                alternatives = []
+                for pattern, is_case_sensitive in self.patterns:
+                    if self._UNCOMBINABLE_PATTERN_RE.search(pattern):
+                        alternatives = []
+                        break
+
+                    if is_case_sensitive:
+                        alternatives.append(f"(?:^{pattern:s}$)")
+                    else:
+                        alternatives.append(f"(?i:^{pattern:s}$)")
+
+                if alternatives:
+                    try:
+                        self._patterns_alternation = re.compile(
+                            "|".join(alternatives), flags=re.DOTALL | re.UNICODE
+                        )
+                    except sre_constants.error:
+                        pass
+
+        return self._patterns_alternation
+
+    def AddChildNode(self, location_segment, is_case_sensitive, is_regex):
+        """Adds a child node for a location segment.
+
+        Args:
+          location_segment (str): location segment.
+          is_case_sensitive (bool): True if the location segment should be
+              compared case sensitive.
+          is_regex (bool): True if the location segment is a regular expression
+              pattern.
+
+        Returns:
+          _FindSpecTrieNode: child node or None if the location segment is an
+              invalid regular expression pattern.
+        """
+        if not is_regex:
+            if is_case_sensitive:
+                literals = self.case_sensitive_literals
+            else:
+                literals = self.case_insensitive_literals
+                location_segment = location_segment.lower()
+
+            child_node = literals.get(location_segment, None)
+            if not child_node:
+                child_node = _FindSpecTrieNode()
+                literals[location_segment] = child_node
+
+            return child_node
+
+        pattern_key = (location_segment, is_case_sensitive)
+        if pattern_key in self.patterns:
+            return self.patterns[pattern_key][1]
+
+        # Allow '\n' to be matched by '.' and make '\w', '\W', '\b', '\B',
+        # '\d', '\D', '\s' and '\S' Unicode safe.
+        flags = re.DOTALL | re.UNICODE
+        if not is_case_sensitive:
+            flags |= re.IGNORECASE
+
+        try:
+            compiled_pattern = re.compile(f"^{location_segment:s}$", flags=flags)
+        except sre_constants.error:
+            return None
+
+        child_node = _FindSpecTrieNode()
+        self.patterns[pattern_key] = (compiled_pattern, child_node)
+        self._patterns_alternation_is_stale = True
+
+        return child_node
+
+    def GetChildNodes(self, name):
+        """Retrieves the child nodes that match a name.
+
+        Args:
+          name (str): name of a file entry.
+
+        Returns:
+          list[_FindSpecTrieNode]: child nodes that match the name.
+        """
+        child_nodes = []
+        if name is None:
+            return child_nodes
+
+        child_node = self.case_sensitive_literals.get(name, None)
+        if child_node:
+            child_nodes.append(child_node)
+
+        if self.case_insensitive_literals:
+            child_node = self.case_insensitive_literals.get(name.lower(), None)
+            if child_node:
+                child_nodes.append(child_node)
+
+        if self.patterns:
+            patterns_alternation = self._GetPatternsAlternation()
+            if not patterns_alternation or patterns_alternation.match(name):
+                for compiled_pattern, child_node in self.patterns.values():
+                    if compiled_pattern.match(name):
+                        child_nodes.append(child_node)
+
+        return child_nodes
+
+    def HasChildNodes(self):
+        """Determines if the node has child nodes.
+
+        Returns:
+          bool: True if the node has child nodes.
+        """
+        return bool(
+            self.case_insensitive_literals
+            or self.case_sensitive_literals
+            or self.patterns
+        )
+
+
+class _FindSpecTrie:
+    """Find specification location segment trie.
+
+    The trie combines the location segments of multiple find specifications,
+    which allows a file entry name to be matched against all find specifications
+    at once. Literal location segments are looked up in dictionaries and regular
+    expression location segments are combined into an alternation per node.
+
+    Attributes:
+      find_specs_without_location (list[FindSpec]): find specifications without
+          a location, which match file entries at any depth.
+      root (_FindSpecTrieNode): root node.
+    """
+
+    def __init__(self, find_specs):
+        """Initializes a find specification location segment trie.
+
+        Args:
+          find_specs (list[FindSpec]): find specifications.
+        """
+        super().__init__()
+        self.find_specs_without_location = []
+        self.root = _FindSpecTrieNode()
+
+        for find_spec in find_specs:
+            if not find_spec.HasLocation():
+                self.find_specs_without_location.append(find_spec)
+                continue
+
+            is_case_sensitive = find_spec.IsCaseSensitive()
+            is_regex = find_spec.IsRegex()
+
+            node = self.root
+            for location_segment in find_spec.GetLocationSegments():
+                node = node.AddChildNode(location_segment, is_case_sensitive, is_regex)
+                if not node:
+                    break
+
+            if node:
+                node.find_specs.append(find_spec)
+
+
+class _WorkerFileSystems:
+    """File systems of worker threads.
+
+    Each worker thread uses its own resolver context, since resolver contexts
+    are not thread safe. The file systems are kept open for the lifetime of
+    the worker thread so that subsequent searches reuse them.
+    """
+
+    def __init__(self):
+        """Initializes the file systems of worker threads."""
+        super().__init__()
+        self._lock = threading.Lock()
+        self._resolver_contexts = []
+        self._worker_state = threading.local()
+
+    def Empty(self):
+        """Closes the file systems and empties the resolver contexts."""
+        with self._lock:
+            for file_systems, resolver_context in self._resolver_contexts:
+                file_systems.clear()
+                resolver_context.Empty()
+
+            self._resolver_contexts = []
+
+    def GetFileSystem(self, path_spec):
+        """Retrieves the file system of the current worker thread.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          FileSystem: file system.
+        """
+        resolver_context = getattr(self._worker_state, "resolver_context", None)
+        if resolver_context is None:
+            file_systems = {}
+            resolver_context = context.Context()
+
+            self._worker_state.file_systems = file_systems
+            self._worker_state.resolver_context = resolver_context
+
+            with self._lock:
+                self._resolver_contexts.append((file_systems, resolver_context))
+
+        file_systems = self._worker_state.file_systems
+
+        parent_path_spec = getattr(path_spec, "parent", None)
+        parent_comparable = getattr(parent_path_spec, "comparable", "")
+
+        file_system = file_systems.get(parent_comparable, None)
+        if not file_system:
+            file_system = resolver.Resolver.OpenFileSystem(
+                path_spec, resolver_context=resolver_context
+            )
+            file_systems[parent_comparable] = file_system
+
+        return file_system
+
 
 class FileSystemSearcher:
     """Searcher to find file entries within a file system."""
 
+    _LITERAL_LOOKUP_UNSUPPORTED_TYPE_INDICATORS = frozenset(
+        [definitions.TYPE_INDICATOR_TSK]
+    )
+
     def __init__(self, file_system, mount_point):
         """Initializes a file system searcher.
 
@@ -546,56 +851,308 @@ class FileSystemSearcher:
         self._file_system = file_system
         self._mount_point = mount_point
 
-    def _FindInFileEntry(self, file_entry, find_specs, segment_index):
+    def _FindInFileEntry(
+        self, file_entry, find_spec_trie, trie_nodes, abort_event=None
+    ):
         """Searches for matching file entries within the file entry.
 
         Args:
           file_entry (FileEntry): file entry.
-          find_specs (list[FindSpec]): find specifications.
-          segment_index (int): index of the location path segment to compare.
+          find_spec_trie (_FindSpecTrie): find specification location segment
+              trie.
+          trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+              of the file entry.
+          abort_event (Optional[threading.Event]): event that signals the search
+              should be aborted, which is checked per file entry.
 
         Yields:
           PathSpec: path specification of a matching file entry.
         """
-        sub_find_specs = []
-        for find_spec in find_specs:
-            has_location = find_spec.HasLocation()
-            # Do a quick check to see if the current location segment matches.
-            location_match = find_spec.CompareNameWithLocationSegment(
-                file_entry, segment_index
+        if abort_event and abort_event.is_set():
+            return
+
+        number_of_matches = self._GetNumberOfMatches(
+            file_entry, find_spec_trie, trie_nodes
+        )
+
+        # The path specification is yielded once per matching find specification.
+        for _ in range(number_of_matches):
+            yield file_entry.path_spec
+
+        for sub_file_entry, sub_trie_nodes in self._GetSubFileEntries(
+            file_entry, find_spec_trie, trie_nodes
+        ):
+            yield from self._FindInFileEntry(
+                sub_file_entry, find_spec_trie, sub_trie_nodes, abort_event=abort_event
             )
-            is_last_location_segment = find_spec.IsLastLocationSegment(segment_index)
 
-            if location_match and is_last_location_segment:
+    def _FindInFileEntryOnWorker(
+        self,
+        worker_file_systems,
+        path_spec,
+        find_spec_trie,
+        trie_nodes,
+        result_queue,
+        abort_event,
+    ):
+        """Searches for matching file entries within the file entry on a worker.
+
+        The path specifications of the matching file entries are put on the result
+        queue as soon as they are found, followed by None once the search has
+        completed.
+
+        Args:
+          worker_file_systems (_WorkerFileSystems): file systems of the worker
+              threads.
+          path_spec (PathSpec): path specification of the file entry.
+          find_spec_trie (_FindSpecTrie): find specification location segment
+              trie.
+          trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+              of the file entry.
+          result_queue (queue.Queue): queue of the path specifications of
+              the matching file entries.
+          abort_event (threading.Event): event that signals the search should be
+              aborted.
+        """
+        try:
+            file_system = worker_file_systems.GetFileSystem(path_spec)
+
+            file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+            if file_entry:
+                searcher = FileSystemSearcher(file_system, self._mount_point)
+
+                # pylint: disable=protected-access
+                for result_path_spec in searcher._FindInFileEntry(
+                    file_entry, find_spec_trie, trie_nodes, abort_event=abort_event
+                ):
+                    if abort_event.is_set():
+                        break
+
+                    result_queue.put(result_path_spec)
+
+        finally:
+            result_queue.put(None)
+
+    def _GetBaseFileEntry(self):
+        """Retrieves the file entry of the base location of the file system.
+
+        Returns:
+          FileEntry: file entry of the mount point or root of the file system or
+              None if not available.
+        """
+        if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+            self._file_system.type_indicator
+        ):
+            return self._file_system.GetFileEntryByPathSpec(self._mount_point)
+
+        return self._file_system.GetRootFileEntry()
+
+    def _GetLiteralSubFileEntries(self, file_entry, trie_nodes):
+        """Retrieves sub file entries by the literal location segments to match.
+
+        When only case sensitive literal location segments remain to be matched
+        and the corresponding sub file entries cannot match themselves, they are
+        looked up directly by location, which prevents the file entry from being
+        enumerated. Sub file entries that can match are always enumerated, since
+        the path specification of a looked up file entry is defined by location
+        only, for example without a TSK inode.
+
+        Look ups are not used for:
+
+        * system-level file systems, since their look ups follow symbolic links,
+          which can resolve outside the mount point;
+        * TSK file systems, since their directories can contain multiple file
+          entries with the same name, such as a deleted and an allocated file
+          entry, of which a look up only returns one.
+
+        Args:
+          file_entry (FileEntry): file entry.
+          trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+              of the file entry.
+
+        Returns:
+          list[tuple[FileEntry, list[_FindSpecTrieNode]]]: sub file entries and
+              the trie nodes that match their location, or None if the sub file
+              entries cannot be looked up by location and need to be enumerated.
+        """
+        type_indicator = self._file_system.type_indicator
+        if (
+            type_indicator in self._LITERAL_LOOKUP_UNSUPPORTED_TYPE_INDICATORS
+            or path_spec_factory.Factory.IsSystemLevelTypeIndicator(type_indicator)
+        ):
+            return None
+
+        location = getattr(file_entry.path_spec, "location", None)
+        if location is None or file_entry.IsLink():
+            return None
+
+        sub_trie_nodes_per_name = {}
+        for trie_node in trie_nodes:
+            if trie_node.case_insensitive_literals or trie_node.patterns:
+                return None
+
+            for name, child_node in trie_node.case_sensitive_literals.items():
+                if child_node.find_specs:
+                    return None
+
+                sub_trie_nodes_per_name.setdefault(name, []).append(child_node)
+
+        parent_path_spec = getattr(file_entry.path_spec, "parent", None)
+
+        sub_file_entries = []
+        for name, sub_trie_nodes in sub_trie_nodes_per_name.items():
+            kwargs = {"location": self._file_system.JoinPath([location, name])}
+            if parent_path_spec:
+                kwargs["parent"] = parent_path_spec
+
+            path_spec = path_spec_factory.Factory.NewPathSpec(
+                file_entry.path_spec.type_indicator, **kwargs
+            )
+            sub_file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+            # Note that the look up by location can be case insensitive for some
+            # file systems, such as NTFS. Only directories can contain matching
+            # file entries, where links are not followed.
+            if (
+                sub_file_entry
+                and sub_file_entry.name == name
+                and sub_file_entry.IsDirectory()
+            ):
+                sub_file_entries.append((sub_file_entry, sub_trie_nodes))
+
+        return sub_file_entries
+
+    def _GetNumberOfMatches(self, file_entry, find_spec_trie, trie_nodes):
+        """Determines the number of find specifications that match a file entry.
+
+        Args:
+          file_entry (FileEntry): file entry.
+          find_spec_trie (_FindSpecTrie): find specification location segment
+              trie.
+          trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+              of the file entry.
+
+        Returns:
+          int: number of find specifications that match the file entry.
+        """
+        number_of_matches = 0
+        for find_spec in find_spec_trie.find_specs_without_location:
+            if find_spec.CompareTraits(file_entry):
+                number_of_matches += 1
+
+        for trie_node in trie_nodes:
+            for find_spec in trie_node.find_specs:
                 # Check if the full location matches.
                 location_match = find_spec.ComparePathSpecLocation(
                     file_entry.path_spec,
                     self._file_system,
                     mount_point=self._mount_point,
                 )
+                if location_match and find_spec.CompareTraits(file_entry):
+                    number_of_matches += 1
 
-            if not has_location or (location_match and is_last_location_segment):
-                if find_spec.CompareTraits(file_entry):
-                    yield file_entry.path_spec
+        return number_of_matches
 
-            at_last_location_segment = find_spec.AtLastLocationSegment(segment_index)
-            if (not has_location or location_match) and not at_last_location_segment:
-                sub_find_specs.append(find_spec)
+    def _GetQueuedResults(self, result_queue, number_of_searches):
+        """Retrieves the results of searches on worker threads from a queue.
 
-        if sub_find_specs:
-            segment_index += 1
-            try:
-                for sub_file_entry in file_entry.sub_file_entries:
-                    yield from self._FindInFileEntry(
-                        sub_file_entry, sub_find_specs, segment_index
-                    )
+        Args:
+          result_queue (queue.Queue): queue of the path specifications of
+              the matching file entries.
+          number_of_searches (int): number of searches that put their results
+              on the queue.
+
+        Yields:
+          PathSpec: path specification of a matching file entry.
+        """
+        while number_of_searches > 0:
+            path_spec = result_queue.get()
+            if path_spec is None:
+                number_of_searches -= 1
+            else:
+                yield path_spec
+
+    def _GetSearchWorkItems(self, file_entry, find_spec_trie, trie_nodes, split_depth):
+        """Splits a search into work items up to a specific depth.
+
+        Args:
+          file_entry (FileEntry): file entry.
+          find_spec_trie (_FindSpecTrie): find specification location segment
+              trie.
+          trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+              of the file entry.
+          split_depth (int): depth, relative to the file entry, of the sub file
+              entries that are searched as separate work items.
+
+        Yields:
+          tuple[PathSpec, list[_FindSpecTrieNode]]: path specification of a
+              matching file entry and None, or path specification of a file entry
+              to search and the trie nodes that match its location.
+        """
+        number_of_matches = self._GetNumberOfMatches(
+            file_entry, find_spec_trie, trie_nodes
+        )
+        for _ in range(number_of_matches):
+            yield file_entry.path_spec, None
+
+        for sub_file_entry, sub_trie_nodes in self._GetSubFileEntries(
+            file_entry, find_spec_trie, trie_nodes
+        ):
+            if split_depth <= 1:
+                yield sub_file_entry.path_spec, sub_trie_nodes
+            else:
+                yield from self._GetSearchWorkItems(
+                    sub_file_entry, find_spec_trie, sub_trie_nodes, split_depth - 1
+                )
+
+    def _GetSubFileEntries(self, file_entry, find_spec_trie, trie_nodes):
+        """Retrieves the sub file entries that can contain matching file entries.
+
+        Args:
+          file_entry (FileEntry): file entry.
+          find_spec_trie (_FindSpecTrie): find specification location segment
+              trie.
+          trie_nodes (list[_FindSpecTrieNode]): trie nodes that match the location
+              of the file entry.
+
+        Yields:
+          tuple[FileEntry, list[_FindSpecTrieNode]]: sub file entry and the trie
+              nodes that match its location.
+        """
+        if not find_spec_trie.find_specs_without_location and not any(
+            trie_node.HasChildNodes() for trie_node in trie_nodes
+        ):
+            return
+
+        try:
+            sub_file_entries = None
+            if not find_spec_trie.find_specs_without_location:
+                sub_file_entries = self._GetLiteralSubFileEntries(
+                    file_entry, trie_nodes
+                )
+
+            if sub_file_entries is not None:
+                yield from sub_file_entries
+                return
+
+            for sub_file_entry in file_entry.sub_file_entries:
+                sub_trie_nodes = []
+                for trie_node in trie_nodes:
+                    sub_trie_nodes.extend(trie_node.GetChildNodes(sub_file_entry.name))
+
+                if sub_trie_nodes or find_spec_trie.find_specs_without_location:
+                    yield sub_file_entry, sub_trie_nodes
 
-            except errors.AccessError:
-                pass
+        except errors.AccessError:
+            pass
 
     def Find(self, find_specs=None):
         """Searches for matching file entries within the file system.
 
+        Location segments that are case sensitive literals are resolved directly
+        by location, other location segments require the file entries of the
+        corresponding directory to be enumerated.
+
         Args:
           find_specs (Optional[list[FindSpec]]): find specifications, where None
               will return all allocated file entries.
@@ -604,18 +1161,130 @@ class FileSystemSearcher:
           PathSpec: path specification of a matching file entry.
         """
         if not find_specs:
-            find_specs.append(FindSpec())
+            find_specs = [FindSpec()]
 
-        if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
-            self._file_system.type_indicator
-        ):
-            file_entry = self._file_system.GetFileEntryByPathSpec(self._mount_point)
-        else:
-            file_entry = self._file_system.GetRootFileEntry()
+        find_spec_trie = _FindSpecTrie(find_specs)
 
         # Note that APFS can have a volume without a root directory.
+        file_entry = self._GetBaseFileEntry()
         if file_entry:
-            yield from self._FindInFileEntry(file_entry, find_specs, 0)
+            yield from self._FindInFileEntry(
+                file_entry, find_spec_trie, [find_spec_trie.root]
+            )
+
+    def FindInParallel(
+        self,
+        find_specs=None,
+        deterministic_order=False,
+        maximum_number_of_workers=4,
+        split_depth=1,
+    ):
+        """Searches for matching file entries within the file system in parallel.
+
+        The file system is searched up to the split depth on the calling thread,
+        after which the remaining sub trees are searched on a pool of worker
+        threads. Each worker thread opens the file system with its own resolver
+        context, which is emptied when the search completes. Matching file
+        entries are yielded as soon as they are found. This is beneficial for
+        back-ends that release the global interpreter lock (GIL) while reading,
+        or for file systems on network storage.
+
+        Args:
+          find_specs (Optional[list[FindSpec]]): find specifications, where None
+              will return all allocated file entries.
+          deterministic_order (Optional[bool]): True if the path specifications
+              should be yielded in the same order as Find, False if they should
+              be yielded in the order they are found.
+          maximum_number_of_workers (Optional[int]): maximum number of worker
+              threads.
+          split_depth (Optional[int]): depth, relative to the base location of
+              the file system, of the sub trees that are searched on the worker
+              threads.
+
+        Yields:
+          PathSpec: path specification of a matching file entry.
+
+        Raises:
+          ValueError: if the maximum number of workers or split depth is invalid.
+        """
+        if maximum_number_of_workers < 1:
+            raise ValueError("Invalid maximum number of workers value.")
+
+        if split_depth < 1:
+            raise ValueError("Invalid split depth value.")
+
+        if not find_specs:
+            find_specs = [FindSpec()]
+
+        find_spec_trie = _FindSpecTrie(find_specs)
+
+        file_entry = self._GetBaseFileEntry()
+        if not file_entry:
+            return
+
+        abort_event = threading.Event()
+        worker_file_systems = _WorkerFileSystems()
+
+        # In deterministic order every sub tree has its own result queue, so that
+        # the results of a sub tree can be yielded while it is being searched.
+        shared_result_queue = None
+        if not deterministic_order:
+            shared_result_queue = queue.Queue()
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=maximum_number_of_workers
+        )
+        try:
+            futures = []
+            results = []
+            for path_spec, trie_nodes in self._GetSearchWorkItems(
+                file_entry, find_spec_trie, [find_spec_trie.root], split_depth
+            ):
+                if trie_nodes is not None:
+                    result_queue = shared_result_queue
+                    if deterministic_order:
+                        result_queue = queue.Queue()
+
+                    future = executor.submit(
+                        self._FindInFileEntryOnWorker,
+                        worker_file_systems,
+                        path_spec,
+                        find_spec_trie,
+                        trie_nodes,
+                        result_queue,
+                        abort_event,
+                    )
+                    futures.append(future)
+                    results.append((future, result_queue))
+
+                elif deterministic_order:
+                    results.append(path_spec)
+
+                else:
+                    yield path_spec
+
+            if deterministic_order:
+                for result in results:
+                    if isinstance(result, tuple):
+                        future, result_queue = result
+                        yield from self._GetQueuedResults(result_queue, 1)
+
+                        # Raise any exception that occurred on the worker thread.
+                        future.result()
+
+                    else:
+                        yield result
+
+            else:
+                yield from self._GetQueuedResults(shared_result_queue, len(futures))
+
+                for future in futures:
+                    future.result()
+
+        finally:
+            abort_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            worker_file_systems.Empty()
 
     def GetFileEntryByPathSpec(self, path_spec):
         """Retrieves a file entry for a path specification.
@@ -0,0 +1,227 @@
+"""Helper to process path specifications on a pool of worker processes."""
+
+import concurrent.futures
+
+from dfvfs.lib import errors
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.serializer import binary_serializer
+
+
+class PathSpecProcessResult:
+    """Result of processing a path specification.
+
+    Attributes:
+      error (Exception): error that occurred while processing the path
+          specification or None if the path specification was processed
+          successfully.
+      path_spec (PathSpec): path specification.
+      result (object): value returned by the process function or None if an
+          error occurred.
+    """
+
+    def __init__(self, path_spec, error=None, result=None):
+        """Initializes a path specification process result.
+
+        Args:
+          path_spec (PathSpec): path specification.
+          error (Optional[Exception]): error that occurred while processing the
+              path specification.
+          result (Optional[object]): value returned by the process function.
+        """
+        super().__init__()
+        self.error = error
+        self.path_spec = path_spec
+        self.result = result
+
+
+class _PathSpecProcessPoolWorker:
+    """Worker process state of the path specification process pool.
+
+    The state is maintained per worker process, which allows the file systems,
+    and the file-like objects they depend on, to be opened once per worker and
+    reused by subsequent work units.
+    """
+
+    _file_systems = {}
+    _resolver_context = None
+
+    @classmethod
+    def _GetFileSystem(cls, path_spec):
+        """Retrieves a cached file system.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          FileSystem: file system.
+        """
+        parent_path_spec = getattr(path_spec, "parent", None)
+        parent_comparable = getattr(parent_path_spec, "comparable", "")
+        cache_key = (path_spec.type_indicator, parent_comparable)
+
+        file_system = cls._file_systems.get(cache_key, None)
+        if not file_system:
+            file_system = resolver.Resolver.OpenFileSystem(
+                path_spec, resolver_context=cls._resolver_context
+            )
+            cls._file_systems[cache_key] = file_system
+
+        return file_system
+
+    @classmethod
+    def Initialize(cls):
+        """Initializes the worker process state."""
+        cls._file_systems = {}
+        cls._resolver_context = context.Context()
+
+    @classmethod
+    def ProcessWorkUnit(cls, work_unit, process_function):
+        """Processes a work unit.
+
+        Args:
+          work_unit (tuple[bytes, list[int]]): work unit, which consists of the
+              binary serialized sibling path specifications and their indexes.
+          process_function (function): function that processes a file entry.
+
+        Returns:
+          list[tuple[int, Exception, object]]: index, error and result of the
+              processed path specifications.
+        """
+        serialized_path_specs, indexes = work_unit
+
+        path_specs = binary_serializer.BinaryPathSpecSerializer.ReadSerializedBatch(
+            serialized_path_specs
+        )
+
+        results = []
+        for index, path_spec in zip(indexes, path_specs):
+            try:
+                file_system = cls._GetFileSystem(path_spec)
+                file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+                if not file_entry:
+                    raise errors.BackEndError("Unable to open file entry.")
+
+                result = process_function(file_entry)
+
+            except (OSError, errors.Error) as exception:
+                results.append((index, exception, None))
+                continue
+
+            results.append((index, None, result))
+
+        return results
+
+
+class PathSpecProcessPool:
+    """Helper to process path specifications on a pool of worker processes.
+
+    Path specifications are passed to the worker processes in work units of
+    sibling path specifications, which share the same parent path
+    specification. The path specifications of a work unit are binary serialized
+    as a batch, in which the shared parent path specification is stored once. Since
+    sibling path specifications are dispatched to the same worker process, the
+    file systems opened by the worker can be reused.
+    """
+
+    def __init__(
+        self, maximum_number_of_workers=None, mp_context=None, work_unit_size=64
+    ):
+        """Initializes a path specification process pool.
+
+        Args:
+          maximum_number_of_workers (Optional[int]): maximum number of worker
+              processes, where None represents the number of processors.
+          mp_context (Optional[multiprocessing.context.BaseContext]): multi
+              processing context used to start the worker processes, where None
+              represents the default context.
+          work_unit_size (Optional[int]): maximum number of sibling path
+              specifications per work unit.
+
+        Raises:
+          ValueError: if the maximum number of workers or work unit size is
+              invalid.
+        """
+        if maximum_number_of_workers is not None and maximum_number_of_workers < 1:
+            raise ValueError("Invalid maximum number of workers value.")
+
+        if work_unit_size < 1:
+            raise ValueError("Invalid work unit size value.")
+
+        super().__init__()
+        self._maximum_number_of_workers = maximum_number_of_workers
+        self._mp_context = mp_context
+        self._work_unit_size = work_unit_size
+
+    def _GetWorkUnits(self, path_specs):
+        """Splits path specifications into work units of siblings.
+
+        Args:
+          path_specs (list[PathSpec]): path specifications.
+
+        Returns:
+          list[tuple[bytes, list[int]]]: work units, which consist of the binary
+              serialized sibling path specifications and their indexes.
+        """
+        siblings = {}
+        for index, path_spec in enumerate(path_specs):
+            parent_path_spec = getattr(path_spec, "parent", None)
+            parent_comparable = getattr(parent_path_spec, "comparable", "")
+
+            # Siblings are grouped by the directory of their location.
+            location = getattr(path_spec, "location", None) or ""
+            directory, _, _ = location.rpartition("/")
+
+            sibling_key = (parent_comparable, path_spec.type_indicator, directory)
+            siblings.setdefault(sibling_key, []).append(index)
+
+        work_units = []
+        for sibling_key in sorted(siblings):
+            indexes = siblings[sibling_key]
+            for first_index in range(0, len(indexes), self._work_unit_size):
+                work_unit_indexes = indexes[
+                    first_index : first_index + self._work_unit_size
+                ]
+                serialized_path_specs = (
+                    binary_serializer.BinaryPathSpecSerializer.WriteSerializedBatch(
+                        [path_specs[index] for index in work_unit_indexes]
+                    )
+                )
+                work_units.append((serialized_path_specs, work_unit_indexes))
+
+        return work_units
+
+    def ProcessPathSpecs(self, path_specs, process_function):
+        """Processes path specifications.
+
+        Args:
+          path_specs (list[PathSpec]): path specifications.
+          process_function (function): function that processes a file entry, which
+              is called in a worker process with the file entry of the path
+              specification as its argument. The function and the value it returns
+              must be picklable.
+
+        Yields:
+          PathSpecProcessResult: path specification process result in order of
+              completion of the work units.
+        """
+        work_units = self._GetWorkUnits(path_specs)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer=_PathSpecProcessPoolWorker.Initialize,
+            max_workers=self._maximum_number_of_workers,
+            mp_context=self._mp_context,
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _PathSpecProcessPoolWorker.ProcessWorkUnit,
+                    work_unit,
+                    process_function,
+                )
+                for work_unit in work_units
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                for index, error, result in future.result():
+                    yield PathSpecProcessResult(
+                        path_specs[index], error=error, result=result
+                    )
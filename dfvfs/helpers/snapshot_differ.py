@@ -0,0 +1,245 @@
+"""Helper to enumerate the file entries that differ between snapshots."""
+
+from dfvfs.lib import errors
+from dfvfs.resolver import resolver
+
+
+class SnapshotFileEntryChange:
+    """File entry that differs between a snapshot and the base file system.
+
+    Attributes:
+      change_type (str): change type, such as added, changed or removed.
+      location (str): location of the file entry.
+      path_spec (PathSpec): path specification of the file entry in the snapshot
+          or, if the file entry was removed, in the base file system.
+    """
+
+    CHANGE_TYPE_ADDED = "added"
+    CHANGE_TYPE_CHANGED = "changed"
+    CHANGE_TYPE_REMOVED = "removed"
+
+    def __init__(self, change_type, location, path_spec):
+        """Initializes a file entry change.
+
+        Args:
+          change_type (str): change type, such as added, changed or removed.
+          location (str): location of the file entry.
+          path_spec (PathSpec): path specification of the file entry in the
+              snapshot or, if the file entry was removed, in the base file system.
+        """
+        super().__init__()
+        self.change_type = change_type
+        self.location = location
+        self.path_spec = path_spec
+
+
+class SnapshotDiffer:
+    """Helper to enumerate the file entries that differ between snapshots.
+
+    The file entries of every snapshot, such as a file system in a Volume Shadow
+    Snapshot (VSS) store, are compared against a base file system, such as the
+    file system of the current volume. Every snapshot is walked once and the
+    base file system is walked once more, hence comparing N snapshots requires
+    N + 1 walks, one more than enumerating the snapshots alone, in exchange for
+    only returning the file entries whose metadata differs.
+
+    File entries are compared by their location and metadata, which consists of
+    the type, inode number, such as the NTFS file reference that contains the
+    MFT entry and sequence number, size and timestamps. File entries with the
+    same location, such as a deleted and an allocated file entry, are compared
+    as a group.
+    """
+
+    def __init__(self, base_path_spec, resolver_context=None):
+        """Initializes a snapshot differ.
+
+        Args:
+          base_path_spec (PathSpec): path specification of the base file system.
+          resolver_context (Optional[Context]): resolver context, where None
+              represents the built-in context which is not multi process safe.
+        """
+        super().__init__()
+        self._base_file_entries = None
+        self._base_path_spec = base_path_spec
+        self._resolver_context = resolver_context
+
+    def _GetBaseFileEntries(self):
+        """Retrieves the file entries of the base file system.
+
+        Returns:
+          dict[str, list[tuple[tuple[object], PathSpec]]]: metadata and path
+              specification of the file entries per location.
+
+        Raises:
+          BackEndError: if the base file system cannot be opened.
+        """
+        if self._base_file_entries is None:
+            file_system = resolver.Resolver.OpenFileSystem(
+                self._base_path_spec, resolver_context=self._resolver_context
+            )
+            self._base_file_entries = self._GetFileEntriesByLocation(file_system)
+
+        return self._base_file_entries
+
+    def _GetChanges(self, file_system):
+        """Retrieves the file entries of a file system that differ from the base.
+
+        Args:
+          file_system (FileSystem): file system of the snapshot.
+
+        Yields:
+          SnapshotFileEntryChange: file entry that differs.
+
+        Raises:
+          BackEndError: if the base file system cannot be opened.
+        """
+        base_file_entries = self._GetBaseFileEntries()
+
+        file_entries = self._GetFileEntriesByLocation(file_system)
+        for location, location_file_entries in file_entries.items():
+            yield from self._GetChangesOfLocation(
+                location, base_file_entries.get(location, []), location_file_entries
+            )
+
+        for location, base_location_file_entries in base_file_entries.items():
+            if location not in file_entries:
+                yield from self._GetChangesOfLocation(
+                    location, base_location_file_entries, []
+                )
+
+    def _GetChangesOfLocation(self, location, base_file_entries, file_entries):
+        """Retrieves the file entries with the same location that differ.
+
+        File entries with the same metadata are considered the same. A remaining
+        file entry of the snapshot is considered changed if a remaining file entry
+        of the base file system can be paired with it and added otherwise.
+        A remaining file entry of the base file system that cannot be paired is
+        considered removed.
+
+        Args:
+          location (str): location of the file entries.
+          base_file_entries (list[tuple[tuple[object], PathSpec]]): metadata and
+              path specification of the file entries of the base file system.
+          file_entries (list[tuple[tuple[object], PathSpec]]): metadata and path
+              specification of the file entries of the snapshot.
+
+        Yields:
+          SnapshotFileEntryChange: file entry that differs.
+        """
+        remaining_base_file_entries = list(base_file_entries)
+        remaining_file_entries = []
+
+        for metadata, path_spec in file_entries:
+            for index, (base_metadata, _) in enumerate(remaining_base_file_entries):
+                if metadata == base_metadata:
+                    del remaining_base_file_entries[index]
+                    break
+            else:
+                remaining_file_entries.append(path_spec)
+
+        for index, path_spec in enumerate(remaining_file_entries):
+            if index < len(remaining_base_file_entries):
+                change_type = SnapshotFileEntryChange.CHANGE_TYPE_CHANGED
+            else:
+                change_type = SnapshotFileEntryChange.CHANGE_TYPE_ADDED
+
+            yield SnapshotFileEntryChange(change_type, location, path_spec)
+
+        for _, path_spec in remaining_base_file_entries[len(remaining_file_entries) :]:
+            yield SnapshotFileEntryChange(
+                SnapshotFileEntryChange.CHANGE_TYPE_REMOVED, location, path_spec
+            )
+
+    def _GetFileEntries(self, file_system):
+        """Retrieves the file entries of a file system.
+
+        Args:
+          file_system (FileSystem): file system.
+
+        Yields:
+          tuple[str, tuple[object], PathSpec]: location, metadata and path
+              specification of the file entry.
+        """
+        # Note that APFS can have a volume without a root directory.
+        file_entry = file_system.GetRootFileEntry()
+        if not file_entry:
+            return
+
+        file_entries = [(file_system.LOCATION_ROOT, file_entry)]
+        while file_entries:
+            location, file_entry = file_entries.pop()
+
+            yield location, self._GetFileEntryMetadata(file_entry), file_entry.path_spec
+
+            try:
+                for sub_file_entry in file_entry.sub_file_entries:
+                    sub_location = file_system.JoinPath([location, sub_file_entry.name])
+                    file_entries.append((sub_location, sub_file_entry))
+
+            except errors.AccessError:
+                pass
+
+    def _GetFileEntriesByLocation(self, file_system):
+        """Retrieves the file entries of a file system per location.
+
+        Args:
+          file_system (FileSystem): file system.
+
+        Returns:
+          dict[str, list[tuple[tuple[object], PathSpec]]]: metadata and path
+              specification of the file entries per location.
+        """
+        file_entries = {}
+        for location, metadata, path_spec in self._GetFileEntries(file_system):
+            file_entries.setdefault(location, []).append((metadata, path_spec))
+
+        return file_entries
+
+    def _GetFileEntryMetadata(self, file_entry):
+        """Retrieves the metadata of a file entry that is used to compare it.
+
+        Args:
+          file_entry (FileEntry): file entry.
+
+        Returns:
+          tuple[object]: metadata of the file entry.
+        """
+        stat_attribute = file_entry.GetStatAttribute()
+        inode_number = getattr(stat_attribute, "inode_number", None)
+
+        date_time_strings = []
+        for date_time in (
+            file_entry.creation_time,
+            file_entry.change_time,
+            file_entry.modification_time,
+        ):
+            if date_time is not None:
+                date_time = date_time.CopyToDateTimeString()
+
+            date_time_strings.append(date_time)
+
+        return (
+            file_entry.entry_type,
+            inode_number,
+            file_entry.size,
+            *date_time_strings,
+        )
+
+    def GetChanges(self, path_spec):
+        """Retrieves the file entries of a snapshot that differ from the base.
+
+        Args:
+          path_spec (PathSpec): path specification of the file system of the
+              snapshot.
+
+        Yields:
+          SnapshotFileEntryChange: file entry that differs.
+
+        Raises:
+          BackEndError: if the base file system or the file system of
+              the snapshot cannot be opened.
+        """
+        file_system = resolver.Resolver.OpenFileSystem(
+            path_spec, resolver_context=self._resolver_context
+        )
+        yield from self._GetChanges(file_system)
@@ -0,0 +1,260 @@
+"""Persistent cache of source scan results."""
+
+import hashlib
+import json
+import os
+
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
+from dfvfs.serializer import json_serializer
+
+
+class SourceScanCache:
+    """Persistent cache of source scan results.
+
+    The cache stores the scan node tree of a source scanner context, which
+    consists of the path specifications, the source type and which scan nodes
+    are locked, so that scanning the same source again does not need to detect
+    its formats. The results are stored in a JSON file per source in a cache
+    directory.
+
+    A source is identified by a fingerprint, which consists of the size and
+    a hash of sampled blocks of the source file and the names and sizes of
+    the segment files of the source. Only sources that are regular files are
+    cached.
+
+    Credentials are not stored. Scan nodes that were unlocked are stored as
+    locked scan nodes, without their sub nodes, so that they are unlocked and
+    scanned again.
+    """
+
+    _FORMAT_VERSION = 1
+
+    _NUMBER_OF_SAMPLED_BLOCKS = 16
+
+    _SAMPLED_BLOCK_SIZE = 4096
+
+    def __init__(self, path):
+        """Initializes a source scan cache.
+
+        Args:
+          path (str): path of the cache directory.
+        """
+        super().__init__()
+        self._path = path
+
+    def _GetCacheFilePath(self, fingerprint):
+        """Retrieves the path of the cache file of a source.
+
+        Args:
+          fingerprint (str): fingerprint of the source.
+
+        Returns:
+          str: path of the cache file.
+        """
+        return os.path.join(self._path, f"{fingerprint:s}.json")
+
+    def _GetFingerprint(self, source_path):
+        """Retrieves the fingerprint of a source.
+
+        Args:
+          source_path (str): path of the source.
+
+        Returns:
+          str: fingerprint of the source or None if the source is not a regular
+              file.
+
+        Raises:
+          OSError: if the source cannot be read.
+        """
+        if not os.path.isfile(source_path):
+            return None
+
+        source_size = os.path.getsize(source_path)
+
+        hasher = hashlib.sha256()
+        hasher.update(f"size: {source_size:d}\n".encode("utf-8"))
+
+        # Storage media images that consist of multiple segment files, such as
+        # image.E01 and image.E02, share the name of the first segment file
+        # without its extension.
+        directory_path, source_name = os.path.split(os.path.abspath(source_path))
+        segment_name_prefix, _ = os.path.splitext(source_name)
+        segment_name_prefix = f"{segment_name_prefix:s}."
+
+        for name in sorted(os.listdir(directory_path)):
+            if name.startswith(segment_name_prefix):
+                segment_size = os.path.getsize(os.path.join(directory_path, name))
+                hasher.update(f"segment: {name:s} {segment_size:d}\n".encode("utf-8"))
+
+        last_block_offset = max(source_size - self._SAMPLED_BLOCK_SIZE, 0)
+        block_offsets = sorted(
+            {
+                (last_block_offset * block_index)
+                // (self._NUMBER_OF_SAMPLED_BLOCKS - 1)
+                for block_index in range(self._NUMBER_OF_SAMPLED_BLOCKS)
+            }
+        )
+
+        with open(source_path, "rb") as file_object:
+            for block_offset in block_offsets:
+                file_object.seek(block_offset, os.SEEK_SET)
+                hasher.update(file_object.read(self._SAMPLED_BLOCK_SIZE))
+
+        return hasher.hexdigest()
+
+    def _ReadScanNode(self, scan_context, parent_scan_node, json_dict):
+        """Reads a scan node and its sub nodes from a JSON dictionary.
+
+        Args:
+          scan_context (SourceScannerContext): source scanner context.
+          parent_scan_node (SourceScanNode): parent scan node or None.
+          json_dict (dict[str, object]): JSON dictionary of the scan node.
+
+        Raises:
+          KeyError: if the JSON dictionary is missing a value.
+          RuntimeError: if the JSON dictionary is invalid.
+          TypeError: if the JSON dictionary is invalid.
+          ValueError: if the JSON dictionary is invalid.
+        """
+        path_spec = json_serializer.JsonPathSpecSerializer.ReadSerialized(
+            json_dict["path_spec"]
+        )
+        if path_spec is None:
+            raise ValueError("Missing path specification.")
+
+        scan_node = scan_context.AddScanNode(path_spec, parent_scan_node)
+        scan_node.scanned = bool(json_dict["scanned"])
+
+        if json_dict["locked"]:
+            scan_context.LockScanNode(path_spec)
+
+        for sub_node_json_dict in json_dict["sub_nodes"]:
+            self._ReadScanNode(scan_context, scan_node, sub_node_json_dict)
+
+    def _WriteScanNode(self, scan_context, scan_node):
+        """Writes a scan node and its sub nodes to a JSON dictionary.
+
+        Args:
+          scan_context (SourceScannerContext): source scanner context.
+          scan_node (SourceScanNode): scan node.
+
+        Returns:
+          dict[str, object]: JSON dictionary of the scan node.
+        """
+        is_locked = scan_context.IsLockedScanNode(scan_node.path_spec)
+        if scan_node.credential:
+            is_locked = True
+            sub_nodes = []
+        else:
+            sub_nodes = [
+                self._WriteScanNode(scan_context, sub_scan_node)
+                for sub_scan_node in scan_node.sub_nodes
+            ]
+
+        return {
+            "locked": is_locked,
+            "path_spec": json_serializer.JsonPathSpecSerializer.WriteSerialized(
+                scan_node.path_spec
+            ),
+            "scanned": scan_node.scanned,
+            "sub_nodes": sub_nodes,
+        }
+
+    def GetScanContext(self, source_path):
+        """Retrieves the cached scan results of a source.
+
+        Args:
+          source_path (str): path of the source.
+
+        Returns:
+          SourceScannerContext: source scanner context or None if the source has
+              no cached scan results or if the cached scan results do not match
+              the source.
+        """
+        try:
+            fingerprint = self._GetFingerprint(source_path)
+        except OSError:
+            return None
+
+        if not fingerprint:
+            return None
+
+        cache_file_path = self._GetCacheFilePath(fingerprint)
+
+        try:
+            with open(cache_file_path, "r", encoding="utf-8") as file_object:
+                json_dict = json.load(file_object)
+
+        except (OSError, ValueError):
+            return None
+
+        # Validate the cached scan results, which are ignored if they do not
+        # match the source, so that the source is scanned again.
+        if (
+            not isinstance(json_dict, dict)
+            or json_dict.get("format_version", None) != self._FORMAT_VERSION
+            or json_dict.get("fingerprint", None) != fingerprint
+            or json_dict.get("source_path", None) != os.path.abspath(source_path)
+        ):
+            return None
+
+        scan_context = source_scanner.SourceScannerContext()
+
+        try:
+            self._ReadScanNode(scan_context, None, json_dict["root"])
+
+        except (KeyError, RuntimeError, TypeError, ValueError):
+            return None
+
+        root_scan_node = scan_context.GetRootScanNode()
+        if (
+            root_scan_node.type_indicator != definitions.TYPE_INDICATOR_OS
+            or root_scan_node.path_spec.location != os.path.abspath(source_path)
+        ):
+            return None
+
+        scan_context.source_type = json_dict.get("source_type", None)
+
+        return scan_context
+
+    def StoreScanContext(self, source_path, scan_context):
+        """Stores the scan results of a source.
+
+        Args:
+          source_path (str): path of the source.
+          scan_context (SourceScannerContext): source scanner context.
+
+        Returns:
+          bool: True if the scan results were stored, False if the source cannot
+              be cached, such as a directory or device.
+
+        Raises:
+          OSError: if the scan results cannot be stored.
+        """
+        fingerprint = self._GetFingerprint(source_path)
+        root_scan_node = scan_context.GetRootScanNode()
+        if not fingerprint or not root_scan_node:
+            return False
+
+        json_dict = {
+            "fingerprint": fingerprint,
+            "format_version": self._FORMAT_VERSION,
+            "root": self._WriteScanNode(scan_context, root_scan_node),
+            "source_path": os.path.abspath(source_path),
+            "source_type": scan_context.source_type,
+        }
+
+        os.makedirs(self._path, exist_ok=True)
+
+        cache_file_path = self._GetCacheFilePath(fingerprint)
+        temporary_cache_file_path = f"{cache_file_path:s}.tmp"
+
+        # Write the scan results to a temporary file first, so that concurrent
+        # readers never see a partially written cache file.
+        with open(temporary_cache_file_path, "w", encoding="utf-8") as file_object:
+            json.dump(json_dict, file_object)
+
+        os.replace(temporary_cache_file_path, cache_file_path)
+
+        return True
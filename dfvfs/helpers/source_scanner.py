@@ -18,15 +18,19 @@ the nodea and user provided context information, such as:
 * which VSS stores to default to.
 """
 
+from concurrent import futures
+
 import pytsk3
 
 from dfvfs.analyzer import analyzer
+from dfvfs.analyzer import probe_cache
 from dfvfs.lib import apfs_helper
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import raw_helper
 from dfvfs.lib import tsk_image
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
 
@@ -34,6 +38,9 @@ class SourceScanNode:
     """Source scan node.
 
     Attributes:
+      block_map (BlockMap): map of the sampled blocks of the data of the source
+          scan node, which is set when the source scanner has a block sampler
+          and no file system was found.
       credential (tuple[str, str]): credential used to unlock the source scan node.
       path_spec (PathSpec): path specification.
       parent_node (SourceScanNode): source scan parent node.
@@ -48,6 +55,7 @@ class SourceScanNode:
           path_spec (PathSpec): path specification.
         """
         super().__init__()
+        self.block_map = None
         self.credential = None
         self.path_spec = path_spec
         self.parent_node = None
@@ -405,24 +413,155 @@ class SourceScannerContext:
 class SourceScanner:
     """Searcher to find volumes within a volume system."""
 
-    def __init__(self, resolver_context=None, sector_size=None):
+    def __init__(
+        self,
+        resolver_context=None,
+        sector_size=None,
+        maximum_number_of_workers=None,
+        block_sampler=None,
+    ):
         """Initializes a source scanner.
 
         Args:
           resolver_context (Optional[Context]): resolver context, where None indicates
               to use the built-in context which is not multi process safe.
           sector_size (Optional[int]): number of bytes per sector.
+          maximum_number_of_workers (Optional[int]): maximum number of worker
+              threads that scan the sub nodes of a volume system, such as
+              partitions, concurrently, where None represents the sub nodes are
+              scanned sequentially.
+          block_sampler (Optional[BlockSampler]): block sampler to classify the
+              data of scan nodes in which no file system was found, where None
+              represents the data is not sampled.
+
+        Raises:
+          ValueError: if the maximum number of workers is invalid.
         """
+        if maximum_number_of_workers is not None and maximum_number_of_workers < 1:
+            raise ValueError("Invalid maximum number of workers value.")
+
         super().__init__()
+        self._block_sampler = block_sampler
+        self._maximum_number_of_workers = maximum_number_of_workers or 1
         self._resolver_context = resolver_context
+        self._probe_cache = None
         self._sector_size = sector_size or 512
+        self._type_indicators_cache = None
 
     # TODO: add functions to check if path spec type is a storage media image type, file
     # system type, etc.
 
+    def _GetTypeIndicators(self, path_spec, format_category):
+        """Determines if a file contains supported format types of a format category.
+
+        While a scan node is scanned, the results are cached per file and format
+        category.
+
+        Args:
+          path_spec (PathSpec): path specification.
+          format_category (int): format category.
+
+        Returns:
+          list[str]: supported format type indicators.
+        """
+        lookup_key = (path_spec.comparable, format_category)
+
+        type_indicators = None
+        if self._type_indicators_cache is not None:
+            type_indicators = self._type_indicators_cache.get(lookup_key, None)
+
+        if type_indicators is None:
+            type_indicators = analyzer.Analyzer.GetTypeIndicatorsForCategories(
+                path_spec,
+                [format_category],
+                probe_cache=self._probe_cache,
+                resolver_context=self._resolver_context,
+            )[format_category]
+
+            if self._type_indicators_cache is not None:
+                self._type_indicators_cache[lookup_key] = type_indicators
+
+        return list(type_indicators)
+
+    def _MergeScanContext(self, scan_context, scan_node, isolated_scan_context):
+        """Merges the results of a scan of a node in an isolated scan context.
+
+        Args:
+          scan_context (SourceScannerContext): source scanner context.
+          scan_node (SourceScanNode): source scan node that was scanned in
+              isolation.
+          isolated_scan_context (SourceScannerContext): source scanner context in
+              which the scan node was scanned.
+        """
+        if isolated_scan_context.source_type:
+            scan_context.SetSourceType(isolated_scan_context.source_type)
+
+        isolated_scan_nodes = [(scan_node, isolated_scan_context.GetRootScanNode())]
+        while isolated_scan_nodes:
+            scan_node, isolated_scan_node = isolated_scan_nodes.pop(0)
+
+            scan_node.block_map = isolated_scan_node.block_map
+            scan_node.scanned = isolated_scan_node.scanned
+            if isolated_scan_context.IsLockedScanNode(isolated_scan_node.path_spec):
+                scan_context.LockScanNode(scan_node.path_spec)
+
+            for isolated_sub_scan_node in isolated_scan_node.sub_nodes:
+                sub_scan_node = scan_context.AddScanNode(
+                    isolated_sub_scan_node.path_spec, scan_node
+                )
+                isolated_scan_nodes.append((sub_scan_node, isolated_sub_scan_node))
+
+    def _SampleBlocks(self, path_spec):
+        """Samples the blocks of the data of a path specification.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          BlockMap: map of the sampled blocks or None if the data could not be
+              sampled.
+        """
+        try:
+            file_object = resolver.Resolver.OpenFileObject(
+                path_spec, resolver_context=self._resolver_context
+            )
+            return self._block_sampler.SampleFileObject(file_object)
+
+        except (OSError, errors.BackEndError):
+            return None
+
     def _ScanNode(self, scan_context, scan_node, auto_recurse=True):
         """Scans a node for supported formats.
 
+        Args:
+          scan_context (SourceScannerContext): source scanner context.
+          scan_node (SourceScanNode): source scan node.
+          auto_recurse (Optional[bool]): True if the scan should automatically recurse
+              as far as possible.
+
+        Raises:
+          BackEndError: if the source cannot be scanned.
+          ValueError: if the scan context or scan node is invalid.
+        """
+        # The results of scanning for format types and the probed data are cached
+        # for the duration of the outer most scan, since a scan node is scanned
+        # for multiple format categories.
+        is_outer_most_scan = self._type_indicators_cache is None
+        if is_outer_most_scan:
+            self._probe_cache = probe_cache.ProbeCache()
+            self._type_indicators_cache = {}
+
+        try:
+            self._ScanNodeForFormats(scan_context, scan_node, auto_recurse=auto_recurse)
+
+        finally:
+            if is_outer_most_scan:
+                self._probe_cache = None
+                self._type_indicators_cache = None
+
+    def _ScanNodeForFormats(self, scan_context, scan_node, auto_recurse=True):
+        """Scans a node for supported formats, without managing the cache.
+
         Args:
           scan_context (SourceScannerContext): source scanner context.
           scan_node (SourceScanNode): source scan node.
@@ -562,13 +701,24 @@ class SourceScanner:
                 # we could have single file that is not a RAW storage media image yet
                 # matches the naming schema.
                 if scan_node.path_spec.type_indicator == definitions.TYPE_INDICATOR_RAW:
+                    # The RAW scan node is removed, hence its data is sampled for
+                    # the remaining scan node, which contains the same data.
+                    block_map = None
+                    if self._block_sampler:
+                        block_map = self._SampleBlocks(scan_node.path_spec)
+
                     scan_node = scan_context.RemoveScanNode(scan_node.path_spec)
+                    if scan_node and block_map:
+                        scan_node.block_map = block_map
 
                     # Make sure to override the previously assigned source type.
                     scan_context.source_type = definitions.SOURCE_TYPE_FILE
                 else:
                     scan_context.SetSourceType(definitions.SOURCE_TYPE_FILE)
 
+                    if self._block_sampler and not scan_node.IsSystemLevel():
+                        scan_node.block_map = self._SampleBlocks(scan_node.path_spec)
+
             elif not scan_context.HasScanNode(source_path_spec):
                 scan_node.scanned = True
                 scan_node = scan_context.AddScanNode(source_path_spec, scan_node)
@@ -584,6 +734,41 @@ class SourceScanner:
         if not scan_node.scanned:
             scan_node.scanned = True
 
+    def _ScanNodeInIsolation(self, path_spec):
+        """Scans a node for supported formats in an isolated context.
+
+        The node is scanned with its own resolver context, so that it can be
+        scanned concurrently with other nodes.
+
+        Args:
+          path_spec (PathSpec): path specification of the node.
+
+        Returns:
+          SourceScannerContext: source scanner context in which the node was
+              scanned.
+
+        Raises:
+          BackEndError: if the source cannot be scanned.
+        """
+        resolver_context = context.Context()
+        scanner = SourceScanner(
+            resolver_context=resolver_context,
+            sector_size=self._sector_size,
+            block_sampler=self._block_sampler,
+        )
+
+        scan_context = SourceScannerContext()
+        scan_node = scan_context.AddScanNode(path_spec, None)
+
+        try:
+            # pylint: disable=protected-access
+            scanner._ScanNode(scan_context, scan_node, auto_recurse=True)
+
+        finally:
+            resolver_context.Empty()
+
+        return scan_context
+
     def _ScanEncryptedVolumeNode(self, scan_context, scan_node):
         """Scans an encrypted volume node for supported formats.
 
@@ -640,6 +825,14 @@ class SourceScanner:
             # https://github.com/log2timeline/dfvfs/issues/578
             return
 
+        scan_concurrently = (
+            self._maximum_number_of_workers > 1
+            and auto_recurse
+            and scan_node.type_indicator != definitions.TYPE_INDICATOR_VSHADOW
+            and file_entry.number_of_sub_file_entries > 1
+        )
+
+        sub_scan_nodes = []
         for sub_file_entry in file_entry.sub_file_entries:
             sub_scan_node = scan_context.AddScanNode(
                 sub_file_entry.path_spec, scan_node
@@ -649,9 +842,43 @@ class SourceScanner:
                 # be expensive we only do this when explicitly asked for.
                 continue
 
-            if auto_recurse or not scan_context.updated:
+            if scan_concurrently:
+                sub_scan_nodes.append(sub_scan_node)
+
+            elif auto_recurse or not scan_context.updated:
                 self._ScanNode(scan_context, sub_scan_node, auto_recurse=auto_recurse)
 
+        if sub_scan_nodes:
+            self._ScanSubNodesConcurrently(scan_context, sub_scan_nodes)
+
+    def _ScanSubNodesConcurrently(self, scan_context, sub_scan_nodes):
+        """Scans sibling sub nodes concurrently.
+
+        Every sub node is scanned in an isolated context by a worker thread. The
+        results are merged into the source scanner context in the order of the
+        sub nodes, so that the result does not depend on the order in which the
+        scans complete.
+
+        Args:
+          scan_context (SourceScannerContext): source scanner context.
+          sub_scan_nodes (list[SourceScanNode]): sibling sub nodes to scan.
+
+        Raises:
+          BackEndError: if the source cannot be scanned.
+        """
+        with futures.ThreadPoolExecutor(
+            max_workers=self._maximum_number_of_workers
+        ) as executor:
+            scan_futures = [
+                executor.submit(self._ScanNodeInIsolation, sub_scan_node.path_spec)
+                for sub_scan_node in sub_scan_nodes
+            ]
+
+        for sub_scan_node, scan_future in zip(sub_scan_nodes, scan_futures):
+            # Note that result() raises the exception raised by the scan, if any.
+            isolated_scan_context = scan_future.result()
+            self._MergeScanContext(scan_context, sub_scan_node, isolated_scan_context)
+
     def GetVolumeIdentifiers(self, volume_system):
         """Retrieves the volume identifiers.
 
@@ -721,10 +948,10 @@ class SourceScanner:
             )
 
         try:
-            type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(
-                source_path_spec, resolver_context=self._resolver_context
+            type_indicators = self._GetTypeIndicators(
+                source_path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM
             )
-        except RuntimeError as exception:
+        except (OSError, RuntimeError) as exception:
             raise errors.BackEndError(
                 f"Unable to process source path specification with error: {exception!s}"
             )
@@ -786,8 +1013,8 @@ class SourceScanner:
               media image type is found.
         """
         try:
-            type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
-                source_path_spec, resolver_context=self._resolver_context
+            type_indicators = self._GetTypeIndicators(
+                source_path_spec, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE
             )
         except RuntimeError as exception:
             raise errors.BackEndError(
@@ -854,8 +1081,8 @@ class SourceScanner:
             return None
 
         try:
-            type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
-                source_path_spec, resolver_context=self._resolver_context
+            type_indicators = self._GetTypeIndicators(
+                source_path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM
             )
         except (OSError, RuntimeError) as exception:
             raise errors.BackEndError(
@@ -885,9 +1112,15 @@ class SourceScanner:
             if source_type_indicator in definitions.PARTITION_TABLE_TYPE_INDICATORS:
                 return None
 
-            file_object = resolver.Resolver.OpenFileObject(
-                source_path_spec, resolver_context=self._resolver_context
-            )
+            if self._probe_cache is None:
+                file_object = resolver.Resolver.OpenFileObject(
+                    source_path_spec, resolver_context=self._resolver_context
+                )
+            else:
+                file_object = self._probe_cache.GetFileObject(
+                    source_path_spec, resolver_context=self._resolver_context
+                )
+
             try:
                 tsk_image_object = tsk_image.TSKFileSystemImage(
                     file_object,
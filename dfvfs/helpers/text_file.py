@@ -1,5 +1,6 @@
 """A text file interface for file-like objects."""
 
+import codecs
 import os
 
 # Since this class implements the readlines file-like object interface
@@ -8,11 +9,21 @@ import os
 
 
 class TextFile:
-    """Text file interface for file-like objects."""
+    """Text file interface for file-like objects.
 
-    # The maximum allowed size of the read buffer.
+    The text file reads the file-like object in chunks into a read buffer, which
+    is scanned for end-of-line indicators from a cursor. Consumed data is removed
+    from the start of the read buffer before the next chunk is read and lines
+    are decoded with an incremental decoder, so that a character that is split
+    by a size limited read is decoded as part of the next line.
+    """
+
+    # The maximum allowed size of a line.
     _MAXIMUM_READ_BUFFER_SIZE = 16 * 1024 * 1024
 
+    # The size of the chunks read from the file-like object.
+    _READ_CHUNK_SIZE = 1024 * 1024
+
     def __init__(
         self, file_object, encoding="utf-8", encoding_errors="strict", end_of_line="\n"
     ):
@@ -31,9 +42,10 @@ class TextFile:
         self._encoding_errors = encoding_errors
         self._end_of_line = end_of_line.encode(self._encoding)
         self._end_of_line_length = len(self._end_of_line)
-        self._lines = []
-        self._lines_buffer = b""
-        self._lines_buffer_offset = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors=encoding_errors)
+        self._read_buffer = bytearray()
+        self._read_buffer_cursor = 0
+        self._read_buffer_file_offset = 0
         self._current_offset = 0
 
     def __enter__(self):
@@ -57,6 +69,81 @@ class TextFile:
             yield line
             line = self.readline()
 
+    def _ReadIntoBuffer(self):
+        """Reads the next chunk of the file-like object into the read buffer.
+
+        Returns:
+          bool: True if data was read, False if the end of the file-like object
+              was reached.
+        """
+        if self._read_buffer_file_offset >= self._file_object_size:
+            return False
+
+        # Remove the consumed data from the start of the read buffer.
+        if self._read_buffer_cursor:
+            del self._read_buffer[: self._read_buffer_cursor]
+            self._read_buffer_cursor = 0
+
+        read_size = min(
+            self._READ_CHUNK_SIZE,
+            self._file_object_size - self._read_buffer_file_offset,
+        )
+
+        self._file_object.seek(self._read_buffer_file_offset, os.SEEK_SET)
+        read_buffer = self._file_object.read(read_size)
+        if not read_buffer:
+            # Prevent reading beyond the data that is available.
+            self._file_object_size = self._read_buffer_file_offset
+            return False
+
+        self._read_buffer_file_offset += len(read_buffer)
+        self._read_buffer.extend(read_buffer)
+
+        return True
+
+    def _ReadLine(self, size):
+        """Reads the data of a single line from the read buffer.
+
+        Args:
+          size (int): maximum byte size of the line.
+
+        Returns:
+          bytearray: data of the line, including the end-of-line indicator, or
+              an empty bytearray if the end of the file-like object was reached.
+        """
+        search_offset = self._read_buffer_cursor
+        while True:
+            end_of_line_offset = self._read_buffer.find(
+                self._end_of_line, search_offset
+            )
+            if end_of_line_offset != -1:
+                line_end_offset = end_of_line_offset + self._end_of_line_length
+                break
+
+            line_end_offset = len(self._read_buffer)
+            if line_end_offset - self._read_buffer_cursor >= size:
+                break
+
+            # Continue searching where a partial end-of-line indicator could start.
+            search_offset = max(
+                line_end_offset - self._end_of_line_length + 1,
+                self._read_buffer_cursor,
+            )
+            search_offset -= self._read_buffer_cursor
+
+            if not self._ReadIntoBuffer():
+                line_end_offset = len(self._read_buffer)
+                break
+
+            search_offset += self._read_buffer_cursor
+
+        line_end_offset = min(line_end_offset, self._read_buffer_cursor + size)
+
+        line = self._read_buffer[self._read_buffer_cursor : line_end_offset]
+        self._read_buffer_cursor = line_end_offset
+
+        return line
+
     # Note: that the following functions do not follow the style guide
     # because they are part of the readline file-like object interface.
     # pylint: disable=invalid-name
@@ -89,60 +176,29 @@ class TextFile:
         if size is not None and size > self._MAXIMUM_READ_BUFFER_SIZE:
             raise ValueError("Invalid size value exceeds maximum.")
 
-        if not self._lines:
-            if self._lines_buffer_offset >= self._file_object_size:
-                return ""
-
-            read_size = size
-            if not read_size:
-                read_size = self._MAXIMUM_READ_BUFFER_SIZE
-
-            if self._lines_buffer_offset + read_size > self._file_object_size:
-                read_size = self._file_object_size - self._lines_buffer_offset
+        if not size:
+            size = self._MAXIMUM_READ_BUFFER_SIZE
 
-            self._file_object.seek(self._lines_buffer_offset, os.SEEK_SET)
-            read_buffer = self._file_object.read(read_size)
+        decoded_line = ""
+        while not decoded_line:
+            last_offset = self._current_offset
 
-            self._lines_buffer_offset += len(read_buffer)
-
-            self._lines = read_buffer.split(self._end_of_line)
-            if self._lines_buffer:
-                self._lines[0] = b"".join([self._lines_buffer, self._lines[0]])
-                self._lines_buffer = b""
-
-            # Move a partial line from the lines list to the lines buffer.
-            if read_buffer[self._end_of_line_length :] != self._end_of_line:
-                self._lines_buffer = self._lines.pop()
-
-            for index, line in enumerate(self._lines):
-                self._lines[index] = b"".join([line, self._end_of_line])
-
-            if (
-                self._lines_buffer
-                and self._lines_buffer_offset >= self._file_object_size
-            ):
-                self._lines.append(self._lines_buffer)
-                self._lines_buffer = b""
-
-        if not self._lines:
-            line = self._lines_buffer
-            self._lines_buffer = b""
-
-        elif not size or size >= len(self._lines[0]):
-            line = self._lines.pop(0)
-
-        else:
-            line = self._lines[0]
-            self._lines[0] = line[size:]
-            line = line[:size]
+            line = self._ReadLine(size)
+            if not line:
+                return ""
 
-        last_offset = self._current_offset
-        self._current_offset += len(line)
+            self._current_offset += len(line)
 
-        decoded_line = line.decode(self._encoding, self._encoding_errors)
+            is_final = bool(
+                self._read_buffer_cursor >= len(self._read_buffer)
+                and self._read_buffer_file_offset >= self._file_object_size
+            )
+            # Note that the decoded line can be empty if the line consists of
+            # a partial character, which is completed by the next line.
+            decoded_line = self._decoder.decode(line, final=is_final)
 
         # Remove a byte-order mark at the start of the file.
-        if last_offset == 0 and decoded_line[0] == "\ufeff":
+        if last_offset == 0 and decoded_line.startswith("\ufeff"):
             decoded_line = decoded_line[1:]
 
         return decoded_line
@@ -170,15 +170,18 @@ class VolumeScannerMediator:
 class VolumeScanner:
     """Volume scanner."""
 
-    def __init__(self, mediator=None, sector_size=None):
+    def __init__(self, mediator=None, sector_size=None, scan_cache=None):
         """Initializes a volume scanner.
 
         Args:
           mediator (Optional[VolumeScannerMediator]): a volume scanner mediator.
           sector_size (Optional[int]): number of bytes per sector.
+          scan_cache (Optional[SourceScanCache]): source scan cache, where None
+              represents the source is scanned every time.
         """
         super().__init__()
         self._mediator = mediator
+        self._scan_cache = scan_cache
         self._source_path = None
         self._source_scanner = source_scanner.SourceScanner(sector_size=sector_size)
         self._source_type = None
@@ -582,6 +585,16 @@ class VolumeScanner:
               a file or directory, or if the format of or within the source file is not
               supported.
         """
+        source_path = None
+        if self._scan_cache and (
+            source_path_spec.type_indicator == definitions.TYPE_INDICATOR_OS
+        ):
+            source_path = source_path_spec.location
+
+            scan_context = self._scan_cache.GetScanContext(source_path)
+            if scan_context:
+                return scan_context
+
         scan_context = source_scanner.SourceScannerContext()
         scan_context.AddScanNode(source_path_spec, None)
 
@@ -592,6 +605,13 @@ class VolumeScanner:
                 f"Unable to scan source with error: {exception!s}"
             )
 
+        if source_path:
+            try:
+                self._scan_cache.StoreScanContext(source_path, scan_context)
+            except OSError:
+                # Failing to store the scan results only affects subsequent scans.
+                pass
+
         return scan_context
 
     def _ScanVolume(self, scan_context, scan_node, options, base_path_specs):
@@ -1,5 +1,27 @@
 """The Virtual File System (VFS) definitions."""
 
+# The access pattern definitions.
+ACCESS_PATTERN_DONTNEED = "dontneed"
+ACCESS_PATTERN_NORMAL = "normal"
+ACCESS_PATTERN_RANDOM = "random"
+ACCESS_PATTERN_SEQUENTIAL = "sequential"
+ACCESS_PATTERN_WILLNEED = "willneed"
+
+ACCESS_PATTERNS = frozenset(
+    [
+        ACCESS_PATTERN_DONTNEED,
+        ACCESS_PATTERN_NORMAL,
+        ACCESS_PATTERN_RANDOM,
+        ACCESS_PATTERN_SEQUENTIAL,
+        ACCESS_PATTERN_WILLNEED,
+    ]
+)
+
+# The block type definitions, which are used to classify sampled blocks.
+BLOCK_TYPE_HIGH_ENTROPY = "high entropy"
+BLOCK_TYPE_STRUCTURED = "structured"
+BLOCK_TYPE_ZERO = "zero"
+
 # The compression method definitions.
 COMPRESSION_METHOD_BZIP2 = "bzip2"
 COMPRESSION_METHOD_DEFLATE = "deflate"
@@ -125,6 +147,11 @@ PREFERRED_HFS_BACK_END = TYPE_INDICATOR_HFS
 PREFERRED_MBR_BACK_END = TYPE_INDICATOR_TSK_PARTITION
 PREFERRED_NTFS_BACK_END = TYPE_INDICATOR_NTFS
 
+# Use a read-only memory map to read operating system files that are not
+# devices. Note that a memory mapped file should not be truncated while it
+# is open.
+OS_FILE_USE_MEMORY_MAP = False
+
 # The NTFS attribute types.
 ATTRIBUTE_TYPE_NTFS_FILE_NAME = "NTFS:$FILE_NAME"
 ATTRIBUTE_TYPE_NTFS_OBJECT_ID = "NTFS:$OBJECT_ID"
@@ -1,6 +1,7 @@
 """Helper functions for EWF image support."""
 
 from dfvfs.lib import errors
+from dfvfs.lib import segment_helper
 from dfvfs.path import factory as path_spec_factory
 
 
@@ -50,6 +51,10 @@ def EWFGlobPathSpec(file_system, path_spec):
             )
         )
 
+    segment_file_entry_checker = segment_helper.SegmentFileEntryChecker(
+        file_system, parent_path_spec
+    )
+
     segment_number = 1
     segment_files = []
     while True:
@@ -68,7 +73,7 @@ def EWFGlobPathSpec(file_system, path_spec):
             parent_path_spec.type_indicator, **kwargs
         )
 
-        if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+        if not segment_file_entry_checker.FileEntryExistsByPathSpec(segment_path_spec):
             break
 
         segment_files.append(segment_path_spec)
@@ -1,11 +1,12 @@
 """Helper functions for RAW storage media image support."""
 
 from dfvfs.lib import errors
+from dfvfs.lib import segment_helper
 from dfvfs.path import factory as path_spec_factory
 
 
 def _RawGlobPathSpecWithAlphabeticalSchema(
-    file_system,
+    segment_file_entry_checker,
     parent_path_spec,
     segment_format,
     location,
@@ -15,7 +16,8 @@ def _RawGlobPathSpecWithAlphabeticalSchema(
     """Globs for path specifications according to an alphabetical naming schema.
 
     Args:
-      file_system (FileSystem): file system.
+      segment_file_entry_checker (SegmentFileEntryChecker): checker to determine
+          if a segment file exists.
       parent_path_spec (PathSpec): parent path specification.
       segment_format (str): naming schema of the segment file location.
       location (str): the base segment file location string.
@@ -56,7 +58,7 @@ def _RawGlobPathSpecWithAlphabeticalSchema(
             parent_path_spec.type_indicator, **kwargs
         )
 
-        if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+        if not segment_file_entry_checker.FileEntryExistsByPathSpec(segment_path_spec):
             break
 
         segment_files.append(segment_path_spec)
@@ -67,12 +69,17 @@ def _RawGlobPathSpecWithAlphabeticalSchema(
 
 
 def _RawGlobPathSpecWithNumericSchema(
-    file_system, parent_path_spec, segment_format, location, segment_number
+    segment_file_entry_checker,
+    parent_path_spec,
+    segment_format,
+    location,
+    segment_number,
 ):
     """Globs for path specifications according to a numeric naming schema.
 
     Args:
-      file_system (FileSystem): file system.
+      segment_file_entry_checker (SegmentFileEntryChecker): checker to determine
+          if a segment file exists.
       parent_path_spec (PathSpec): parent path specification.
       segment_format (str): naming schema of the segment file location.
       location (str): the base segment file location string.
@@ -99,7 +106,7 @@ def _RawGlobPathSpecWithNumericSchema(
             parent_path_spec.type_indicator, **kwargs
         )
 
-        if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+        if not segment_file_entry_checker.FileEntryExistsByPathSpec(segment_path_spec):
             break
 
         segment_files.append(segment_path_spec)
@@ -135,6 +142,10 @@ def RawGlobPathSpec(file_system, path_spec):
             "Unsupported parent path specification without location."
         )
 
+    segment_file_entry_checker = segment_helper.SegmentFileEntryChecker(
+        file_system, parent_path_spec
+    )
+
     path_segments = file_system.SplitPath(parent_location)
     last_path_segment = path_segments.pop()
     filename_prefix, dot, segment_extension = last_path_segment.rpartition(".")
@@ -164,7 +175,7 @@ def RawGlobPathSpec(file_system, path_spec):
 
             suffix_length = filename_prefix_length - suffix_index
             segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-                file_system,
+                segment_file_entry_checker,
                 parent_path_spec,
                 "{0:s}{1:s}",
                 location[:-suffix_length],
@@ -185,7 +196,7 @@ def RawGlobPathSpec(file_system, path_spec):
 
             suffix_length = filename_prefix_length - suffix_index
             segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-                file_system,
+                segment_file_entry_checker,
                 parent_path_spec,
                 "{0:s}{1:s}",
                 location[:-suffix_length],
@@ -231,7 +242,7 @@ def RawGlobPathSpec(file_system, path_spec):
                 )
 
             segment_files = _RawGlobPathSpecWithNumericSchema(
-                file_system,
+                segment_file_entry_checker,
                 parent_path_spec,
                 segment_format,
                 location[:-suffix_length],
@@ -243,7 +254,7 @@ def RawGlobPathSpec(file_system, path_spec):
     # Check if there is single segment file e.g. PREFIX.dd, PREFIX.dmg,
     # PREFIX.img, PREFIX.raw.
     elif segment_extension.lower() in ["dd", "dmg", "img", "raw"]:
-        if file_system.FileEntryExistsByPathSpec(parent_path_spec):
+        if segment_file_entry_checker.FileEntryExistsByPathSpec(parent_path_spec):
             segment_files = [parent_path_spec]
         else:
             segment_files = []
@@ -253,7 +264,7 @@ def RawGlobPathSpec(file_system, path_spec):
     # e.g. PREFIX.aa or PREFIX.aaa.
     elif segment_extension == "a" * segment_extension_length:
         segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-            file_system,
+            segment_file_entry_checker,
             parent_path_spec,
             "{0:s}.{1:s}",
             location,
@@ -266,7 +277,7 @@ def RawGlobPathSpec(file_system, path_spec):
     # e.g. PREFIX.AA or PREFIX.AAA.
     elif segment_extension == "A" * segment_extension_length:
         segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-            file_system,
+            segment_file_entry_checker,
             parent_path_spec,
             "{0:s}.{1:s}",
             location,
@@ -279,7 +290,11 @@ def RawGlobPathSpec(file_system, path_spec):
     elif segment_extension == "asb":
         if location[-3:] == "001":
             segment_files = _RawGlobPathSpecWithNumericSchema(
-                file_system, parent_path_spec, "{0:s}{1:03d}.asb", location[:-3], 1
+                segment_file_entry_checker,
+                parent_path_spec,
+                "{0:s}{1:03d}.asb",
+                location[:-3],
+                1,
             )
         else:
             segment_files = []
@@ -291,7 +306,11 @@ def RawGlobPathSpec(file_system, path_spec):
         location, _, segment_number = location.partition("-f")
         if segment_number == "001":
             segment_files = _RawGlobPathSpecWithNumericSchema(
-                file_system, parent_path_spec, "{0:s}-f{1:03d}.vmdk", location, 1
+                segment_file_entry_checker,
+                parent_path_spec,
+                "{0:s}-f{1:03d}.vmdk",
+                location,
+                1,
             )
         else:
             segment_files = []
@@ -335,7 +354,11 @@ def RawGlobPathSpec(file_system, path_spec):
             )
 
         segment_files = _RawGlobPathSpecWithNumericSchema(
-            file_system, parent_path_spec, segment_format, location, segment_number
+            segment_file_entry_checker,
+            parent_path_spec,
+            segment_format,
+            location,
+            segment_number,
         )
 
     else:
@@ -383,7 +406,9 @@ def RawGlobPathSpec(file_system, path_spec):
                     parent_path_spec.type_indicator, **kwargs
                 )
 
-                if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+                if not segment_file_entry_checker.FileEntryExistsByPathSpec(
+                    segment_path_spec
+                ):
                     raise errors.PathSpecError(
                         (
                             f"Missing segment file: {segment_number:d}of"
@@ -392,6 +417,6 @@ def RawGlobPathSpec(file_system, path_spec):
                         )
                     )
 
-            segment_files.append(segment_path_spec)
+                segment_files.append(segment_path_spec)
 
     return segment_files
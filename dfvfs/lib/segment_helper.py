@@ -0,0 +1,308 @@
+"""Helper classes for storage media image segment files support."""
+
+import collections
+import os
+
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver
+
+
+class SegmentFileEntryChecker:
+    """Checks if segment files exist based on a listing of their directory.
+
+    Checking if every segment file exists, one name at a time, is slow for
+    storage media images with many segment files, especially on network storage.
+    Instead the names in the directory of the segment files are listed once.
+    """
+
+    def __init__(self, file_system, parent_path_spec):
+        """Initializes a segment file entry checker.
+
+        Args:
+          file_system (FileSystem): file system that contains the segment files.
+          parent_path_spec (PathSpec): path specification of the first segment
+              file.
+        """
+        super().__init__()
+        self._directory_names = {}
+        self._file_system = file_system
+        self._parent_path_spec = parent_path_spec
+
+    def _GetDirectoryNames(self, location):
+        """Retrieves the names in the directory of a location.
+
+        Args:
+          location (str): location of a file entry in the directory.
+
+        Returns:
+          tuple[set[str], set[str]]: names and lower case names in the directory
+              or None if the directory could not be listed.
+        """
+        directory_location = self._file_system.DirnamePath(location)
+        if directory_location is None:
+            return None
+
+        if not directory_location:
+            directory_location = self._file_system.PATH_SEPARATOR
+
+        if directory_location in self._directory_names:
+            return self._directory_names[directory_location]
+
+        # Note that we don't want to set the keyword arguments when not used
+        # because the path specification base class will check for unused
+        # keyword arguments and raise.
+        kwargs = {"location": directory_location}
+        if self._parent_path_spec.parent is not None:
+            kwargs["parent"] = self._parent_path_spec.parent
+
+        directory_names = None
+        try:
+            directory_path_spec = path_spec_factory.Factory.NewPathSpec(
+                self._parent_path_spec.type_indicator, **kwargs
+            )
+            file_entry = self._file_system.GetFileEntryByPathSpec(directory_path_spec)
+            if file_entry and file_entry.IsDirectory():
+                # The directory entries are used instead of the sub file entries
+                # since creating a file entry can require additional access of
+                # the back-end, such as a stat system call.
+                # pylint: disable=protected-access
+                directory = file_entry._GetDirectory()
+                names = set()
+                for path_spec in directory.entries:
+                    entry_location = getattr(path_spec, "location", None)
+                    if not entry_location:
+                        names = None
+                        break
+
+                    names.add(self._file_system.BasenamePath(entry_location))
+
+                if names is not None:
+                    directory_names = (names, {name.lower() for name in names})
+
+        except (OSError, ValueError, errors.Error):
+            directory_names = None
+
+        self._directory_names[directory_location] = directory_names
+
+        return directory_names
+
+    def FileEntryExistsByPathSpec(self, path_spec):
+        """Determines if a file entry for a path specification exists.
+
+        Args:
+          path_spec (PathSpec): path specification of the segment file.
+
+        Returns:
+          bool: True if the file entry exists.
+        """
+        location = getattr(path_spec, "location", None)
+        if location:
+            directory_names = self._GetDirectoryNames(location)
+            if directory_names:
+                names, lower_case_names = directory_names
+
+                name = self._file_system.BasenamePath(location)
+                if name in names:
+                    return True
+
+                # On a case insensitive file system the name can differ in case
+                # from the name in the directory, in which case the file system
+                # is used to determine if the file entry exists.
+                if name.lower() not in lower_case_names:
+                    return False
+
+        return self._file_system.FileEntryExistsByPathSpec(path_spec)
+
+
+class SegmentFileObject:
+    """File-like object of a segment file that is opened on demand.
+
+    The segment file is opened when its data is accessed, using a segment file
+    object pool that limits the number of segment files that are open at the
+    same time.
+    """
+
+    def __init__(self, file_object_pool, path_spec):
+        """Initializes a segment file-like object.
+
+        Args:
+          file_object_pool (SegmentFileObjectPool): segment file object pool.
+          path_spec (PathSpec): path specification of the segment file.
+        """
+        super().__init__()
+        self._current_offset = 0
+        self._file_object_pool = file_object_pool
+        self._size = None
+        self.path_spec = path_spec
+
+    # Note: that the following functions do not follow the style guide
+    # because they are part of the file-like object interface.
+    # pylint: disable=invalid-name
+
+    def close(self):
+        """Closes the file-like object."""
+        return
+
+    def get_offset(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+        """
+        return self._current_offset
+
+    def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the file-like object data.
+
+        Raises:
+          OSError: if the segment file could not be opened.
+        """
+        if self._size is None:
+            file_object = self._file_object_pool.GetOpenFileObject(self.path_spec)
+            self._size = file_object.get_size()
+
+        return self._size
+
+    def read(self, size=None):
+        """Reads a byte string from the file-like object at the current offset.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where None is all
+              remaining data.
+
+        Returns:
+          bytes: data read.
+
+        Raises:
+          OSError: if the segment file could not be opened or the read failed.
+        """
+        file_object = self._file_object_pool.GetOpenFileObject(self.path_spec)
+        file_object.seek(self._current_offset, os.SEEK_SET)
+
+        data = file_object.read(size)
+        self._current_offset += len(data)
+
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Seeks to an offset within the file-like object.
+
+        Args:
+          offset (int): offset to seek to.
+          whence (Optional(int)): value that indicates whether offset is an absolute
+              or relative position within the file.
+
+        Raises:
+          OSError: if the seek failed.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._current_offset
+        elif whence == os.SEEK_END:
+            offset += self.get_size()
+        elif whence != os.SEEK_SET:
+            raise OSError("Unsupported whence.")
+
+        if offset < 0:
+            raise OSError("Invalid offset value less than zero.")
+
+        self._current_offset = offset
+
+    def tell(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+        """
+        return self._current_offset
+
+
+class SegmentFileObjectPool:
+    """Pool of segment file-like objects that are opened on demand.
+
+    Storage media images can consist of hundreds of segment files. Instead of
+    opening all segment files up front, the segment files are opened when their
+    data is accessed and the least recently used segment file is closed when the
+    maximum number of open segment files is reached.
+    """
+
+    def __init__(self, resolver_context, maximum_number_of_open_file_objects=32):
+        """Initializes a segment file object pool.
+
+        Args:
+          resolver_context (Context): resolver context.
+          maximum_number_of_open_file_objects (Optional[int]): maximum number of
+              segment files that are open at the same time.
+
+        Raises:
+          ValueError: if the maximum number of open file objects is invalid.
+        """
+        if maximum_number_of_open_file_objects < 1:
+            raise ValueError("Invalid maximum number of open file objects value.")
+
+        super().__init__()
+        self._maximum_number_of_open_file_objects = maximum_number_of_open_file_objects
+        self._open_file_objects = collections.OrderedDict()
+        self._resolver_context = resolver_context
+
+    def Empty(self):
+        """Closes all open segment files."""
+        self._open_file_objects.clear()
+
+    def GetFileObject(self, path_spec):
+        """Retrieves a segment file-like object that is opened on demand.
+
+        Args:
+          path_spec (PathSpec): path specification of the segment file.
+
+        Returns:
+          SegmentFileObject: segment file-like object.
+        """
+        return SegmentFileObject(self, path_spec)
+
+    def GetOpenFileObject(self, path_spec):
+        """Retrieves an open file-like object of a segment file.
+
+        Args:
+          path_spec (PathSpec): path specification of the segment file.
+
+        Returns:
+          FileIO: file-like object.
+
+        Raises:
+          OSError: if the segment file could not be opened.
+        """
+        lookup_key = path_spec.comparable
+
+        file_object = self._open_file_objects.get(lookup_key, None)
+        if file_object:
+            self._open_file_objects.move_to_end(lookup_key)
+            return file_object
+
+        try:
+            file_object = resolver.Resolver.OpenFileObject(
+                path_spec, resolver_context=self._resolver_context
+            )
+        except errors.Error as exception:
+            raise OSError(f"Unable to open segment file with error: {exception!s}")
+
+        if not file_object:
+            raise OSError("Unable to open segment file.")
+
+        if len(self._open_file_objects) >= self._maximum_number_of_open_file_objects:
+            self._open_file_objects.popitem(last=False)
+
+        self._open_file_objects[lookup_key] = file_object
+
+        return file_object
+
+    def GetOpenFileObjects(self):
+        """Retrieves the open file-like objects of the segment files.
+
+        Returns:
+          list[FileIO]: file-like objects.
+        """
+        return list(self._open_file_objects.values())
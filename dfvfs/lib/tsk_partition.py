@@ -3,6 +3,128 @@
 import pytsk3
 
 
+class TSKVsPartTable:
+    """Table of the TSK volume system parts of a TSK volume.
+
+    The parts are read once and indexed by part index, partition index and start
+    sector, so that retrieving a part by path specification does not need to
+    iterate the parts of the TSK volume.
+
+    The table is built when a TSK partition file system is opened and is kept as
+    long as the file system. Note that the resolver context only maintains a weak
+    reference to the file system, hence once the file system is no longer
+    referenced, it is reopened and the TSK volume and table are read again.
+    """
+
+    def __init__(self, tsk_volume):
+        """Initializes a TSK volume system part table.
+
+        Args:
+          tsk_volume (pytsk3.Volume_Info): TSK volume information.
+        """
+        super().__init__()
+        self._bytes_per_sector = TSKVolumeGetBytesPerSector(tsk_volume)
+        self._part_index_by_partition_index = {}
+        self._part_index_by_start_sector = {}
+        self._partition_numbers = []
+
+        # pytsk3 does not handle the Volume_Info iterator correctly therefore
+        # the explicit cast to list is needed to prevent the iterator terminating
+        # too soon or looping forever.
+        self._tsk_vs_parts = list(tsk_volume)
+
+        number_of_partitions = 0
+        for part_index, tsk_vs_part in enumerate(self._tsk_vs_parts):
+            partition_number = None
+            if TSKVsPartIsAllocated(tsk_vs_part):
+                self._part_index_by_partition_index[number_of_partitions] = part_index
+                number_of_partitions += 1
+                partition_number = number_of_partitions
+
+            self._partition_numbers.append(partition_number)
+
+            start_sector = TSKVsPartGetStartSector(tsk_vs_part)
+            if start_sector is not None:
+                self._part_index_by_start_sector.setdefault(start_sector, part_index)
+
+    @property
+    def number_of_parts(self):
+        """int: number of TSK volume system parts."""
+        return len(self._tsk_vs_parts)
+
+    def GetTSKVsPartByPathSpec(self, path_spec):
+        """Retrieves the TSK volume system part object.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          tuple: containing:
+
+            pytsk3.TSK_VS_PART_INFO: TSK volume system part information or
+                None on error.
+            int: partition index or None if not available.
+        """
+        location = getattr(path_spec, "location", None)
+        part_index = getattr(path_spec, "part_index", None)
+        sector_size = getattr(path_spec, "sector_size", None)
+        start_offset = getattr(path_spec, "start_offset", None)
+        partition_index = None
+
+        if part_index is None:
+            if location is not None:
+                if location.startswith("/p"):
+                    try:
+                        partition_index = int(location[2:], 10) - 1
+                    except ValueError:
+                        pass
+
+                if partition_index is None or partition_index < 0:
+                    partition_index = None
+                    location = None
+
+            if location is None and start_offset is None:
+                return None, None
+
+        elif part_index < 0 or part_index >= len(self._tsk_vs_parts):
+            return None, None
+
+        # If the path specification matches multiple parts the first part is used.
+        matching_part_indexes = []
+        if part_index is not None:
+            matching_part_indexes.append(part_index)
+
+        location_part_index = None
+        if partition_index is not None:
+            location_part_index = self._part_index_by_partition_index.get(
+                partition_index, None
+            )
+            if location_part_index is not None:
+                matching_part_indexes.append(location_part_index)
+
+        if start_offset is not None:
+            bytes_per_sector = sector_size or self._bytes_per_sector
+            start_sector, remainder = divmod(start_offset, bytes_per_sector)
+            if not remainder:
+                start_sector_part_index = self._part_index_by_start_sector.get(
+                    start_sector, None
+                )
+                if start_sector_part_index is not None:
+                    matching_part_indexes.append(start_sector_part_index)
+
+        if not matching_part_indexes:
+            return None, None
+
+        part_index = min(matching_part_indexes)
+
+        # Note that a part matched by location returns the 0-based partition index
+        # otherwise the 1-based partition number is returned.
+        if part_index == location_part_index:
+            return self._tsk_vs_parts[part_index], partition_index
+
+        return self._tsk_vs_parts[part_index], self._partition_numbers[part_index]
+
+
 def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
     """Retrieves the TSK volume system part object from the TSK volume object.
 
@@ -17,71 +139,8 @@ def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
             None on error.
         int: partition index or None if not available.
     """
-    location = getattr(path_spec, "location", None)
-    part_index = getattr(path_spec, "part_index", None)
-    sector_size = getattr(path_spec, "sector_size", None)
-    start_offset = getattr(path_spec, "start_offset", None)
-    partition_index = None
-
-    if part_index is None:
-        if location is not None:
-            if location.startswith("/p"):
-                try:
-                    partition_index = int(location[2:], 10) - 1
-                except ValueError:
-                    pass
-
-            if partition_index is None or partition_index < 0:
-                location = None
-
-        if location is None and start_offset is None:
-            return None, None
-
-    bytes_per_sector = sector_size or TSKVolumeGetBytesPerSector(tsk_volume)
-    current_part_index = 0
-    current_partition_index = 0
-    tsk_vs_part = None
-
-    # pytsk3 does not handle the Volume_Info iterator correctly therefore
-    # the explicit cast to list is needed to prevent the iterator terminating
-    # too soon or looping forever.
-    tsk_vs_part_list = list(tsk_volume)
-    number_of_tsk_vs_parts = len(tsk_vs_part_list)
-
-    if number_of_tsk_vs_parts > 0:
-        if part_index is not None and (
-            part_index < 0 or part_index >= number_of_tsk_vs_parts
-        ):
-            return None, None
-
-        for tsk_vs_part in tsk_vs_part_list:
-            if TSKVsPartIsAllocated(tsk_vs_part):
-                if partition_index is not None:
-                    if partition_index == current_partition_index:
-                        break
-                current_partition_index += 1
-
-            if part_index is not None and part_index == current_part_index:
-                break
-
-            if start_offset is not None:
-                start_sector = TSKVsPartGetStartSector(tsk_vs_part)
-
-                if start_sector is not None:
-                    start_sector *= bytes_per_sector
-                    if start_sector == start_offset:
-                        break
-
-            current_part_index += 1
-
-    # Note that here we cannot solely rely on testing if tsk_vs_part is set since the
-    # for loop will exit with tsk_vs_part set.
-    if tsk_vs_part is None or current_part_index >= number_of_tsk_vs_parts:
-        return None, None
-
-    if not TSKVsPartIsAllocated(tsk_vs_part):
-        current_partition_index = None
-    return tsk_vs_part, current_partition_index
+    tsk_vs_part_table = TSKVsPartTable(tsk_volume)
+    return tsk_vs_part_table.GetTSKVsPartByPathSpec(path_spec)
 
 
 def TSKVolumeGetBytesPerSector(tsk_volume):
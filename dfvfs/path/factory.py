@@ -11,7 +11,9 @@ class Factory:
             "compression_method",
             "data_stream",
             "encoding_method",
+            "encrypted_root_plist",
             "encryption_method",
+            "entry_index",
             "identifier",
             "initialization_vector",
             "inode",
@@ -26,6 +28,7 @@ class Factory:
             "recovery_password",
             "row_condition",
             "row_index",
+            "sector_size",
             "start_offset",
             "startup_key",
             "store_index",
@@ -1,130 +1,54 @@
-"""Imports for the path specification resolver."""
-
-try:
-    from dfvfs.resolver_helpers import apfs_container_resolver_helper
-    from dfvfs.resolver_helpers import apfs_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import apm_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import bde_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import compressed_stream_resolver_helper
-from dfvfs.resolver_helpers import cpio_resolver_helper
-
-try:
-    from dfvfs.resolver_helpers import cs_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import data_range_resolver_helper
-from dfvfs.resolver_helpers import encoded_stream_resolver_helper
-from dfvfs.resolver_helpers import encrypted_stream_resolver_helper
-
-try:
-    from dfvfs.resolver_helpers import ewf_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import ext_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import fake_resolver_helper
-
-try:
-    from dfvfs.resolver_helpers import fat_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import gpt_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import gzip_resolver_helper
-
-try:
-    from dfvfs.resolver_helpers import hfs_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import luksde_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import lvm_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import modi_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import ntfs_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import os_resolver_helper
-
-try:
-    from dfvfs.resolver_helpers import phdi_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import qcow_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import raw_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import sqlite_blob_resolver_helper
-from dfvfs.resolver_helpers import tar_resolver_helper
-
-try:
-    from dfvfs.resolver_helpers import tsk_partition_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import tsk_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import vhdi_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import vmdk_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import vshadow_resolver_helper
-except ImportError:
-    pass
-
-try:
-    from dfvfs.resolver_helpers import xfs_resolver_helper
-except ImportError:
-    pass
-
-from dfvfs.resolver_helpers import zip_resolver_helper
+"""Imports for the path specification resolver.
+
+The resolver helpers are imported when they are first used, since importing
+a resolver helper imports the back-end library of the format it supports.
+"""
+
+from dfvfs.lib import definitions
+from dfvfs.resolver_helpers import manager
+
+
+def _RegisterLazyHelpers():
+    """Registers the resolver helpers to be imported on demand."""
+    for type_indicator, module_name in {
+        definitions.TYPE_INDICATOR_APFS: "apfs",
+        definitions.TYPE_INDICATOR_APFS_CONTAINER: "apfs_container",
+        definitions.TYPE_INDICATOR_APM: "apm",
+        definitions.TYPE_INDICATOR_BDE: "bde",
+        definitions.TYPE_INDICATOR_COMPRESSED_STREAM: "compressed_stream",
+        definitions.TYPE_INDICATOR_CPIO: "cpio",
+        definitions.TYPE_INDICATOR_CS: "cs",
+        definitions.TYPE_INDICATOR_DATA_RANGE: "data_range",
+        definitions.TYPE_INDICATOR_ENCODED_STREAM: "encoded_stream",
+        definitions.TYPE_INDICATOR_ENCRYPTED_STREAM: "encrypted_stream",
+        definitions.TYPE_INDICATOR_EWF: "ewf",
+        definitions.TYPE_INDICATOR_EXT: "ext",
+        definitions.TYPE_INDICATOR_FAKE: "fake",
+        definitions.TYPE_INDICATOR_FAT: "fat",
+        definitions.TYPE_INDICATOR_GPT: "gpt",
+        definitions.TYPE_INDICATOR_GZIP: "gzip",
+        definitions.TYPE_INDICATOR_HFS: "hfs",
+        definitions.TYPE_INDICATOR_LUKSDE: "luksde",
+        definitions.TYPE_INDICATOR_LVM: "lvm",
+        definitions.TYPE_INDICATOR_MODI: "modi",
+        definitions.TYPE_INDICATOR_NTFS: "ntfs",
+        definitions.TYPE_INDICATOR_OS: "os",
+        definitions.TYPE_INDICATOR_PHDI: "phdi",
+        definitions.TYPE_INDICATOR_QCOW: "qcow",
+        definitions.TYPE_INDICATOR_RAW: "raw",
+        definitions.TYPE_INDICATOR_SQLITE_BLOB: "sqlite_blob",
+        definitions.TYPE_INDICATOR_TAR: "tar",
+        definitions.TYPE_INDICATOR_TSK: "tsk",
+        definitions.TYPE_INDICATOR_TSK_PARTITION: "tsk_partition",
+        definitions.TYPE_INDICATOR_VHDI: "vhdi",
+        definitions.TYPE_INDICATOR_VMDK: "vmdk",
+        definitions.TYPE_INDICATOR_VSHADOW: "vshadow",
+        definitions.TYPE_INDICATOR_XFS: "xfs",
+        definitions.TYPE_INDICATOR_ZIP: "zip",
+    }.items():
+        manager.ResolverHelperManager.RegisterLazyHelper(
+            type_indicator, f"dfvfs.resolver_helpers.{module_name:s}_resolver_helper"
+        )
+
+
+_RegisterLazyHelpers()
@@ -1,8 +1,18 @@
 """The path specification resolver helper manager."""
 
+import importlib
+
 
 class ResolverHelperManager:
-    """Path specification resolver helper manager."""
+    """Path specification resolver helper manager.
+
+    Resolver helpers can be registered lazily, by the name of the module that
+    registers the resolver helper, in which case the module is imported when
+    the resolver helper is first used. This prevents the back-end libraries of
+    formats that are not used from being imported.
+    """
+
+    _lazy_resolver_helpers = {}
 
     _resolver_helpers = {}
 
@@ -41,6 +51,18 @@ class ResolverHelperManager:
           KeyError: if resolver helper is not set for the corresponding type
               indicator.
         """
+        if type_indicator not in cls._resolver_helpers:
+            module_name = cls._lazy_resolver_helpers.get(type_indicator, None)
+            if module_name:
+                try:
+                    # Importing the module registers the resolver helper.
+                    importlib.import_module(module_name)
+                except ImportError:
+                    # The back-end library of the format is not available.
+                    pass
+
+                cls._lazy_resolver_helpers.pop(type_indicator, None)
+
         if type_indicator not in cls._resolver_helpers:
             raise KeyError(
                 f"Resolver helper not set for type indicator: {type_indicator:s}."
@@ -48,6 +70,32 @@ class ResolverHelperManager:
 
         return cls._resolver_helpers[type_indicator]
 
+    @classmethod
+    def RegisterLazyHelper(cls, type_indicator, module_name):
+        """Registers a path specification resolver helper to be imported on demand.
+
+        Args:
+          type_indicator (str): type indicator.
+          module_name (str): name of the module that registers the resolver
+              helper when imported.
+
+        Raises:
+          KeyError: if resolver helper object is already set for the corresponding
+              type indicator.
+        """
+        if (
+            type_indicator in cls._resolver_helpers
+            or type_indicator in cls._lazy_resolver_helpers
+        ):
+            raise KeyError(
+                (
+                    f"Resolver helper object already set for type indicator: "
+                    f"{type_indicator!s}."
+                )
+            )
+
+        cls._lazy_resolver_helpers[type_indicator] = module_name
+
     @classmethod
     def RegisterHelper(cls, resolver_helper):
         """Registers a path specification resolver helper.
@@ -67,4 +115,8 @@ class ResolverHelperManager:
                 )
             )
 
+        # A resolver helper that was registered lazily is registered when
+        # its module is imported.
+        cls._lazy_resolver_helpers.pop(resolver_helper.type_indicator, None)
+
         cls._resolver_helpers[resolver_helper.type_indicator] = resolver_helper
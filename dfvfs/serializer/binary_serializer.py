@@ -0,0 +1,512 @@
+"""The binary serializer object implementation."""
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.path import path_spec
+from dfvfs.serializer import serializer
+
+
+class BinaryPathSpecSerializer(serializer.PathSpecSerializer):
+    """Binary path specification serializer object.
+
+    The binary serialized form consists of:
+    * format version, 1 byte;
+    * number of path specification records, variable-size integer;
+    * path specification records;
+    * number of path specifications, variable-size integer;
+    * path specification record indexes, variable-size integers.
+
+    A path specification record consists of:
+    * type indicator code, 1 byte, where 0 indicates the type indicator is stored
+      as a string value;
+    * parent record index + 1, variable-size integer, where 0 indicates the path
+      specification has no parent;
+    * number of properties, variable-size integer;
+    * property code, 1 byte, and value per property.
+
+    Parent path specifications are stored before their children and shared
+    parents, such as those of path specifications of files in the same file
+    system, are stored only once.
+    """
+
+    _FORMAT_VERSION = 1
+
+    # Note that the codes are derived from the index in the tuple + 1, hence new
+    # values should only be appended.
+    _TYPE_INDICATORS = (
+        definitions.TYPE_INDICATOR_APFS,
+        definitions.TYPE_INDICATOR_APFS_CONTAINER,
+        definitions.TYPE_INDICATOR_APM,
+        definitions.TYPE_INDICATOR_BDE,
+        definitions.TYPE_INDICATOR_BZIP2,
+        definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+        definitions.TYPE_INDICATOR_CPIO,
+        definitions.TYPE_INDICATOR_CS,
+        definitions.TYPE_INDICATOR_DATA_RANGE,
+        definitions.TYPE_INDICATOR_ENCODED_STREAM,
+        definitions.TYPE_INDICATOR_ENCRYPTED_STREAM,
+        definitions.TYPE_INDICATOR_EWF,
+        definitions.TYPE_INDICATOR_EXT,
+        definitions.TYPE_INDICATOR_FAKE,
+        definitions.TYPE_INDICATOR_FAT,
+        definitions.TYPE_INDICATOR_GPT,
+        definitions.TYPE_INDICATOR_GZIP,
+        definitions.TYPE_INDICATOR_HFS,
+        definitions.TYPE_INDICATOR_LUKSDE,
+        definitions.TYPE_INDICATOR_LVM,
+        definitions.TYPE_INDICATOR_MODI,
+        definitions.TYPE_INDICATOR_MOUNT,
+        definitions.TYPE_INDICATOR_NTFS,
+        definitions.TYPE_INDICATOR_OS,
+        definitions.TYPE_INDICATOR_PHDI,
+        definitions.TYPE_INDICATOR_QCOW,
+        definitions.TYPE_INDICATOR_RAW,
+        definitions.TYPE_INDICATOR_SQLITE_BLOB,
+        definitions.TYPE_INDICATOR_TAR,
+        definitions.TYPE_INDICATOR_TSK,
+        definitions.TYPE_INDICATOR_TSK_PARTITION,
+        definitions.TYPE_INDICATOR_VHDI,
+        definitions.TYPE_INDICATOR_VMDK,
+        definitions.TYPE_INDICATOR_VSHADOW,
+        definitions.TYPE_INDICATOR_XFS,
+        definitions.TYPE_INDICATOR_XZ,
+        definitions.TYPE_INDICATOR_ZIP,
+    )
+
+    _TYPE_INDICATOR_CODES = {
+        type_indicator: code
+        for code, type_indicator in enumerate(_TYPE_INDICATORS, start=1)
+    }
+
+    # Note that the codes are derived from the index in the tuple, hence new
+    # values should only be appended.
+    _PROPERTY_NAMES = (
+        "cipher_mode",
+        "column_name",
+        "compression_method",
+        "data_stream",
+        "encoding_method",
+        "encryption_method",
+        "identifier",
+        "initialization_vector",
+        "inode",
+        "key",
+        "location",
+        "mft_attribute",
+        "mft_entry",
+        "part_index",
+        "password",
+        "range_offset",
+        "range_size",
+        "recovery_password",
+        "row_condition",
+        "row_index",
+        "start_offset",
+        "startup_key",
+        "store_index",
+        "table_name",
+        "volume_index",
+        "encrypted_root_plist",
+        "entry_index",
+        "sector_size",
+    )
+
+    _PROPERTY_CODES = {
+        property_name: code for code, property_name in enumerate(_PROPERTY_NAMES)
+    }
+
+    _VALUE_TYPE_BYTES = 1
+    _VALUE_TYPE_INTEGER = 2
+    _VALUE_TYPE_STRING = 3
+    _VALUE_TYPE_TUPLE = 4
+
+    @classmethod
+    def _ReadPathSpecRecord(cls, data, offset, path_specs):
+        """Reads a path specification record.
+
+        Args:
+          data (bytes): binary serialized path specifications.
+          offset (int): offset of the record in the data.
+          path_specs (list[PathSpec]): previously read path specifications, used
+              to resolve the parent.
+
+        Returns:
+          tuple[PathSpec, int]: path specification and offset after the record.
+
+        Raises:
+          ValueError: if the record cannot be read.
+        """
+        type_indicator_code = cls._ReadUInt8(data, offset)
+        offset += 1
+
+        if type_indicator_code == 0:
+            type_indicator, offset = cls._ReadValue(data, offset)
+        elif type_indicator_code <= len(cls._TYPE_INDICATORS):
+            type_indicator = cls._TYPE_INDICATORS[type_indicator_code - 1]
+        else:
+            raise ValueError(
+                f"Unsupported type indicator code: {type_indicator_code:d}"
+            )
+
+        parent_reference, offset = cls._ReadVariableSizeInteger(data, offset)
+        if parent_reference > len(path_specs):
+            raise ValueError(f"Invalid parent reference: {parent_reference:d}")
+
+        kwargs = {}
+        if parent_reference:
+            kwargs["parent"] = path_specs[parent_reference - 1]
+
+        number_of_properties, offset = cls._ReadVariableSizeInteger(data, offset)
+        for _ in range(number_of_properties):
+            property_code = cls._ReadUInt8(data, offset)
+            offset += 1
+
+            if property_code >= len(cls._PROPERTY_NAMES):
+                raise ValueError(f"Unsupported property code: {property_code:d}")
+
+            property_name = cls._PROPERTY_NAMES[property_code]
+            kwargs[property_name], offset = cls._ReadValue(data, offset)
+
+        try:
+            path_spec_object = path_spec_factory.Factory.NewPathSpec(
+                type_indicator, **kwargs
+            )
+        except (KeyError, TypeError, errors.Error) as exception:
+            raise ValueError(
+                f"Unable to create path specification with error: {exception!s}"
+            )
+
+        if type_indicator == definitions.TYPE_INDICATOR_OS:
+            # OSPathSpec() will change the location to an absolute path
+            # here we want to preserve the original location.
+            path_spec_object.location = kwargs.get("location")
+
+        return path_spec_object, offset
+
+    @classmethod
+    def _ReadUInt8(cls, data, offset):
+        """Reads an unsigned 8-bit integer.
+
+        Args:
+          data (bytes): binary serialized path specifications.
+          offset (int): offset of the integer in the data.
+
+        Returns:
+          int: integer value.
+
+        Raises:
+          ValueError: if the data is too small.
+        """
+        if offset >= len(data):
+            raise ValueError("Data too small.")
+
+        return data[offset]
+
+    @classmethod
+    def _ReadValue(cls, data, offset):
+        """Reads a property value.
+
+        Args:
+          data (bytes): binary serialized path specifications.
+          offset (int): offset of the value in the data.
+
+        Returns:
+          tuple[object, int]: value and offset after the value.
+
+        Raises:
+          ValueError: if the value cannot be read.
+        """
+        value_type = cls._ReadUInt8(data, offset)
+        offset += 1
+
+        if value_type == cls._VALUE_TYPE_INTEGER:
+            value, offset = cls._ReadVariableSizeInteger(data, offset)
+            # Values are stored zig-zag encoded to support negative integers.
+            return (value >> 1) ^ -(value & 1), offset
+
+        if value_type == cls._VALUE_TYPE_TUPLE:
+            number_of_values, offset = cls._ReadVariableSizeInteger(data, offset)
+
+            values = []
+            for _ in range(number_of_values):
+                value, offset = cls._ReadValue(data, offset)
+                values.append(value)
+
+            return tuple(values), offset
+
+        if value_type not in (cls._VALUE_TYPE_BYTES, cls._VALUE_TYPE_STRING):
+            raise ValueError(f"Unsupported value type: {value_type:d}")
+
+        value_size, offset = cls._ReadVariableSizeInteger(data, offset)
+        if offset + value_size > len(data):
+            raise ValueError("Data too small.")
+
+        value = bytes(data[offset : offset + value_size])
+        offset += value_size
+
+        if value_type == cls._VALUE_TYPE_STRING:
+            try:
+                value = value.decode("utf-8")
+            except UnicodeDecodeError as exception:
+                raise ValueError(f"Unable to decode string with error: {exception!s}")
+
+        return value, offset
+
+    @classmethod
+    def _ReadVariableSizeInteger(cls, data, offset):
+        """Reads an unsigned variable-size (LEB128) integer.
+
+        Args:
+          data (bytes): binary serialized path specifications.
+          offset (int): offset of the integer in the data.
+
+        Returns:
+          tuple[int, int]: integer value and offset after the integer.
+
+        Raises:
+          ValueError: if the data is too small.
+        """
+        value = 0
+        shift = 0
+        while True:
+            byte_value = cls._ReadUInt8(data, offset)
+            offset += 1
+
+            value |= (byte_value & 0x7F) << shift
+            if not byte_value & 0x80:
+                break
+
+            shift += 7
+
+        return value, offset
+
+    @classmethod
+    def _WritePathSpecRecord(cls, path_spec_object, parent_reference, data):
+        """Writes a path specification record.
+
+        Args:
+          path_spec_object (PathSpec): path specification.
+          parent_reference (int): parent record index + 1 or 0 if the path
+              specification has no parent.
+          data (bytearray): binary serialized path specifications to append to.
+
+        Raises:
+          TypeError: if a property value type is not supported.
+        """
+        type_indicator = path_spec_object.type_indicator
+
+        type_indicator_code = cls._TYPE_INDICATOR_CODES.get(type_indicator, 0)
+        data.append(type_indicator_code)
+        if not type_indicator_code:
+            cls._WriteValue(type_indicator, data)
+
+        cls._WriteVariableSizeInteger(parent_reference, data)
+
+        properties = []
+        for property_name in cls._PROPERTY_NAMES:
+            property_value = getattr(path_spec_object, property_name, None)
+            if property_value is not None:
+                properties.append((property_name, property_value))
+
+        cls._WriteVariableSizeInteger(len(properties), data)
+        for property_name, property_value in properties:
+            data.append(cls._PROPERTY_CODES[property_name])
+            cls._WriteValue(property_value, data)
+
+    @classmethod
+    def _WriteValue(cls, value, data):
+        """Writes a property value.
+
+        Args:
+          value (object): property value.
+          data (bytearray): binary serialized path specifications to append to.
+
+        Raises:
+          TypeError: if the value type is not supported.
+        """
+        if isinstance(value, bool) or value is None:
+            raise TypeError(f"Unsupported value type: {type(value)!s}")
+
+        if isinstance(value, int):
+            data.append(cls._VALUE_TYPE_INTEGER)
+            # Values are stored zig-zag encoded to support negative integers.
+            if value < 0:
+                value = (-value << 1) - 1
+            else:
+                value <<= 1
+            cls._WriteVariableSizeInteger(value, data)
+
+        elif isinstance(value, (list, tuple)):
+            data.append(cls._VALUE_TYPE_TUPLE)
+            cls._WriteVariableSizeInteger(len(value), data)
+            for sub_value in value:
+                cls._WriteValue(sub_value, data)
+
+        elif isinstance(value, str):
+            value = value.encode("utf-8")
+            data.append(cls._VALUE_TYPE_STRING)
+            cls._WriteVariableSizeInteger(len(value), data)
+            data.extend(value)
+
+        elif isinstance(value, (bytes, bytearray)):
+            data.append(cls._VALUE_TYPE_BYTES)
+            cls._WriteVariableSizeInteger(len(value), data)
+            data.extend(value)
+
+        else:
+            raise TypeError(f"Unsupported value type: {type(value)!s}")
+
+    @classmethod
+    def _WriteVariableSizeInteger(cls, value, data):
+        """Writes an unsigned variable-size (LEB128) integer.
+
+        Args:
+          value (int): integer value.
+          data (bytearray): binary serialized path specifications to append to.
+        """
+        while value > 0x7F:
+            data.append((value & 0x7F) | 0x80)
+            value >>= 7
+
+        data.append(value)
+
+    @classmethod
+    def ReadSerialized(
+        cls, serialized
+    ):  # pylint: disable=arguments-differ,arguments-renamed
+        """Reads a path specification from serialized form.
+
+        Args:
+          serialized (bytes): binary serialized path specification.
+
+        Returns:
+          PathSpec: a path specification.
+
+        Raises:
+          ValueError: if the serialized form does not contain exactly one path
+              specification or cannot be read.
+        """
+        path_specs = cls.ReadSerializedBatch(serialized)
+        if len(path_specs) != 1:
+            raise ValueError("Unsupported number of path specifications.")
+
+        return path_specs[0]
+
+    @classmethod
+    def ReadSerializedBatch(cls, serialized):
+        """Reads path specifications from serialized form.
+
+        Args:
+          serialized (bytes): binary serialized path specifications.
+
+        Returns:
+          list[PathSpec]: path specifications.
+
+        Raises:
+          ValueError: if the serialized form cannot be read.
+        """
+        format_version = cls._ReadUInt8(serialized, 0)
+        if format_version != cls._FORMAT_VERSION:
+            raise ValueError(f"Unsupported format version: {format_version:d}")
+
+        number_of_records, offset = cls._ReadVariableSizeInteger(serialized, 1)
+
+        records = []
+        for _ in range(number_of_records):
+            path_spec_object, offset = cls._ReadPathSpecRecord(
+                serialized, offset, records
+            )
+            records.append(path_spec_object)
+
+        number_of_path_specs, offset = cls._ReadVariableSizeInteger(serialized, offset)
+
+        path_specs = []
+        for _ in range(number_of_path_specs):
+            record_index, offset = cls._ReadVariableSizeInteger(serialized, offset)
+            if record_index >= number_of_records:
+                raise ValueError(f"Invalid record index: {record_index:d}")
+
+            path_specs.append(records[record_index])
+
+        return path_specs
+
+    @classmethod
+    def WriteSerialized(
+        cls, path_spec_object
+    ):  # pylint: disable=arguments-differ,arguments-renamed
+        """Writes a path specification to serialized form.
+
+        Args:
+          path_spec_object (PathSpec): a path specification.
+
+        Returns:
+          bytes: binary serialized path specification.
+
+        Raises:
+          TypeError: if not an instance of PathSpec or a property value type is
+              not supported.
+        """
+        return cls.WriteSerializedBatch([path_spec_object])
+
+    @classmethod
+    def WriteSerializedBatch(cls, path_specs):
+        """Writes path specifications to serialized form.
+
+        Parent path specifications shared by the path specifications are written
+        only once.
+
+        Args:
+          path_specs (list[PathSpec]): path specifications.
+
+        Returns:
+          bytes: binary serialized path specifications.
+
+        Raises:
+          TypeError: if not an instance of PathSpec or a property value type is
+              not supported.
+        """
+        record_indexes = {}
+        records_data = bytearray()
+        path_spec_record_indexes = []
+
+        for path_spec_object in path_specs:
+            if not isinstance(path_spec_object, path_spec.PathSpec):
+                raise TypeError("Unsupported path specification.")
+
+            # Determine the parent path specifications that have not been written.
+            path_spec_chain = []
+            record_index = None
+            while path_spec_object is not None:
+                comparable = path_spec_object.comparable
+                record_index = record_indexes.get(comparable, None)
+                if record_index is not None:
+                    break
+
+                path_spec_chain.append((comparable, path_spec_object))
+                path_spec_object = getattr(path_spec_object, "parent", None)
+
+            for comparable, path_spec_object in reversed(path_spec_chain):
+                if record_index is None:
+                    parent_reference = 0
+                else:
+                    parent_reference = record_index + 1
+
+                cls._WritePathSpecRecord(
+                    path_spec_object, parent_reference, records_data
+                )
+
+                record_index = len(record_indexes)
+                record_indexes[comparable] = record_index
+
+            path_spec_record_indexes.append(record_index)
+
+        data = bytearray([cls._FORMAT_VERSION])
+        cls._WriteVariableSizeInteger(len(record_indexes), data)
+        data.extend(records_data)
+
+        cls._WriteVariableSizeInteger(len(path_spec_record_indexes), data)
+        for record_index in path_spec_record_indexes:
+            cls._WriteVariableSizeInteger(record_index, data)
+
+        return bytes(data)
@@ -23,6 +23,7 @@ class GPTFileSystem(file_system.FileSystem):
           path_spec (PathSpec): a path specification.
         """
         super().__init__(resolver_context, path_spec)
+        self._entry_index_by_identifier = None
         self._file_object = None
         self._vsgpt_volume = None
 
@@ -34,6 +35,7 @@ class GPTFileSystem(file_system.FileSystem):
         """
         self._vsgpt_volume.close()
         self._vsgpt_volume = None
+        self._entry_index_by_identifier = None
         self._file_object = None
 
     def _Open(self, mode="rb"):
@@ -101,9 +103,13 @@ class GPTFileSystem(file_system.FileSystem):
         entry_index = None
 
         if location[:5] == "/gpt{" and location[-1] == "}":
-            for vsgpt_partition in iter(self._vsgpt_volume.partitions):
-                if vsgpt_partition.identifier == location[5:-1]:
-                    entry_index = vsgpt_partition.entry_index
+            if self._entry_index_by_identifier is None:
+                self._entry_index_by_identifier = {
+                    vsgpt_partition.identifier: vsgpt_partition.entry_index
+                    for vsgpt_partition in iter(self._vsgpt_volume.partitions)
+                }
+
+            entry_index = self._entry_index_by_identifier.get(location[5:-1], None)
 
         elif location[:2] == "/p":
             try:
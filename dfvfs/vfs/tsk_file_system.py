@@ -25,6 +25,7 @@ class TSKFileSystem(file_system.FileSystem):
         """
         super().__init__(resolver_context, path_spec)
         self._file_object = None
+        self._inode_locations = None
         self._tsk_file_system = None
         self._tsk_fs_type = None
 
@@ -36,6 +37,87 @@ class TSKFileSystem(file_system.FileSystem):
         """
         self._tsk_file_system = None
         self._file_object = None
+        self._inode_locations = None
+
+    def _GetInodeLocations(self):
+        """Retrieves the locations of the allocated inodes.
+
+        The locations are determined by walking the directory hierarchy once and
+        cached for subsequent use.
+
+        Returns:
+          dict[int, str]: locations per inode number. Hard linked inodes map to
+              the first location encountered.
+        """
+        if self._inode_locations is None:
+            root_inode = self.GetRootInode()
+
+            inode_locations = {}
+            if root_inode is not None:
+                inode_locations[root_inode] = self.LOCATION_ROOT
+
+            directories = [(root_inode, self.LOCATION_ROOT)]
+            while directories:
+                directory_inode, directory_location = directories.pop()
+
+                try:
+                    if directory_inode is not None:
+                        tsk_directory = self._tsk_file_system.open_dir(
+                            inode=directory_inode
+                        )
+                    else:
+                        tsk_directory = self._tsk_file_system.open_dir(
+                            path=directory_location
+                        )
+                except OSError:
+                    continue
+
+                for tsk_directory_entry in tsk_directory:
+                    # Note that because pytsk3.TSK_FS_FILE does not explicitly define
+                    # meta and name we need to check if the attributes exist and have
+                    # a value other than None.
+                    tsk_fs_file = getattr(tsk_directory_entry, "info", None)
+                    tsk_fs_meta = getattr(tsk_fs_file, "meta", None)
+                    tsk_fs_name = getattr(tsk_fs_file, "name", None)
+                    if tsk_fs_meta is None or tsk_fs_name is None:
+                        continue
+
+                    inode = getattr(tsk_fs_meta, "addr", None)
+                    if inode is None or inode in inode_locations:
+                        continue
+
+                    # On non-NTFS file systems ignore inode 0.
+                    if inode == 0 and not self.IsNTFS():
+                        continue
+
+                    flags = getattr(tsk_fs_name, "flags", 0)
+                    if int(flags) & pytsk3.TSK_FS_NAME_FLAG_UNALLOC:
+                        continue
+
+                    try:
+                        # pytsk3 returns an UTF-8 encoded byte string.
+                        name = getattr(tsk_fs_name, "name", b"").decode("utf8")
+                    except UnicodeError:
+                        continue
+
+                    if not name or name in (".", ".."):
+                        continue
+
+                    location = self.JoinPath([directory_location, name])
+                    inode_locations[inode] = location
+
+                    tsk_fs_meta_type = getattr(
+                        tsk_fs_meta, "type", pytsk3.TSK_FS_META_TYPE_UNDEF
+                    )
+                    if tsk_fs_meta_type in (
+                        pytsk3.TSK_FS_META_TYPE_DIR,
+                        pytsk3.TSK_FS_META_TYPE_VIRT_DIR,
+                    ):
+                        directories.append((inode, location))
+
+            self._inode_locations = inode_locations
+
+        return self._inode_locations
 
     def _Open(self, mode="rb"):
         """Opens the file system object defined by path specification.
@@ -87,6 +169,73 @@ class TSKFileSystem(file_system.FileSystem):
 
         return tsk_file is not None
 
+    def GetFileEntriesByInode(self, allocated_only=False, resolve_locations=False):
+        """Retrieves file entries in inode order.
+
+        Walking the metadata table in inode order results in more sequential
+        reads than walking the directory hierarchy and also includes unallocated
+        (deleted) and orphan inodes.
+
+        Args:
+          allocated_only (Optional[bool]): True if only allocated inodes should
+              be included.
+          resolve_locations (Optional[bool]): True if the locations of the inodes
+              should be determined. Since this requires a walk of the directory
+              hierarchy, it is disabled by default. Inodes without a location,
+              such as orphan inodes, have no location set.
+
+        Yields:
+          TSKFileEntry: a file entry.
+        """
+        tsk_fs_info = getattr(self._tsk_file_system, "info", None)
+        first_inode = getattr(tsk_fs_info, "first_inum", None)
+        last_inode = getattr(tsk_fs_info, "last_inum", None)
+        if first_inode is None or last_inode is None:
+            return
+
+        inode_locations = {}
+        if resolve_locations:
+            inode_locations = self._GetInodeLocations()
+
+        root_inode = self.GetRootInode()
+        parent_path_spec = self._path_spec.parent
+
+        for inode in range(first_inode, last_inode + 1):
+            try:
+                tsk_file = self._tsk_file_system.open_meta(inode=inode)
+            except OSError:
+                continue
+
+            # Note that because pytsk3.TSK_FS_FILE does not explicitly define meta
+            # we need to check if the attribute exists and has a value other than
+            # None.
+            tsk_fs_meta = getattr(tsk_file.info, "meta", None)
+            if tsk_fs_meta is None:
+                continue
+
+            # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+            flags = int(getattr(tsk_fs_meta, "flags", 0))
+            if flags & pytsk3.TSK_FS_META_FLAG_UNUSED:
+                continue
+
+            if allocated_only and not flags & pytsk3.TSK_FS_META_FLAG_ALLOC:
+                continue
+
+            kwargs = {"inode": inode, "parent": parent_path_spec}
+
+            location = inode_locations.get(inode, None)
+            if location is not None:
+                kwargs["location"] = location
+
+            path_spec = tsk_path_spec.TSKPathSpec(**kwargs)
+            yield tsk_file_entry.TSKFileEntry(
+                self._resolver_context,
+                self,
+                path_spec,
+                is_root=bool(inode == root_inode),
+                tsk_file=tsk_file,
+            )
+
     def GetFileEntryByPathSpec(self, path_spec):
         """Retrieves a file entry for a path specification.
 
@@ -152,6 +301,14 @@ class TSKFileSystem(file_system.FileSystem):
 
         return self._tsk_fs_type
 
+    def GetImageFileObject(self):
+        """Retrieves the file-like object of the file system image.
+
+        Returns:
+          FileIO: file-like object of the file system image.
+        """
+        return self._file_object
+
     def GetRootFileEntry(self):
         """Retrieves the root file entry.
 
@@ -39,7 +39,7 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
         """
         tsk_volume = file_system.GetTSKVolume()
         if not is_virtual and tsk_vs_part is None:
-            tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(tsk_volume, path_spec)
+            tsk_vs_part, _ = file_system.GetTSKVsPartByPathSpec(path_spec)
         if not is_virtual and tsk_vs_part is None:
             raise errors.BackEndError(
                 "Missing TSK volume system part in non-virtual file entry."
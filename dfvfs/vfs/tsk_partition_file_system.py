@@ -27,6 +27,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         super().__init__(resolver_context, path_spec)
         self._file_object = None
         self._tsk_volume = None
+        self._tsk_vs_part_table = None
 
     def _Close(self):
         """Closes the file system object.
@@ -35,6 +36,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
           OSError: if the close failed.
         """
         self._tsk_volume = None
+        self._tsk_vs_part_table = None
         self._file_object = None
 
     def _Open(self, mode="rb"):
@@ -63,6 +65,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
 
         self._file_object = file_object
         self._tsk_volume = tsk_volume
+        self._tsk_vs_part_table = tsk_partition.TSKVsPartTable(tsk_volume)
 
     def FileEntryExistsByPathSpec(self, path_spec):
         """Determines if a file entry for a path specification exists.
@@ -73,9 +76,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         Returns:
           bool: True if the file entry exists or false otherwise.
         """
-        tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-            self._tsk_volume, path_spec
-        )
+        tsk_vs_part, _ = self._tsk_vs_part_table.GetTSKVsPartByPathSpec(path_spec)
         # The virtual root file has no corresponding TSK volume system part object but
         # should have a location.
         if tsk_vs_part is None:
@@ -93,8 +94,8 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         Returns:
           TSKPartitionFileEntry: a file entry or None of not available.
         """
-        tsk_vs_part, partition_index = tsk_partition.GetTSKVsPartByPathSpec(
-            self._tsk_volume, path_spec
+        tsk_vs_part, partition_index = self._tsk_vs_part_table.GetTSKVsPartByPathSpec(
+            path_spec
         )
         location = getattr(path_spec, "location", None)
 
@@ -133,3 +134,18 @@ class TSKPartitionFileSystem(file_system.FileSystem):
           pytsk3.Volume_Info: a TSK volume object.
         """
         return self._tsk_volume
+
+    def GetTSKVsPartByPathSpec(self, path_spec):
+        """Retrieves the TSK volume system part object.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          tuple: containing:
+
+            pytsk3.TSK_VS_PART_INFO: TSK volume system part information or
+                None on error.
+            int: partition index or None if not available.
+        """
+        return self._tsk_vs_part_table.GetTSKVsPartByPathSpec(path_spec)
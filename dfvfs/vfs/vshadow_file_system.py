@@ -16,6 +16,9 @@ class VShadowFileSystem(file_system.FileSystem):
 
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_VSHADOW
 
+    # The size of a VSS block.
+    _BLOCK_SIZE = 0x4000
+
     def __init__(self, resolver_context, path_spec):
         """Initializes a file system.
 
@@ -24,7 +27,9 @@ class VShadowFileSystem(file_system.FileSystem):
           path_spec (PathSpec): a path specification.
         """
         super().__init__(resolver_context, path_spec)
+        self._preserved_block_ranges = {}
         self._file_object = None
+        self._store_block_offsets = {}
         self._vshadow_volume = None
 
     def _Close(self):
@@ -37,6 +42,36 @@ class VShadowFileSystem(file_system.FileSystem):
         self._vshadow_volume = None
         self._file_object = None
 
+        self._preserved_block_ranges = {}
+        self._store_block_offsets = {}
+
+    def _GetStoreBlockOffsets(self, store_index):
+        """Retrieves the volume offsets of the blocks stored in a VSS store.
+
+        Args:
+          store_index (int): store index.
+
+        Returns:
+          frozenset[int]: volume offsets of the blocks, which are aligned to
+              the block size, or None if the store has no in-volume stored data.
+        """
+        if store_index in self._store_block_offsets:
+            return self._store_block_offsets[store_index]
+
+        vshadow_store = self._vshadow_volume.get_store(store_index)
+
+        block_offsets = None
+        if vshadow_store.has_in_volume_data():
+            block_offsets = frozenset(
+                vshadow_block.original_offset
+                - (vshadow_block.original_offset % self._BLOCK_SIZE)
+                for vshadow_block in vshadow_store.blocks
+            )
+
+        self._store_block_offsets[store_index] = block_offsets
+
+        return block_offsets
+
     def _Open(self, mode="rb"):
         """Opens the file system object defined by path specification.
 
@@ -82,6 +117,85 @@ class VShadowFileSystem(file_system.FileSystem):
 
         return 0 <= store_index < self._vshadow_volume.number_of_stores
 
+    def GetPreservedBlockRangesByPathSpec(self, path_spec):
+        """Retrieves the byte ranges of the blocks preserved for a VSS store.
+
+        The ranges consist of the blocks that were overwritten on the volume after
+        the VSS store was created, of which the original data is preserved in the
+        VSS store or in one of the VSS stores created after it, and the data of the
+        VSS store beyond the end of the volume.
+
+        Note that the ranges are not the complete set of differences between the
+        VSS store and the volume. Blocks that were not in use when the VSS store
+        was created read as zero bytes, which cannot be determined since
+        pyvshadow does not expose the store bitmaps. Also note that the ranges are
+        determined per block and can contain data that did not change.
+
+        Args:
+          path_spec (PathSpec): path specification.
+
+        Returns:
+          list[tuple[int, int]]: offset and size of the ranges, sorted by offset,
+              or None if not available.
+        """
+        store_index = vshadow_helper.VShadowPathSpecGetStoreIndex(path_spec)
+        if store_index is None:
+            return None
+
+        number_of_stores = self._vshadow_volume.number_of_stores
+        if store_index < 0 or store_index >= number_of_stores:
+            return None
+
+        if store_index in self._preserved_block_ranges:
+            return self._preserved_block_ranges[store_index]
+
+        # The data of a block that was changed after the VSS store was created
+        # is stored in the VSS store or in one of the VSS stores created after
+        # it.
+        block_offsets = set()
+        for other_store_index in range(store_index, number_of_stores):
+            store_block_offsets = self._GetStoreBlockOffsets(other_store_index)
+            if store_block_offsets is None:
+                block_offsets = None
+                break
+
+            block_offsets.update(store_block_offsets)
+
+        block_ranges = None
+        if block_offsets is not None:
+            vshadow_store = self._vshadow_volume.get_store(store_index)
+            store_volume_size = vshadow_store.volume_size
+            volume_size = self._file_object.get_size()
+
+            block_ranges = []
+            for block_offset in sorted(block_offsets):
+                if block_offset >= store_volume_size:
+                    break
+
+                range_end_offset = min(
+                    block_offset + self._BLOCK_SIZE, store_volume_size
+                )
+                if block_ranges and block_ranges[-1][1] == block_offset:
+                    block_ranges[-1][1] = range_end_offset
+                else:
+                    block_ranges.append([block_offset, range_end_offset])
+
+            # Data of the VSS store beyond the end of the volume is not shared.
+            if store_volume_size > volume_size:
+                if block_ranges and block_ranges[-1][1] >= volume_size:
+                    block_ranges[-1][1] = store_volume_size
+                else:
+                    block_ranges.append([volume_size, store_volume_size])
+
+            block_ranges = [
+                (range_offset, range_end_offset - range_offset)
+                for range_offset, range_end_offset in block_ranges
+            ]
+
+        self._preserved_block_ranges[store_index] = block_ranges
+
+        return block_ranges
+
     def GetFileEntryByPathSpec(self, path_spec):
         """Retrieves a file entry for a path specification.
 
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """Tests for the format analyzer."""
 
+import collections
+from concurrent import futures
 import unittest
 
 from dfvfs.analyzer import analyzer
 from dfvfs.analyzer import analyzer_helper
+from dfvfs.analyzer import probe_cache
 from dfvfs.analyzer import specification
 from dfvfs.lib import definitions
 from dfvfs.path import gzip_path_spec
+from dfvfs.path import modi_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import raw_path_spec
@@ -49,6 +53,28 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         """Tests the _FlushCache function."""
         analyzer.Analyzer._FlushCache(definitions.FORMAT_CATEGORIES)
 
+    def testGetCategoryScanner(self):
+        """Tests the _GetCategoryScanner function."""
+        signature_scanner, specification_store, remainder_list = (
+            analyzer.Analyzer._GetCategoryScanner(
+                definitions.FORMAT_CATEGORY_VOLUME_SYSTEM
+            )
+        )
+        self.assertIsNotNone(signature_scanner)
+        self.assertIsNotNone(specification_store)
+        self.assertIsNotNone(remainder_list)
+
+        self.assertIn(
+            definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+            analyzer.Analyzer._category_scanners,
+        )
+
+        analyzer.Analyzer._FlushCache([definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+        self.assertNotIn(
+            definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+            analyzer.Analyzer._category_scanners,
+        )
+
     def testGetSignatureScanner(self):
         """Tests the _GetSignatureScanner function."""
         specification_store = specification.FormatSpecificationStore()
@@ -56,6 +82,130 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         signature_scanner = analyzer.Analyzer._GetSignatureScanner(specification_store)
         self.assertIsNotNone(signature_scanner)
 
+        specification_store = specification.FormatSpecificationStore()
+        format_specification = specification.FormatSpecification("test")
+        format_specification.AddNewSignature(b"test", offset=0)
+        specification_store.AddSpecification(format_specification)
+
+        signature_scanner = analyzer.Analyzer._GetSignatureScanner(specification_store)
+        self.assertIsNotNone(signature_scanner)
+
+        # A signature scanner is reused for specification stores with the same
+        # signatures.
+        specification_store = specification.FormatSpecificationStore()
+        format_specification = specification.FormatSpecification("test")
+        format_specification.AddNewSignature(b"test", offset=0)
+        specification_store.AddSpecification(format_specification)
+
+        test_signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+            specification_store
+        )
+        self.assertIs(test_signature_scanner, signature_scanner)
+
+    def testGetSignatureScannerWithMaximumNumberOfSignatureScanners(self):
+        """Tests the _GetSignatureScanner function evicts signature scanners."""
+        maximum_number_of_signature_scanners = (
+            analyzer.Analyzer._MAXIMUM_NUMBER_OF_SIGNATURE_SCANNERS
+        )
+        signature_scanners = analyzer.Analyzer._signature_scanners
+        analyzer.Analyzer._signature_scanners = collections.OrderedDict()
+
+        try:
+            specification_stores = []
+            for index in range(maximum_number_of_signature_scanners + 1):
+                specification_store = specification.FormatSpecificationStore()
+                format_specification = specification.FormatSpecification("test")
+                format_specification.AddNewSignature(
+                    f"test{index:d}".encode("ascii"), offset=0
+                )
+                specification_store.AddSpecification(format_specification)
+                specification_stores.append(specification_store)
+
+            first_signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+                specification_stores[0]
+            )
+            second_signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+                specification_stores[1]
+            )
+            for specification_store in specification_stores[2:-1]:
+                analyzer.Analyzer._GetSignatureScanner(specification_store)
+
+            # Using a signature scanner makes it the most recently used.
+            test_signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+                specification_stores[0]
+            )
+            self.assertIs(test_signature_scanner, first_signature_scanner)
+
+            analyzer.Analyzer._GetSignatureScanner(specification_stores[-1])
+            self.assertEqual(
+                len(analyzer.Analyzer._signature_scanners),
+                maximum_number_of_signature_scanners,
+            )
+
+            # The least recently used signature scanner was evicted.
+            test_signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+                specification_stores[1]
+            )
+            self.assertIsNot(test_signature_scanner, second_signature_scanner)
+
+            test_signature_scanner = analyzer.Analyzer._GetSignatureScanner(
+                specification_stores[0]
+            )
+            self.assertIs(test_signature_scanner, first_signature_scanner)
+
+        finally:
+            analyzer.Analyzer._signature_scanners = signature_scanners
+
+    def testGetSignatureScannerWithThreads(self):
+        """Tests the _GetSignatureScanner function on multiple threads."""
+        maximum_number_of_signature_scanners = (
+            analyzer.Analyzer._MAXIMUM_NUMBER_OF_SIGNATURE_SCANNERS
+        )
+        signature_scanners = analyzer.Analyzer._signature_scanners
+        analyzer.Analyzer._signature_scanners = collections.OrderedDict()
+
+        try:
+            specification_stores = []
+            for index in range(maximum_number_of_signature_scanners + 1):
+                specification_store = specification.FormatSpecificationStore()
+                format_specification = specification.FormatSpecification("test")
+                format_specification.AddNewSignature(
+                    f"test{index:d}".encode("ascii"), offset=0
+                )
+                specification_store.AddSpecification(format_specification)
+                specification_stores.append(specification_store)
+
+            # Every thread evicts signature scanners used by the other threads.
+            with futures.ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(
+                        analyzer.Analyzer._GetSignatureScanner,
+                        specification_stores * 20,
+                    )
+                )
+
+            self.assertEqual(len(results), len(specification_stores) * 20)
+            self.assertEqual(
+                len(analyzer.Analyzer._signature_scanners),
+                maximum_number_of_signature_scanners,
+            )
+
+        finally:
+            analyzer.Analyzer._signature_scanners = signature_scanners
+
+    def testGetSignatureTable(self):
+        """Tests the _GetSignatureTable function."""
+        specification_store = specification.FormatSpecificationStore()
+        format_specification = specification.FormatSpecification("test")
+        format_specification.AddNewSignature(b"test", offset=-8)
+        format_specification.AddNewSignature(b"tset")
+        specification_store.AddSpecification(format_specification)
+
+        signature_table = analyzer.Analyzer._GetSignatureTable(specification_store)
+        self.assertEqual(
+            signature_table, (("test:0", -8, b"test"), ("test:1", None, b"tset"))
+        )
+
     def testGetSpecificationStore(self):
         """Tests the _GetSpecificationStore function."""
         specification_store = analyzer.Analyzer._GetSpecificationStore(
@@ -65,6 +215,19 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
 
     # TODO: add tests for _GetTypeIndicators
 
+    def testRemoveFallbackTypeIndicators(self):
+        """Tests the _RemoveFallbackTypeIndicators function."""
+        type_indicators = [definitions.TYPE_INDICATOR_TSK_PARTITION]
+        analyzer.Analyzer._RemoveFallbackTypeIndicators(type_indicators)
+        self.assertEqual(type_indicators, [definitions.TYPE_INDICATOR_TSK_PARTITION])
+
+        type_indicators = [
+            definitions.TYPE_INDICATOR_GPT,
+            definitions.TYPE_INDICATOR_TSK_PARTITION,
+        ]
+        analyzer.Analyzer._RemoveFallbackTypeIndicators(type_indicators)
+        self.assertEqual(type_indicators, [definitions.TYPE_INDICATOR_GPT])
+
     def testHelperRegistration(self):
         """Tests the DeregisterHelper and RegisterHelper functions."""
         test_helper = TestAnalyzerHelper()
@@ -81,6 +244,36 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         analyzer.Analyzer.DeregisterHelper(test_helper)
         self.assertEqual(len(analyzer.Analyzer._analyzer_helpers), number_of_helpers)
 
+    def testPrebuildSignatureScanner(self):
+        """Tests the PrebuildSignatureScanner function."""
+        format_category = definitions.FORMAT_CATEGORY_VOLUME_SYSTEM
+
+        analyzer.Analyzer.PrebuildSignatureScanner([format_category])
+        self.assertIn(format_category, analyzer.Analyzer._category_scanners)
+
+        signature_scanner, _, _ = analyzer.Analyzer._category_scanners[format_category]
+
+        # Registering an analyzer helper without a format specification does not
+        # change the signature scanner.
+        test_helper = TestAnalyzerHelper()
+        analyzer.Analyzer.RegisterHelper(test_helper)
+
+        try:
+            self.assertNotIn(format_category, analyzer.Analyzer._category_scanners)
+
+            analyzer.Analyzer.PrebuildSignatureScanner([format_category])
+            test_signature_scanner, _, remainder_list = (
+                analyzer.Analyzer._category_scanners[format_category]
+            )
+            self.assertIs(test_signature_scanner, signature_scanner)
+            self.assertIn(test_helper, remainder_list)
+
+        finally:
+            analyzer.Analyzer.DeregisterHelper(test_helper)
+
+        with self.assertRaises(ValueError):
+            analyzer.Analyzer.PrebuildSignatureScanner([99])
+
     def testGetArchiveTypeIndicatorsTAR(self):
         """Tests the GetArchiveTypeIndicators function on a .tar file."""
         test_file = self._GetTestFilePath(["tar", "syslog.tar"])
@@ -351,6 +544,88 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         )
         self.assertEqual(type_indicators, expected_type_indicators)
 
+    def testGetTypeIndicatorsForCategories(self):
+        """Tests the GetTypeIndicatorsForCategories function."""
+        test_file = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_file)
+
+        path_spec = os_path_spec.OSPathSpec(location=test_file)
+        path_spec = raw_path_spec.RawPathSpec(parent=path_spec)
+
+        type_indicators = analyzer.Analyzer.GetTypeIndicatorsForCategories(
+            path_spec,
+            [
+                definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+                definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+            ],
+        )
+        expected_type_indicators = {
+            definitions.FORMAT_CATEGORY_FILE_SYSTEM: (
+                analyzer.Analyzer.GetFileSystemTypeIndicators(path_spec)
+            ),
+            definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: (
+                analyzer.Analyzer.GetVolumeSystemTypeIndicators(path_spec)
+            ),
+        }
+        self.assertEqual(type_indicators, expected_type_indicators)
+        self.assertIn(
+            definitions.PREFERRED_HFS_BACK_END,
+            type_indicators[definitions.FORMAT_CATEGORY_FILE_SYSTEM],
+        )
+
+        test_probe_cache = probe_cache.ProbeCache()
+        type_indicators = analyzer.Analyzer.GetTypeIndicatorsForCategories(
+            path_spec,
+            [
+                definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+                definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+            ],
+            probe_cache=test_probe_cache,
+        )
+        self.assertEqual(type_indicators, expected_type_indicators)
+
+        # Signatures of different format categories that match at nearby offsets,
+        # such as FAT at offset 510 and GPT at offset 512, are all detected.
+        test_file = self._GetTestFilePath(["hfsplus_zlib.dmg"])
+        self._SkipIfPathNotExists(test_file)
+
+        path_spec = os_path_spec.OSPathSpec(location=test_file)
+        path_spec = modi_path_spec.MODIPathSpec(parent=path_spec)
+
+        type_indicators = analyzer.Analyzer.GetTypeIndicatorsForCategories(
+            path_spec,
+            [
+                definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+                definitions.FORMAT_CATEGORY_VOLUME_SYSTEM,
+            ],
+            probe_cache=probe_cache.ProbeCache(),
+        )
+        expected_type_indicators = {
+            definitions.FORMAT_CATEGORY_FILE_SYSTEM: (
+                analyzer.Analyzer.GetFileSystemTypeIndicators(path_spec)
+            ),
+            definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: [definitions.TYPE_INDICATOR_GPT],
+        }
+        self.assertEqual(type_indicators, expected_type_indicators)
+
+        test_file = self._GetTestFilePath(["ext2.qcow2"])
+        self._SkipIfPathNotExists(test_file)
+
+        path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+        type_indicators = analyzer.Analyzer.GetTypeIndicatorsForCategories(
+            path_spec, [definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE]
+        )
+        expected_type_indicators = {
+            definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+                definitions.TYPE_INDICATOR_QCOW
+            ]
+        }
+        self.assertEqual(type_indicators, expected_type_indicators)
+
+        with self.assertRaises(ValueError):
+            analyzer.Analyzer.GetTypeIndicatorsForCategories(path_spec, [99])
+
     def testGetVolumeSystemTypeIndicatorsAPM(self):
         """Tests the GetVolumeSystemTypeIndicators function on APM partitions."""
         test_file = self._GetTestFilePath(["apm.dmg"])
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Tests for the sampler that classifies blocks of a file-like object."""
+
+import io
+import unittest
+
+from dfvfs.analyzer import block_sampler
+from dfvfs.lib import definitions
+
+from tests import test_lib as shared_test_lib
+
+
+class TestFileObject(io.BytesIO):
+    """File-like object for testing."""
+
+    # pylint: disable=invalid-name
+
+    def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the file-like object data.
+        """
+        return len(self.getbuffer())
+
+
+class BlockMapTest(shared_test_lib.BaseTestCase):
+    """Tests for the block map."""
+
+    def testGetRegions(self):
+        """Tests the GetRegions function."""
+        samples = [
+            block_sampler.BlockSample(0, definitions.BLOCK_TYPE_STRUCTURED, 4.0),
+            block_sampler.BlockSample(1024, definitions.BLOCK_TYPE_ZERO, 0.0),
+            block_sampler.BlockSample(2048, definitions.BLOCK_TYPE_ZERO, 0.0),
+            block_sampler.BlockSample(3072, definitions.BLOCK_TYPE_HIGH_ENTROPY, 8.0),
+        ]
+        block_map = block_sampler.BlockMap(4096, 512, samples)
+
+        expected_regions = [
+            (0, 1024, definitions.BLOCK_TYPE_STRUCTURED),
+            (1024, 2048, definitions.BLOCK_TYPE_ZERO),
+            (3072, 1024, definitions.BLOCK_TYPE_HIGH_ENTROPY),
+        ]
+        self.assertEqual(list(block_map.GetRegions()), expected_regions)
+
+        block_map = block_sampler.BlockMap(4096, 512, [])
+        self.assertEqual(list(block_map.GetRegions()), [])
+
+
+class BlockSamplerTest(shared_test_lib.BaseTestCase):
+    """Tests for the block sampler."""
+
+    # pylint: disable=protected-access
+
+    _HIGH_ENTROPY_BLOCK = bytes(range(256)) * 4
+
+    _STRUCTURED_BLOCK = b"structured data " * 64
+
+    _ZERO_BLOCK = bytes(1024)
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with self.assertRaises(ValueError):
+            block_sampler.BlockSampler(block_size=0)
+
+        with self.assertRaises(ValueError):
+            block_sampler.BlockSampler(entropy_threshold=9.0)
+
+        with self.assertRaises(ValueError):
+            block_sampler.BlockSampler(maximum_number_of_samples=0)
+
+    def testClassifyBlocks(self):
+        """Tests the _ClassifyBlocks function."""
+        test_block_sampler = block_sampler.BlockSampler()
+
+        results = test_block_sampler._ClassifyBlocks(
+            [self._HIGH_ENTROPY_BLOCK, self._STRUCTURED_BLOCK, self._ZERO_BLOCK]
+        )
+        block_types = [block_type for block_type, _ in results]
+        self.assertEqual(
+            block_types,
+            [
+                definitions.BLOCK_TYPE_HIGH_ENTROPY,
+                definitions.BLOCK_TYPE_STRUCTURED,
+                definitions.BLOCK_TYPE_ZERO,
+            ],
+        )
+        self.assertAlmostEqual(results[0][1], 8.0)
+        self.assertAlmostEqual(results[2][1], 0.0)
+
+    @unittest.skipIf(block_sampler.numpy is None, "requires NumPy")
+    def testClassifyBlocksWithNumPy(self):
+        """Tests the _ClassifyBlocksWithNumPy function."""
+        test_block_sampler = block_sampler.BlockSampler()
+
+        results = test_block_sampler._ClassifyBlocksWithNumPy(
+            [self._HIGH_ENTROPY_BLOCK, self._STRUCTURED_BLOCK, self._ZERO_BLOCK]
+        )
+        block_types = [block_type for block_type, _ in results]
+        self.assertEqual(
+            block_types,
+            [
+                definitions.BLOCK_TYPE_HIGH_ENTROPY,
+                definitions.BLOCK_TYPE_STRUCTURED,
+                definitions.BLOCK_TYPE_ZERO,
+            ],
+        )
+        self.assertAlmostEqual(results[0][1], 8.0)
+        self.assertAlmostEqual(results[2][1], 0.0)
+
+    def testGetBlockOffsets(self):
+        """Tests the _GetBlockOffsets function."""
+        test_block_sampler = block_sampler.BlockSampler(
+            block_size=1024, maximum_number_of_samples=4
+        )
+
+        self.assertEqual(test_block_sampler._GetBlockOffsets(512), [0])
+        self.assertEqual(test_block_sampler._GetBlockOffsets(3000), [0, 1024])
+        self.assertEqual(
+            test_block_sampler._GetBlockOffsets(10 * 1024), [0, 3072, 6144, 9216]
+        )
+
+        test_block_sampler = block_sampler.BlockSampler(
+            block_size=1024, maximum_number_of_samples=1
+        )
+        self.assertEqual(test_block_sampler._GetBlockOffsets(10 * 1024), [0])
+
+    def testGetBlockType(self):
+        """Tests the _GetBlockType function."""
+        test_block_sampler = block_sampler.BlockSampler()
+
+        block_type = test_block_sampler._GetBlockType(self._ZERO_BLOCK, 0.0)
+        self.assertEqual(block_type, definitions.BLOCK_TYPE_ZERO)
+
+        block_type = test_block_sampler._GetBlockType(self._HIGH_ENTROPY_BLOCK, 8.0)
+        self.assertEqual(block_type, definitions.BLOCK_TYPE_HIGH_ENTROPY)
+
+        block_type = test_block_sampler._GetBlockType(self._STRUCTURED_BLOCK, 3.5)
+        self.assertEqual(block_type, definitions.BLOCK_TYPE_STRUCTURED)
+
+    def testSampleFileObject(self):
+        """Tests the SampleFileObject function."""
+        test_block_sampler = block_sampler.BlockSampler(
+            block_size=1024, maximum_number_of_samples=4
+        )
+
+        test_data = b"".join(
+            [
+                self._STRUCTURED_BLOCK,
+                self._ZERO_BLOCK * 3,
+                self._HIGH_ENTROPY_BLOCK * 3,
+                self._ZERO_BLOCK * 3,
+            ]
+        )
+        file_object = TestFileObject(test_data)
+
+        block_map = test_block_sampler.SampleFileObject(file_object)
+        self.assertIsNotNone(block_map)
+        self.assertEqual(block_map.block_size, 1024)
+        self.assertEqual(block_map.size, 10 * 1024)
+
+        expected_regions = [
+            (0, 3072, definitions.BLOCK_TYPE_STRUCTURED),
+            (3072, 3072, definitions.BLOCK_TYPE_ZERO),
+            (6144, 3072, definitions.BLOCK_TYPE_HIGH_ENTROPY),
+            (9216, 1024, definitions.BLOCK_TYPE_ZERO),
+        ]
+        self.assertEqual(list(block_map.GetRegions()), expected_regions)
+
+        # A file-like object that is smaller than the block size is sampled as
+        # a single block.
+        file_object = TestFileObject(self._STRUCTURED_BLOCK[:100])
+
+        block_map = test_block_sampler.SampleFileObject(file_object)
+        self.assertIsNotNone(block_map)
+        self.assertEqual(block_map.block_size, 100)
+        self.assertEqual(len(block_map.samples), 1)
+
+        file_object = TestFileObject(b"")
+
+        block_map = test_block_sampler.SampleFileObject(file_object)
+        self.assertIsNone(block_map)
+
+
+if __name__ == "__main__":
+    unittest.main()
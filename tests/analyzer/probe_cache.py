@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Tests for the cache of data probed by format analysis."""
+
+import io
+import os
+import unittest
+
+from dfvfs.analyzer import probe_cache
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class TestFileObject(io.BytesIO):
+    """File-like object that tracks the number of reads for testing."""
+
+    def __init__(self, data):
+        """Initializes a file-like object.
+
+        Args:
+          data (bytes): data.
+        """
+        super().__init__(data)
+        self.number_of_reads = 0
+
+    # pylint: disable=invalid-name
+
+    def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the file-like object data.
+        """
+        return len(self.getbuffer())
+
+    def read(self, size=-1):
+        """Reads a byte string from the file-like object at the current offset.
+
+        Args:
+          size (Optional[int]): number of bytes to read.
+
+        Returns:
+          bytes: data read.
+        """
+        self.number_of_reads += 1
+        return super().read(size)
+
+
+class ProbeFileObjectTest(shared_test_lib.BaseTestCase):
+    """Tests for the probe file-like object."""
+
+    _TEST_DATA = bytes(range(256)) * 64
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        test_file_object = TestFileObject(self._TEST_DATA)
+
+        with self.assertRaises(ValueError):
+            probe_cache.ProbeFileObject(test_file_object, head_size=-1)
+
+        with self.assertRaises(ValueError):
+            probe_cache.ProbeFileObject(test_file_object, tail_size=-1)
+
+    def testRead(self):
+        """Tests the read function."""
+        test_file_object = TestFileObject(self._TEST_DATA)
+
+        file_object = probe_cache.ProbeFileObject(
+            test_file_object, head_size=1024, tail_size=1024
+        )
+        self.assertEqual(file_object.get_size(), len(self._TEST_DATA))
+        self.assertEqual(test_file_object.number_of_reads, 2)
+
+        self.assertEqual(file_object.read(16), self._TEST_DATA[:16])
+        self.assertEqual(file_object.get_offset(), 16)
+
+        file_object.seek(-16, os.SEEK_END)
+        self.assertEqual(file_object.read(), self._TEST_DATA[-16:])
+        self.assertEqual(file_object.read(16), b"")
+        self.assertEqual(test_file_object.number_of_reads, 2)
+
+        # Data that is not cached is read from the underlying file-like object.
+        file_object.seek(8192, os.SEEK_SET)
+        self.assertEqual(file_object.read(16), self._TEST_DATA[8192:8208])
+        self.assertEqual(test_file_object.number_of_reads, 3)
+
+        file_object.CacheRange(8192, 16)
+        self.assertEqual(test_file_object.number_of_reads, 4)
+
+        file_object.seek(8192, os.SEEK_SET)
+        self.assertEqual(file_object.read(16), self._TEST_DATA[8192:8208])
+        self.assertEqual(test_file_object.number_of_reads, 4)
+
+        # Caching a range that is already cached does not read data.
+        file_object.CacheRange(0, 512)
+        self.assertEqual(test_file_object.number_of_reads, 4)
+
+    def testSeek(self):
+        """Tests the seek function."""
+        test_file_object = TestFileObject(self._TEST_DATA)
+
+        file_object = probe_cache.ProbeFileObject(test_file_object)
+
+        file_object.seek(32, os.SEEK_SET)
+        file_object.seek(16, os.SEEK_CUR)
+        self.assertEqual(file_object.tell(), 48)
+
+        with self.assertRaises(OSError):
+            file_object.seek(-1, os.SEEK_SET)
+
+        with self.assertRaises(OSError):
+            file_object.seek(0, 10)
+
+
+class ProbeCacheTest(shared_test_lib.BaseTestCase):
+    """Tests for the probe cache."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with self.assertRaises(ValueError):
+            probe_cache.ProbeCache(head_size=-1)
+
+        with self.assertRaises(ValueError):
+            probe_cache.ProbeCache(tail_size=-1)
+
+    def testGetFileObject(self):
+        """Tests the GetFileObject function."""
+        test_path = self._GetTestFilePath(["ext2.qcow2"])
+        self._SkipIfPathNotExists(test_path)
+
+        resolver_context = context.Context()
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+
+        test_probe_cache = probe_cache.ProbeCache()
+
+        file_object = test_probe_cache.GetFileObject(
+            path_spec, resolver_context=resolver_context
+        )
+        self.assertIsNotNone(file_object)
+        self.assertEqual(file_object.read(4), b"QFI\xfb")
+
+        test_file_object = test_probe_cache.GetFileObject(
+            path_spec, resolver_context=resolver_context
+        )
+        self.assertIs(test_file_object, file_object)
+        self.assertEqual(test_file_object.get_offset(), 0)
+
+        test_probe_cache.Empty()
+
+        test_file_object = test_probe_cache.GetFileObject(
+            path_spec, resolver_context=resolver_context
+        )
+        self.assertIsNot(test_file_object, file_object)
+
+        resolver_context.Empty()
+
+
+if __name__ == "__main__":
+    unittest.main()
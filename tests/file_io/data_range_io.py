@@ -45,6 +45,33 @@ class DataRangeTest(test_lib.SylogTestCase):
 
         self.assertEqual(file_object.get_size(), 1080)
 
+    def testGetParentFileObjects(self):
+        """Test the _GetParentFileObjects function."""
+        file_object = data_range_io.DataRange(
+            self._resolver_context, self._data_range_path_spec
+        )
+        file_object.Open()
+
+        parent_file_objects = file_object._GetParentFileObjects()
+        self.assertEqual(len(parent_file_objects), 1)
+        self.assertIs(parent_file_objects[0], file_object._file_object)
+
+    def testSetAccessPattern(self):
+        """Test the SetAccessPattern function."""
+        file_object = data_range_io.DataRange(
+            self._resolver_context, self._data_range_path_spec
+        )
+
+        with self.assertRaises(OSError):
+            file_object.SetAccessPattern(definitions.ACCESS_PATTERN_SEQUENTIAL)
+
+        file_object.Open()
+
+        file_object.SetAccessPattern(definitions.ACCESS_PATTERN_SEQUENTIAL)
+
+        with self.assertRaises(ValueError):
+            file_object.SetAccessPattern("bogus")
+
     def testSetRange(self):
         """Test the _SetRange function."""
         file_object = data_range_io.DataRange(
@@ -75,6 +75,24 @@ class OSFileTest(shared_test_lib.BaseTestCase):
             file_object = os_file_io.OSFile(self._resolver_context, path_spec)
             file_object.Open()
 
+    def testSetAccessPattern(self):
+        """Test the SetAccessPattern function."""
+        file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+
+        # Try SetAccessPattern without the file object being open.
+        with self.assertRaises(OSError):
+            file_object.SetAccessPattern(definitions.ACCESS_PATTERN_SEQUENTIAL)
+
+        file_object.Open()
+
+        for access_pattern in sorted(definitions.ACCESS_PATTERNS):
+            file_object.SetAccessPattern(access_pattern)
+
+        self.assertEqual(file_object.read(5), b"place")
+
+        with self.assertRaises(ValueError):
+            file_object.SetAccessPattern("bogus")
+
     def testSeek(self):
         """Test the seek functionality."""
         file_object = os_file_io.OSFile(self._resolver_context, self._path_spec2)
@@ -165,6 +183,59 @@ class OSFileTest(shared_test_lib.BaseTestCase):
         size = file_object.get_size()
         self.assertEqual(size, 116)
 
+    def testGetMemoryMap(self):
+        """Test the GetMemoryMap function."""
+        file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+
+        # Try GetMemoryMap without the file object being open.
+        with self.assertRaises(OSError):
+            file_object.GetMemoryMap()
+
+        file_object.Open()
+
+        memory_map = file_object.GetMemoryMap()
+        self.assertIsNotNone(memory_map)
+        self.assertEqual(len(memory_map), 116)
+        self.assertEqual(memory_map[0:20], b"place,user,password\n")
+
+
+class OSFileWithMemoryMapTest(OSFileTest):
+    """The unit test for the operating system file-like object with memory map."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        super().setUp()
+        self._use_memory_map = definitions.OS_FILE_USE_MEMORY_MAP
+        definitions.OS_FILE_USE_MEMORY_MAP = True
+
+    def tearDown(self):
+        """Cleans up the needed objects used throughout the test."""
+        definitions.OS_FILE_USE_MEMORY_MAP = self._use_memory_map
+        super().tearDown()
+
+    def testIsMemoryMapped(self):
+        """Test the IsMemoryMapped function."""
+        file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+
+        # Try IsMemoryMapped without the file object being open.
+        with self.assertRaises(OSError):
+            file_object.IsMemoryMapped()
+
+        file_object.Open()
+        self.assertTrue(file_object.IsMemoryMapped())
+
+        file_object.seek(6)
+        self.assertEqual(file_object.read(4), b"user")
+        self.assertEqual(file_object.get_offset(), 10)
+
+        file_object.close()
+
+        definitions.OS_FILE_USE_MEMORY_MAP = False
+
+        file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+        file_object.Open()
+        self.assertFalse(file_object.IsMemoryMapped())
+
 
 if __name__ == "__main__":
     unittest.main()
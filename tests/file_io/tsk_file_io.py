@@ -305,6 +305,31 @@ class TSKFileTestHFS(test_lib.HFSImageFileTestCase):
 
         self._TestReadResourceFork(file_object)
 
+    def testReadFromExtentMap(self):
+        """Test the read functionality using the extent map."""
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK,
+            location="/passwords.txt",
+            inode=self._IDENTIFIER_PASSWORDS_TXT,
+            parent=self._raw_path_spec,
+        )
+        file_object = tsk_file_io.TSKFile(self._resolver_context, path_spec)
+
+        file_object.Open()
+
+        # pylint: disable=protected-access
+        self.assertIsNotNone(file_object._extent_map)
+
+        file_object.seek(20, os.SEEK_SET)
+        read_buffer = file_object.read(24)
+        self.assertEqual(read_buffer, b"bank,joesmith,superrich\n")
+
+        file_object._extent_map = None
+
+        file_object.seek(20, os.SEEK_SET)
+        read_buffer = file_object.read(24)
+        self.assertEqual(read_buffer, b"bank,joesmith,superrich\n")
+
 
 class TSKFileTestNTFS(test_lib.NTFSImageFileTestCase):
     """Tests the SleuthKit (TSK) file-like object on NTFS."""
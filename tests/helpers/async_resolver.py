@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Tests for the helper to use dfVFS from asyncio code."""
+
+import asyncio
+import unittest
+
+from dfvfs.helpers import async_resolver
+from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+
+from tests import test_lib as shared_test_lib
+
+
+class AsyncResolverTest(shared_test_lib.BaseTestCase):
+    """Tests the helper to use dfVFS from asyncio code."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        test_path = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        self._raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec
+        )
+
+    def _GetTSKPathSpec(self, location):
+        """Retrieves a TSK path specification for testing.
+
+        Args:
+          location (str): location.
+
+        Returns:
+          PathSpec: path specification.
+        """
+        return path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK,
+            location=location,
+            parent=self._raw_path_spec,
+        )
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with self.assertRaises(ValueError):
+            async_resolver.AsyncResolver(batch_size=0)
+
+        with self.assertRaises(ValueError):
+            async_resolver.AsyncResolver(maximum_number_of_pending_calls=0)
+
+        with self.assertRaises(ValueError):
+            async_resolver.AsyncResolver(maximum_number_of_workers=0)
+
+    def testOpenFileEntry(self):
+        """Tests the OpenFileEntry function."""
+
+        async def _Test():
+            async with async_resolver.AsyncResolver(batch_size=2) as test_resolver:
+                file_entry = await test_resolver.OpenFileEntry(
+                    self._GetTSKPathSpec("/a_directory")
+                )
+                self.assertIsNotNone(file_entry)
+                self.assertEqual(file_entry.name, "a_directory")
+                self.assertEqual(
+                    file_entry.entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY
+                )
+
+                names = [
+                    sub_file_entry.name
+                    async for sub_file_entry in file_entry.GetSubFileEntries()
+                ]
+                self.assertEqual(
+                    sorted(names), ["a_file", "a_resourcefork", "another_file"]
+                )
+
+                file_entry = await test_resolver.OpenFileEntry(
+                    self._GetTSKPathSpec("/a_directory/another_file")
+                )
+                self.assertIsNotNone(file_entry)
+
+                size = await file_entry.Call(lambda file_entry: file_entry.size)
+                self.assertEqual(size, 22)
+
+                file_object = await file_entry.GetFileObject()
+                self.assertIsNotNone(file_object)
+                self.assertEqual(await file_object.read(), b"This is another file.\n")
+
+                file_entry = await test_resolver.OpenFileEntry(
+                    self._GetTSKPathSpec("/bogus")
+                )
+                self.assertIsNone(file_entry)
+
+        asyncio.run(_Test())
+
+    def testOpenFileObject(self):
+        """Tests the OpenFileObject function."""
+
+        async def _Test():
+            async with async_resolver.AsyncResolver() as test_resolver:
+                file_object = await test_resolver.OpenFileObject(
+                    self._GetTSKPathSpec("/passwords.txt")
+                )
+                self.assertIsNotNone(file_object)
+                self.assertEqual(await file_object.get_size(), 116)
+
+                await file_object.seek(6)
+                self.assertEqual(await file_object.read(4), b"user")
+                self.assertEqual(await file_object.get_offset(), 10)
+
+                await file_object.close()
+
+                with self.assertRaises(OSError):
+                    await file_object.read(4)
+
+        asyncio.run(_Test())
+
+    def testOpenFileSystem(self):
+        """Tests the OpenFileSystem function."""
+
+        async def _Test():
+            async with async_resolver.AsyncResolver() as test_resolver:
+                file_system = await test_resolver.OpenFileSystem(
+                    self._GetTSKPathSpec("/")
+                )
+                self.assertIsNotNone(file_system)
+
+                root_file_entry = await file_system.GetRootFileEntry()
+                self.assertIsNotNone(root_file_entry)
+
+                result = await file_system.FileEntryExistsByPathSpec(
+                    self._GetTSKPathSpec("/passwords.txt")
+                )
+                self.assertTrue(result)
+
+                file_entry = await file_system.GetFileEntryByPathSpec(
+                    self._GetTSKPathSpec("/passwords.txt")
+                )
+                self.assertIsNotNone(file_entry)
+                self.assertEqual(file_entry.name, "passwords.txt")
+
+                find_spec = file_system_searcher.FindSpec(
+                    location_glob="/a_directory/*"
+                )
+                locations = [
+                    path_spec.location
+                    async for path_spec in file_system.Find(find_specs=[find_spec])
+                ]
+                self.assertEqual(
+                    sorted(locations),
+                    [
+                        "/a_directory/a_file",
+                        "/a_directory/a_resourcefork",
+                        "/a_directory/another_file",
+                    ],
+                )
+
+        asyncio.run(_Test())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Tests for the helper to read many files with extent ordered IO scheduling."""
+
+import unittest
+
+from dfvfs.helpers import bulk_file_reader
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class BulkFileReaderTest(shared_test_lib.BaseTestCase):
+    """Tests the helper to read many files with extent ordered IO scheduling."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        test_path = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        self._raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec
+        )
+
+    def _GetTestPathSpecs(self):
+        """Retrieves path specifications for testing.
+
+        Returns:
+          list[PathSpec]: path specifications.
+        """
+        return [
+            path_spec_factory.Factory.NewPathSpec(
+                definitions.TYPE_INDICATOR_TSK,
+                location=location,
+                parent=self._raw_path_spec,
+            )
+            for location in (
+                "/passwords.txt",
+                "/a_directory/another_file",
+                "/a_directory/a_file",
+                "/bogus.txt",
+            )
+        ]
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with self.assertRaises(ValueError):
+            bulk_file_reader.BulkFileReader(maximum_number_of_workers=0)
+
+        with self.assertRaises(ValueError):
+            bulk_file_reader.BulkFileReader(maximum_number_of_queued_reads=0)
+
+    def testScheduleReads(self):
+        """Tests the _ScheduleReads function."""
+        test_reader = bulk_file_reader.BulkFileReader()
+
+        path_specs = self._GetTestPathSpecs()
+
+        # pylint: disable=protected-access
+        scheduled_path_specs = test_reader._ScheduleReads(path_specs)
+        self.assertEqual(len(scheduled_path_specs), 4)
+
+        # The non-existing file has no extents and is scheduled first.
+        self.assertEqual(scheduled_path_specs[0].location, "/bogus.txt")
+
+        # The other files are scheduled by the offset of their first extent.
+        resolver_context = context.Context()
+        extent_offsets = []
+        for path_spec in scheduled_path_specs[1:]:
+            file_entry = resolver.Resolver.OpenFileEntry(
+                path_spec, resolver_context=resolver_context
+            )
+            extents = file_entry.GetExtents()
+            extent_offsets.append(extents[0].offset)
+
+        resolver_context.Empty()
+
+        self.assertEqual(extent_offsets, sorted(extent_offsets))
+        self.assertEqual(
+            [path_spec.location for path_spec in scheduled_path_specs[1:]],
+            ["/a_directory/a_file", "/passwords.txt", "/a_directory/another_file"],
+        )
+
+    def testHashFiles(self):
+        """Tests the HashFiles function."""
+        test_reader = bulk_file_reader.BulkFileReader(maximum_number_of_workers=2)
+
+        path_specs = self._GetTestPathSpecs()
+
+        results = {
+            read_result.path_spec.location: read_result
+            for read_result in test_reader.HashFiles(path_specs)
+        }
+        self.assertEqual(len(results), 4)
+
+        read_result = results["/passwords.txt"]
+        self.assertIsNone(read_result.error)
+        self.assertEqual(
+            read_result.result,
+            "02a2a6af2f1ecf4720d7d49d640f0d0a269a7ec733e41973bdd34f09dad0e252",
+        )
+
+        read_result = results["/bogus.txt"]
+        self.assertIsNotNone(read_result.error)
+        self.assertIsNone(read_result.result)
+
+        with self.assertRaises(ValueError):
+            list(test_reader.HashFiles(path_specs, hash_algorithm="bogus"))
+
+    def testReadFiles(self):
+        """Tests the ReadFiles function."""
+        test_reader = bulk_file_reader.BulkFileReader(maximum_number_of_workers=2)
+
+        path_specs = self._GetTestPathSpecs()
+
+        results = {
+            read_result.path_spec.location: read_result.result
+            for read_result in test_reader.ReadFiles(
+                path_specs, lambda file_object: file_object.read(20)
+            )
+        }
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results["/passwords.txt"], b"place,user,password\n")
+        self.assertIsNone(results["/bogus.txt"])
+
+    def testReadFilesWithConcurrentCalls(self):
+        """Tests the ReadFiles function with concurrent calls."""
+        test_reader = bulk_file_reader.BulkFileReader(
+            maximum_number_of_queued_reads=1, maximum_number_of_workers=1
+        )
+
+        path_specs = self._GetTestPathSpecs()
+
+        read_results = test_reader.ReadFiles(
+            path_specs, lambda file_object: file_object.read(20)
+        )
+
+        results = {}
+        read_result = next(read_results)
+        results[read_result.path_spec.location] = read_result.result
+
+        # Completing another call does not affect the call in progress.
+        other_results = list(
+            test_reader.ReadFiles(path_specs, lambda file_object: file_object.read(20))
+        )
+        self.assertEqual(len(other_results), 4)
+
+        for read_result in read_results:
+            results[read_result.path_spec.location] = read_result.result
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results["/passwords.txt"], b"place,user,password\n")
+        self.assertIsNone(results["/bogus.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 
 import unittest
 
+from dfvfs.file_io import os_file_io
 from dfvfs.helpers import data_slice
 from dfvfs.lib import definitions
 from dfvfs.path import factory as path_spec_factory
@@ -12,6 +13,12 @@ from dfvfs.resolver import resolver
 from tests import test_lib as shared_test_lib
 
 
+class TestDataSlice(data_slice.DataSlice):
+    """Data slice that scans small amounts of data at once for testing."""
+
+    _FIND_READ_SIZE = 8
+
+
 class TextFileTest(shared_test_lib.BaseTestCase):
     """Tests the data slice interface for file-like objects."""
 
@@ -57,6 +64,131 @@ class TextFileTest(shared_test_lib.BaseTestCase):
         with self.assertRaises(ValueError):
             file_data[44:64:2]  # pylint: disable=pointless-statement
 
+    def testGetItemsWithPageCache(self):
+        """Test the __getitem__ function with cached pages."""
+        test_path = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        test_raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec
+        )
+        test_tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK,
+            location="/passwords.txt",
+            parent=test_raw_path_spec,
+        )
+        file_object = resolver.Resolver.OpenFileObject(
+            test_tsk_path_spec, resolver_context=self._resolver_context
+        )
+
+        file_data = data_slice.DataSlice(
+            file_object, maximum_number_of_cached_pages=2, page_size=16
+        )
+
+        # Test reads within a page, across pages and exceeding the cache.
+        self.assertEqual(file_data[:4], b"plac")
+        self.assertEqual(file_data[20:44], b"bank,joesmith,superrich\n")
+        self.assertEqual(file_data[:20], b"place,user,password\n")
+        self.assertEqual(file_data[86:], b"uber secret laire,admin,admin\n")
+
+        # Test single byte reads.
+        self.assertEqual(file_data[5], b",")
+        self.assertEqual(file_data[-1], b"\n")
+        self.assertEqual(file_data[116], b"")
+
+        with self.assertRaises(BufferError):
+            file_data.__buffer__(0)
+
+        file_data = data_slice.DataSlice(file_object)
+
+        buffer = file_data.__buffer__(0)
+        self.assertEqual(buffer[:20], b"place,user,password\n")
+
+    def testFind(self):
+        """Test the find function."""
+        test_path = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        test_raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec
+        )
+        test_tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK,
+            location="/passwords.txt",
+            parent=test_raw_path_spec,
+        )
+        file_object = resolver.Resolver.OpenFileObject(
+            test_tsk_path_spec, resolver_context=self._resolver_context
+        )
+
+        file_data = TestDataSlice(
+            file_object, maximum_number_of_cached_pages=2, page_size=16
+        )
+
+        self.assertEqual(file_data.find(b"superrich"), 34)
+        self.assertEqual(file_data.find(b"-,1"), 57)
+        self.assertEqual(file_data.find(b"-,1", 60), 79)
+        self.assertEqual(file_data.find(b"-,1", 60, 81), -1)
+        self.assertEqual(file_data.find(b"bogus"), -1)
+
+        test_path = self._GetTestFilePath(["password.txt"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        file_object = resolver.Resolver.OpenFileObject(
+            test_os_path_spec, resolver_context=self._resolver_context
+        )
+
+        file_data = data_slice.DataSlice(file_object)
+
+        self.assertEqual(file_data.find(b"superrich"), 34)
+        self.assertEqual(file_data.find(b"-,1", 60), 79)
+        self.assertEqual(file_data.find(b"bogus"), -1)
+
+    def testInitialize(self):
+        """Test the __init__ function."""
+        test_path = self._GetTestFilePath(["password.txt"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        file_object = resolver.Resolver.OpenFileObject(
+            test_os_path_spec, resolver_context=self._resolver_context
+        )
+        self.assertFalse(file_object.IsMemoryMapped())
+
+        # pylint: disable=protected-access
+        file_data = data_slice.DataSlice(file_object)
+        self.assertIsNone(file_data._memory_map)
+        self.assertFalse(file_object.IsMemoryMapped())
+
+        file_object = os_file_io.OSFile(self._resolver_context, test_os_path_spec)
+
+        original_use_memory_map = definitions.OS_FILE_USE_MEMORY_MAP
+        definitions.OS_FILE_USE_MEMORY_MAP = True
+        try:
+            file_object.Open()
+        finally:
+            definitions.OS_FILE_USE_MEMORY_MAP = original_use_memory_map
+
+        try:
+            file_data = data_slice.DataSlice(file_object)
+            self.assertIsNotNone(file_data._memory_map)
+            self.assertEqual(file_data[0:7], b"place,u")
+
+        finally:
+            file_data = None
+            file_object.close()
+
     def testLen(self):
         """Test the __len__ function."""
         test_path = self._GetTestFilePath(["password.txt"])
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for the persistent index of the directory tree of file systems."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import file_system_index
+from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class FileSystemIndexTest(shared_test_lib.BaseTestCase):
+    """Tests the persistent index of the directory tree of file systems."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        self._resolver_context = context.Context()
+        test_path = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        self._raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec
+        )
+        self._tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK, location="/", parent=self._raw_path_spec
+        )
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._index_path = os.path.join(self._temporary_directory, "index.db")
+
+    def tearDown(self):
+        """Cleans up the needed objects used throughout the test."""
+        self._resolver_context.Empty()
+        shutil.rmtree(self._temporary_directory, True)
+
+    def testFind(self):
+        """Tests the Find function."""
+        file_system = resolver.Resolver.OpenFileSystem(
+            self._tsk_path_spec, resolver_context=self._resolver_context
+        )
+        searcher = file_system_searcher.FileSystemSearcher(
+            file_system, self._raw_path_spec
+        )
+
+        find_specs = [
+            file_system_searcher.FindSpec(
+                file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE]
+            ),
+            file_system_searcher.FindSpec(
+                case_sensitive=False, location_glob="/A_DIRECTORY/*"
+            ),
+        ]
+        expected_path_specs = list(searcher.Find(find_specs=find_specs))
+        self.assertNotEqual(expected_path_specs, [])
+
+        index = file_system_index.FileSystemIndex(self._index_path)
+        index.Open()
+
+        try:
+            path_specs = list(
+                index.Find(
+                    self._tsk_path_spec,
+                    find_specs=find_specs,
+                    resolver_context=self._resolver_context,
+                )
+            )
+            self.assertEqual(path_specs, expected_path_specs)
+
+            find_spec = file_system_searcher.FindSpec(location="/passwords.txt")
+            path_specs = list(index.Find(self._tsk_path_spec, find_specs=[find_spec]))
+            self.assertEqual(len(path_specs), 1)
+            self.assertEqual(path_specs[0].location, "/passwords.txt")
+            self.assertIsNotNone(getattr(path_specs[0], "inode", None))
+
+        finally:
+            index.Close()
+
+    def testHasFileSystem(self):
+        """Tests the HasFileSystem function."""
+        index = file_system_index.FileSystemIndex(self._index_path)
+        index.Open()
+
+        try:
+            self.assertFalse(index.HasFileSystem(self._tsk_path_spec))
+
+            index.IndexFileSystem(
+                self._tsk_path_spec, resolver_context=self._resolver_context
+            )
+            self.assertTrue(index.HasFileSystem(self._tsk_path_spec))
+
+        finally:
+            index.Close()
+
+        index.Open()
+
+        try:
+            self.assertTrue(index.HasFileSystem(self._tsk_path_spec))
+
+            with self.assertRaises(ValueError):
+                index.IndexFileSystem(self._raw_path_spec.parent)
+
+        finally:
+            index.Close()
+
+        with self.assertRaises(OSError):
+            index.HasFileSystem(self._tsk_path_spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,16 +2,21 @@
 """Tests for the file system searcher."""
 
 import os
+import tempfile
+import threading
 import unittest
 
 from dfvfs.lib import definitions
 from dfvfs.helpers import fake_file_system_builder
 from dfvfs.helpers import file_system_searcher
+from dfvfs.path import ext_path_spec
 from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
 from dfvfs.path import raw_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
+from dfvfs.vfs import ext_file_system
 from dfvfs.vfs import os_file_system
 from dfvfs.vfs import tsk_file_system
 
@@ -390,6 +395,28 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
         result = find_spec.CompareTraits(file_entry)
         self.assertTrue(result)
 
+    def testGetLocationSegments(self):
+        """Test the GetLocationSegments function."""
+        find_spec = file_system_searcher.FindSpec()
+
+        location_segments = find_spec.GetLocationSegments()
+        self.assertIsNone(location_segments)
+
+        find_spec = file_system_searcher.FindSpec(
+            location="/usr/lib/python2.7", case_sensitive=False
+        )
+
+        file_system = self._CreateTestFileSystem()
+        path_spec = fake_path_spec.FakePathSpec(location="/usr/lib")
+        file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+        # Comparing replaces the location segments by their lower case form.
+        result = find_spec.CompareNameWithLocationSegment(file_entry, 2)
+        self.assertTrue(result)
+
+        location_segments = find_spec.GetLocationSegments()
+        self.assertEqual(location_segments, ["usr", "lib", "python2.7"])
+
     def testHasLocation(self):
         """Test the HasLocation function."""
         find_spec = file_system_searcher.FindSpec()
@@ -404,6 +431,14 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
         result = find_spec.HasLocation()
         self.assertTrue(result)
 
+    def testIsCaseSensitive(self):
+        """Test the IsCaseSensitive function."""
+        find_spec = file_system_searcher.FindSpec(location="/usr")
+        self.assertTrue(find_spec.IsCaseSensitive())
+
+        find_spec = file_system_searcher.FindSpec(location="/usr", case_sensitive=False)
+        self.assertFalse(find_spec.IsCaseSensitive())
+
     def testIsLastLocationSegment(self):
         """Test the IsLastLocationSegment function."""
         find_spec = file_system_searcher.FindSpec(
@@ -419,10 +454,108 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
         result = find_spec.IsLastLocationSegment(9)
         self.assertFalse(result)
 
+    def testIsRegex(self):
+        """Test the IsRegex function."""
+        find_spec = file_system_searcher.FindSpec(location="/usr")
+        self.assertFalse(find_spec.IsRegex())
+
+        find_spec = file_system_searcher.FindSpec(location_glob="/usr/*")
+        self.assertTrue(find_spec.IsRegex())
+
+        find_spec = file_system_searcher.FindSpec(location_regex="/usr/.*")
+        self.assertTrue(find_spec.IsRegex())
+
+
+class FindSpecTrieNodeTest(shared_test_lib.BaseTestCase):
+    """Tests for the find specification location segment trie node."""
+
+    # pylint: disable=protected-access
+
+    def testAddChildNode(self):
+        """Test the AddChildNode function."""
+        trie_node = file_system_searcher._FindSpecTrieNode()
+
+        child_node = trie_node.AddChildNode("usr", True, False)
+        self.assertIsNotNone(child_node)
+
+        same_child_node = trie_node.AddChildNode("usr", True, False)
+        self.assertIs(same_child_node, child_node)
+
+        child_node = trie_node.AddChildNode("USR", False, False)
+        self.assertIn("usr", trie_node.case_insensitive_literals)
+
+        child_node = trie_node.AddChildNode("[", True, True)
+        self.assertIsNone(child_node)
+
+    def testGetChildNodes(self):
+        """Test the GetChildNodes function."""
+        trie_node = file_system_searcher._FindSpecTrieNode()
+
+        literal_node = trie_node.AddChildNode("usr", True, False)
+        case_insensitive_node = trie_node.AddChildNode("USR", False, False)
+        pattern_node = trie_node.AddChildNode("u.*", True, True)
+        case_insensitive_pattern_node = trie_node.AddChildNode("v.*", False, True)
+
+        self.assertTrue(trie_node.HasChildNodes())
+
+        child_nodes = trie_node.GetChildNodes("usr")
+        self.assertEqual(
+            child_nodes, [literal_node, case_insensitive_node, pattern_node]
+        )
+
+        child_nodes = trie_node.GetChildNodes("Usr")
+        self.assertEqual(child_nodes, [case_insensitive_node])
+
+        child_nodes = trie_node.GetChildNodes("VAR")
+        self.assertEqual(child_nodes, [case_insensitive_pattern_node])
+
+        child_nodes = trie_node.GetChildNodes("bogus")
+        self.assertEqual(child_nodes, [])
+
+        child_nodes = trie_node.GetChildNodes(None)
+        self.assertEqual(child_nodes, [])
+
+
+class FindSpecTrieTest(shared_test_lib.BaseTestCase):
+    """Tests for the find specification location segment trie."""
+
+    # pylint: disable=protected-access
+
+    def testInitialize(self):
+        """Test the __init__ function."""
+        find_specs = [
+            file_system_searcher.FindSpec(location="/usr/lib"),
+            file_system_searcher.FindSpec(location_glob="/usr/*"),
+            file_system_searcher.FindSpec(location_regex="/usr/["),
+            file_system_searcher.FindSpec(
+                file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE]
+            ),
+        ]
+        find_spec_trie = file_system_searcher._FindSpecTrie(find_specs)
+
+        self.assertEqual(find_spec_trie.find_specs_without_location, [find_specs[3]])
+
+        child_nodes = find_spec_trie.root.GetChildNodes("usr")
+        self.assertEqual(len(child_nodes), 2)
+
+        sub_child_nodes = []
+        for child_node in child_nodes:
+            sub_child_nodes.extend(child_node.GetChildNodes("lib"))
+
+        self.assertEqual(len(sub_child_nodes), 2)
+
+        find_specs_at_nodes = []
+        for sub_child_node in sub_child_nodes:
+            find_specs_at_nodes.extend(sub_child_node.find_specs)
+
+        self.assertEqual(find_specs_at_nodes, [find_specs[0], find_specs[1]])
+
 
 class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
     """Tests for the file system searcher."""
 
+    # pylint: disable=protected-access
+
     def setUp(self):
         """Sets up the needed objects used throughout the test."""
         self._resolver_context = context.Context()
@@ -774,6 +907,214 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
         test_relative_path = searcher.GetRelativePath(first_path_spec)
         self.assertEqual(test_relative_path, expected_relative_path)
 
+    def testFindInParallel(self):
+        """Test the FindInParallel function."""
+        searcher = file_system_searcher.FileSystemSearcher(
+            self._tsk_file_system, self._raw_path_spec
+        )
+        find_spec = file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE]
+        )
+        expected_locations = [
+            getattr(path_spec, "location", "")
+            for path_spec in searcher.Find(find_specs=[find_spec])
+        ]
+        self.assertNotEqual(expected_locations, [])
+
+        path_spec_generator = searcher.FindInParallel(
+            find_specs=[find_spec], deterministic_order=True
+        )
+        locations = [
+            getattr(path_spec, "location", "") for path_spec in path_spec_generator
+        ]
+        self.assertEqual(locations, expected_locations)
+
+        path_spec_generator = searcher.FindInParallel(
+            find_specs=[find_spec], maximum_number_of_workers=2, split_depth=2
+        )
+        locations = [
+            getattr(path_spec, "location", "") for path_spec in path_spec_generator
+        ]
+        self.assertEqual(sorted(locations), sorted(expected_locations))
+
+        # The worker resolver contexts are scoped to a single search.
+        first_path_spec_generator = searcher.FindInParallel(
+            find_specs=[find_spec], deterministic_order=True
+        )
+        second_path_spec_generator = searcher.FindInParallel(
+            find_specs=[find_spec], deterministic_order=True
+        )
+        next(first_path_spec_generator)
+        path_spec = next(second_path_spec_generator)
+        first_path_spec_generator.close()
+
+        locations = [getattr(path_spec, "location", "")]
+        locations.extend(
+            getattr(path_spec, "location", "")
+            for path_spec in second_path_spec_generator
+        )
+        self.assertEqual(locations, expected_locations)
+
+        with self.assertRaises(ValueError):
+            list(searcher.FindInParallel(maximum_number_of_workers=0))
+
+        with self.assertRaises(ValueError):
+            list(searcher.FindInParallel(split_depth=0))
+
+    def testFindWithSymbolicLink(self):
+        """Test the Find function with a symbolic link outside the mount point."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            mount_point_path = os.path.join(temporary_directory, "real")
+            outside_path = os.path.join(temporary_directory, "outside")
+            os.mkdir(mount_point_path)
+            os.mkdir(outside_path)
+
+            with open(os.path.join(outside_path, "secret"), "wb") as file_object:
+                file_object.write(b"secret\n")
+
+            os.symlink(
+                os.path.join("..", "outside"), os.path.join(mount_point_path, "link")
+            )
+
+            mount_point = os_path_spec.OSPathSpec(location=mount_point_path)
+            searcher = file_system_searcher.FileSystemSearcher(
+                self._os_file_system, mount_point
+            )
+
+            find_spec = file_system_searcher.FindSpec(location="/link/secret")
+            path_specs = list(searcher.Find(find_specs=[find_spec]))
+            self.assertEqual(path_specs, [])
+
+            self.assertIsNone(
+                searcher._GetLiteralSubFileEntries(
+                    searcher._GetBaseFileEntry(),
+                    [file_system_searcher._FindSpecTrie([find_spec]).root],
+                )
+            )
+
+    def testGetLiteralSubFileEntries(self):
+        """Test the _GetLiteralSubFileEntries function."""
+        test_file = self._GetTestFilePath(["ext2.qcow2"])
+        self._SkipIfPathNotExists(test_file)
+
+        path_spec = os_path_spec.OSPathSpec(location=test_file)
+        path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+        test_file_system = ext_file_system.EXTFileSystem(
+            self._resolver_context,
+            ext_path_spec.EXTPathSpec(location="/", parent=path_spec),
+        )
+        test_file_system.Open()
+
+        searcher = file_system_searcher.FileSystemSearcher(test_file_system, path_spec)
+        file_entry = test_file_system.GetRootFileEntry()
+
+        find_spec_trie = file_system_searcher._FindSpecTrie(
+            [
+                file_system_searcher.FindSpec(location="/a_directory/a_file"),
+                file_system_searcher.FindSpec(location="/A_DIRECTORY/a_file"),
+                file_system_searcher.FindSpec(location="/bogus/a_file"),
+                file_system_searcher.FindSpec(location="/a_link/a_file"),
+                file_system_searcher.FindSpec(location="/passwords.txt/a_file"),
+            ]
+        )
+        sub_file_entries = searcher._GetLiteralSubFileEntries(
+            file_entry, [find_spec_trie.root]
+        )
+        self.assertEqual(len(sub_file_entries), 1)
+
+        sub_file_entry, _ = sub_file_entries[0]
+        self.assertEqual(sub_file_entry.name, "a_directory")
+
+        # Sub file entries that can match are enumerated.
+        find_spec_trie = file_system_searcher._FindSpecTrie(
+            [file_system_searcher.FindSpec(location="/passwords.txt")]
+        )
+        sub_file_entries = searcher._GetLiteralSubFileEntries(
+            file_entry, [find_spec_trie.root]
+        )
+        self.assertIsNone(sub_file_entries)
+
+        # Case insensitive literals cannot be looked up by location.
+        find_spec_trie = file_system_searcher._FindSpecTrie(
+            [
+                file_system_searcher.FindSpec(
+                    case_sensitive=False, location="/a_directory/a_file"
+                )
+            ]
+        )
+        sub_file_entries = searcher._GetLiteralSubFileEntries(
+            file_entry, [find_spec_trie.root]
+        )
+        self.assertIsNone(sub_file_entries)
+
+        # Path specifications of matches are the same as those of enumeration.
+        find_spec = file_system_searcher.FindSpec(location="/a_directory/a_file")
+        path_specs = list(searcher.Find(find_specs=[find_spec]))
+        self.assertEqual(len(path_specs), 1)
+        self.assertEqual(path_specs[0].location, "/a_directory/a_file")
+        self.assertIsNotNone(path_specs[0].inode)
+
+        # TSK directories can contain multiple file entries with the same name.
+        searcher = file_system_searcher.FileSystemSearcher(
+            self._tsk_file_system, self._raw_path_spec
+        )
+        file_entry = self._tsk_file_system.GetRootFileEntry()
+
+        find_spec_trie = file_system_searcher._FindSpecTrie(
+            [file_system_searcher.FindSpec(location="/$Extend/$ObjId")]
+        )
+        sub_file_entries = searcher._GetLiteralSubFileEntries(
+            file_entry, [find_spec_trie.root]
+        )
+        self.assertIsNone(sub_file_entries)
+
+
+class FileSystemSearcherWithFakeFileSystemTest(shared_test_lib.BaseTestCase):
+    """Tests for the file system searcher with a fake file system."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+        file_system_builder.AddFile("/a_directory/another_file", b"another file")
+        file_system_builder.AddFile("/a_directory/a_file", b"a file")
+
+        self._fake_file_system = file_system_builder.file_system
+        self._mount_point = fake_path_spec.FakePathSpec(location="/")
+
+    def testFindInFileEntryWithAbortEvent(self):
+        """Test the _FindInFileEntry function with an abort event."""
+        searcher = file_system_searcher.FileSystemSearcher(
+            self._fake_file_system, self._mount_point
+        )
+        find_spec_trie = file_system_searcher._FindSpecTrie(
+            [file_system_searcher.FindSpec()]
+        )
+        file_entry = searcher._GetBaseFileEntry()
+
+        abort_event = threading.Event()
+        path_spec_generator = searcher._FindInFileEntry(
+            file_entry, find_spec_trie, [find_spec_trie.root], abort_event=abort_event
+        )
+        locations = [
+            getattr(path_spec, "location", "") for path_spec in path_spec_generator
+        ]
+        self.assertEqual(
+            locations,
+            ["/", "/a_directory", "/a_directory/another_file", "/a_directory/a_file"],
+        )
+
+        # The abort event is checked before the next file entry is visited.
+        path_spec_generator = searcher._FindInFileEntry(
+            file_entry, find_spec_trie, [find_spec_trie.root], abort_event=abort_event
+        )
+        path_spec = next(path_spec_generator)
+        self.assertEqual(path_spec.location, "/")
+
+        abort_event.set()
+        self.assertEqual(list(path_spec_generator), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Tests for the helper to process path specifications on worker processes."""
+
+import unittest
+
+from dfvfs.helpers import path_spec_process_pool
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.serializer import binary_serializer as serializer
+
+from tests import test_lib as shared_test_lib
+
+
+def _GetFileEntrySize(file_entry):
+    """Retrieves the size of a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      int: size of the file entry.
+    """
+    return file_entry.size
+
+
+class PathSpecProcessPoolTest(shared_test_lib.BaseTestCase):
+    """Tests the helper to process path specifications on worker processes."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        test_path = self._GetTestFilePath(["hfsplus.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        self._raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec
+        )
+
+        self._path_specs = [
+            path_spec_factory.Factory.NewPathSpec(
+                definitions.TYPE_INDICATOR_TSK,
+                location=location,
+                parent=self._raw_path_spec,
+            )
+            for location in (
+                "/passwords.txt",
+                "/a_directory/another_file",
+                "/a_directory/a_file",
+                "/bogus.txt",
+            )
+        ]
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with self.assertRaises(ValueError):
+            path_spec_process_pool.PathSpecProcessPool(maximum_number_of_workers=0)
+
+        with self.assertRaises(ValueError):
+            path_spec_process_pool.PathSpecProcessPool(work_unit_size=0)
+
+    def testGetWorkUnits(self):
+        """Tests the _GetWorkUnits function."""
+        test_pool = path_spec_process_pool.PathSpecProcessPool(work_unit_size=1)
+
+        # pylint: disable=protected-access
+        work_units = test_pool._GetWorkUnits(self._path_specs)
+        self.assertEqual(len(work_units), 4)
+
+        test_pool = path_spec_process_pool.PathSpecProcessPool()
+
+        work_units = test_pool._GetWorkUnits(self._path_specs)
+        self.assertEqual(len(work_units), 2)
+
+        serialized_path_specs, indexes = work_units[0]
+        self.assertEqual(indexes, [0, 3])
+
+        path_specs = serializer.BinaryPathSpecSerializer.ReadSerializedBatch(
+            serialized_path_specs
+        )
+        self.assertEqual(path_specs, [self._path_specs[0], self._path_specs[3]])
+
+    def testProcessPathSpecs(self):
+        """Tests the ProcessPathSpecs function."""
+        test_pool = path_spec_process_pool.PathSpecProcessPool(
+            maximum_number_of_workers=2
+        )
+
+        results = {
+            process_result.path_spec.location: process_result
+            for process_result in test_pool.ProcessPathSpecs(
+                self._path_specs, _GetFileEntrySize
+            )
+        }
+        self.assertEqual(len(results), 4)
+
+        process_result = results["/passwords.txt"]
+        self.assertIsNone(process_result.error)
+        self.assertEqual(process_result.result, 116)
+
+        process_result = results["/bogus.txt"]
+        self.assertIsNotNone(process_result.error)
+        self.assertIsNone(process_result.result)
+
+
+if __name__ == "__main__":
+    unittest.main()
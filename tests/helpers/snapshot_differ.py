@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""Tests for the snapshot differ."""
+
+import unittest
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from dfvfs.helpers import fake_file_system_builder
+from dfvfs.helpers import snapshot_differ
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class TestFileEntry:
+    """File entry with pinned timestamps for testing.
+
+    Attributes:
+      change_time (dfdatetime.DateTimeValues): change time.
+      creation_time (dfdatetime.DateTimeValues): creation time.
+      entry_type (str): file entry type.
+      modification_time (dfdatetime.DateTimeValues): modification time.
+      path_spec (PathSpec): path specification.
+      size (int): size of the data of the file entry.
+    """
+
+    def __init__(self, modification_timestamp):
+        """Initializes a file entry.
+
+        Args:
+          modification_timestamp (int): POSIX timestamp of the modification time.
+        """
+        super().__init__()
+        self._stat_attribute = None
+        self.change_time = dfdatetime_posix_time.PosixTime(timestamp=1281643591)
+        self.creation_time = None
+        self.entry_type = definitions.FILE_ENTRY_TYPE_FILE
+        self.modification_time = dfdatetime_posix_time.PosixTime(
+            timestamp=modification_timestamp
+        )
+        self.path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_FAKE, location="/etc/hosts"
+        )
+        self.size = 20
+
+    def GetStatAttribute(self):
+        """Retrieves a stat attribute.
+
+        Returns:
+          StatAttribute: a stat attribute or None if not available.
+        """
+        return self._stat_attribute
+
+
+class TestSnapshotDiffer(snapshot_differ.SnapshotDiffer):
+    """Snapshot differ that ignores timestamps for testing.
+
+    Fake file entries use the current time as their timestamps.
+    """
+
+    def _GetFileEntryMetadata(self, file_entry):
+        """Retrieves the metadata of a file entry that is used to compare it.
+
+        Args:
+          file_entry (FileEntry): file entry.
+
+        Returns:
+          tuple[object]: metadata of the file entry, without timestamps.
+        """
+        metadata = super()._GetFileEntryMetadata(file_entry)
+        return metadata[:3]
+
+
+class SnapshotDifferTest(shared_test_lib.BaseTestCase):
+    """Tests for the snapshot differ."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestFileSystem(self, file_data_per_path):
+        """Create a file system for testing.
+
+        Args:
+          file_data_per_path (dict[str, bytes]): data of the files per path.
+
+        Returns:
+          FakeFileSystem: file system for testing.
+        """
+        file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+
+        for path, file_data in file_data_per_path.items():
+            file_system_builder.AddFile(path, file_data)
+
+        return file_system_builder.file_system
+
+    def _GetEXTPathSpec(self, filename, type_indicator):
+        """Retrieves the path specification of an EXT file system in an image.
+
+        Args:
+          filename (str): name of the test image.
+          type_indicator (str): type indicator of the image format.
+
+        Returns:
+          PathSpec: path specification of the EXT file system.
+        """
+        test_path = self._GetTestFilePath([filename])
+        self._SkipIfPathNotExists(test_path)
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            type_indicator, parent=path_spec
+        )
+        return path_spec_factory.Factory.NewPathSpec(
+            definitions.PREFERRED_EXT_BACK_END, location="/", parent=path_spec
+        )
+
+    def testGetChanges(self):
+        """Tests the _GetChanges function."""
+        base_file_system = self._CreateTestFileSystem(
+            {"/etc/hosts": b"127.0.0.1 localhost\n", "/etc/passwd": b"root:x:0:0\n"}
+        )
+        test_file_system = self._CreateTestFileSystem(
+            {"/etc/hosts": b"127.0.0.1 localhost\n", "/etc/shadow": b"root:*:0:0\n"}
+        )
+
+        test_differ = TestSnapshotDiffer(base_file_system.GetRootFileEntry().path_spec)
+        test_differ._base_file_entries = test_differ._GetFileEntriesByLocation(
+            base_file_system
+        )
+
+        change_types = snapshot_differ.SnapshotFileEntryChange
+
+        changes = {
+            change.location: change.change_type
+            for change in test_differ._GetChanges(test_file_system)
+        }
+        self.assertEqual(
+            changes,
+            {
+                "/etc/passwd": change_types.CHANGE_TYPE_REMOVED,
+                "/etc/shadow": change_types.CHANGE_TYPE_ADDED,
+            },
+        )
+
+        test_file_system = self._CreateTestFileSystem(
+            {"/etc/hosts": b"::1 localhost\n", "/etc/passwd": b"root:x:0:0\n"}
+        )
+
+        changes = list(test_differ._GetChanges(test_file_system))
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].change_type, change_types.CHANGE_TYPE_CHANGED)
+        self.assertEqual(changes[0].location, "/etc/hosts")
+        self.assertEqual(changes[0].path_spec.location, "/etc/hosts")
+
+    def testGetChangesOfLocation(self):
+        """Tests the _GetChangesOfLocation function."""
+        test_differ = snapshot_differ.SnapshotDiffer(None)
+
+        change_types = snapshot_differ.SnapshotFileEntryChange
+
+        deleted_entry = ((definitions.FILE_ENTRY_TYPE_FILE, 16, 10), "deleted")
+        allocated_entry = ((definitions.FILE_ENTRY_TYPE_FILE, 17, 10), "allocated")
+        changed_entry = ((definitions.FILE_ENTRY_TYPE_FILE, 17, 20), "changed")
+
+        # File entries with the same location do not collapse.
+        changes = list(
+            test_differ._GetChangesOfLocation(
+                "/file",
+                [deleted_entry, allocated_entry],
+                [allocated_entry, deleted_entry],
+            )
+        )
+        self.assertEqual(changes, [])
+
+        changes = [
+            (change.change_type, change.path_spec)
+            for change in test_differ._GetChangesOfLocation(
+                "/file",
+                [deleted_entry, allocated_entry],
+                [deleted_entry, changed_entry],
+            )
+        ]
+        self.assertEqual(changes, [(change_types.CHANGE_TYPE_CHANGED, "changed")])
+
+        changes = [
+            (change.change_type, change.path_spec)
+            for change in test_differ._GetChangesOfLocation(
+                "/file", [deleted_entry, allocated_entry], [allocated_entry]
+            )
+        ]
+        self.assertEqual(changes, [(change_types.CHANGE_TYPE_REMOVED, "deleted")])
+
+        changes = [
+            (change.change_type, change.path_spec)
+            for change in test_differ._GetChangesOfLocation(
+                "/file", [allocated_entry], [deleted_entry, allocated_entry]
+            )
+        ]
+        self.assertEqual(changes, [(change_types.CHANGE_TYPE_ADDED, "deleted")])
+
+    def testGetChangesWithTimestamps(self):
+        """Tests the _GetChangesOfLocation function with different timestamps."""
+        test_differ = snapshot_differ.SnapshotDiffer(None)
+
+        base_file_entry = TestFileEntry(1281643591)
+        base_metadata = test_differ._GetFileEntryMetadata(base_file_entry)
+        self.assertEqual(
+            base_metadata,
+            (
+                definitions.FILE_ENTRY_TYPE_FILE,
+                None,
+                20,
+                None,
+                "2010-08-12 20:06:31",
+                "2010-08-12 20:06:31",
+            ),
+        )
+
+        file_entry = TestFileEntry(1281643591)
+        metadata = test_differ._GetFileEntryMetadata(file_entry)
+
+        changes = list(
+            test_differ._GetChangesOfLocation(
+                "/etc/hosts",
+                [(base_metadata, base_file_entry.path_spec)],
+                [(metadata, file_entry.path_spec)],
+            )
+        )
+        self.assertEqual(changes, [])
+
+        # File entries that only differ in a timestamp are changed.
+        file_entry = TestFileEntry(1281647191)
+        metadata = test_differ._GetFileEntryMetadata(file_entry)
+
+        changes = list(
+            test_differ._GetChangesOfLocation(
+                "/etc/hosts",
+                [(base_metadata, base_file_entry.path_spec)],
+                [(metadata, file_entry.path_spec)],
+            )
+        )
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(
+            changes[0].change_type,
+            snapshot_differ.SnapshotFileEntryChange.CHANGE_TYPE_CHANGED,
+        )
+        self.assertIs(changes[0].path_spec, file_entry.path_spec)
+
+    def testGetFileEntries(self):
+        """Tests the _GetFileEntries function."""
+        test_file_system = self._CreateTestFileSystem(
+            {"/etc/hosts": b"127.0.0.1 localhost\n"}
+        )
+
+        test_differ = snapshot_differ.SnapshotDiffer(None)
+
+        file_entries = {
+            location: metadata
+            for location, metadata, _ in test_differ._GetFileEntries(test_file_system)
+        }
+        self.assertEqual(sorted(file_entries.keys()), ["/", "/etc", "/etc/hosts"])
+
+        metadata = file_entries["/etc/hosts"]
+        self.assertEqual(metadata[0], definitions.FILE_ENTRY_TYPE_FILE)
+        self.assertEqual(metadata[2], 20)
+
+    def testGetChangesWithImages(self):
+        """Tests the GetChanges function with file systems in different images."""
+        base_path_spec = self._GetEXTPathSpec(
+            "ext2.qcow2", definitions.TYPE_INDICATOR_QCOW
+        )
+        test_path_spec = self._GetEXTPathSpec(
+            "ext2.vmdk", definitions.TYPE_INDICATOR_VMDK
+        )
+
+        resolver_context = context.Context()
+        test_differ = snapshot_differ.SnapshotDiffer(
+            base_path_spec, resolver_context=resolver_context
+        )
+
+        # The images contain the same file system.
+        changes = list(test_differ.GetChanges(test_path_spec))
+        self.assertEqual(changes, [])
+
+        base_file_entries = test_differ._GetBaseFileEntries()
+        self.assertEqual(len(base_file_entries), 7)
+        self.assertIn("/passwords.txt", base_file_entries)
+
+        # The base file system is only walked once.
+        changes = list(test_differ.GetChanges(base_path_spec))
+        self.assertEqual(changes, [])
+        self.assertIs(test_differ._GetBaseFileEntries(), base_file_entries)
+
+        resolver_context.Empty()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for the persistent cache of source scan results."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import source_scan_cache
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
+
+from tests import test_lib as shared_test_lib
+
+
+class SourceScanCacheTest(shared_test_lib.BaseTestCase):
+    """Tests the persistent cache of source scan results."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        test_path = self._GetTestFilePath(["ext2.qcow2"])
+        self._SkipIfPathNotExists(test_path)
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._cache_path = os.path.join(self._temporary_directory, "cache")
+
+        self._source_path = os.path.join(self._temporary_directory, "ext2.qcow2")
+        shutil.copyfile(test_path, self._source_path)
+
+    def tearDown(self):
+        """Cleans up the needed objects used throughout the test."""
+        shutil.rmtree(self._temporary_directory, True)
+
+    def _GetScanNodes(self, scan_context):
+        """Retrieves the path specifications and scanned states of scan nodes.
+
+        Args:
+          scan_context (SourceScannerContext): source scanner context.
+
+        Returns:
+          list[tuple[PathSpec, bool]]: path specifications and scanned states of
+              the scan nodes, in depth-first order.
+        """
+        scan_nodes = []
+
+        pending_scan_nodes = [scan_context.GetRootScanNode()]
+        while pending_scan_nodes:
+            scan_node = pending_scan_nodes.pop()
+            scan_nodes.append((scan_node.path_spec, scan_node.scanned))
+            pending_scan_nodes.extend(reversed(scan_node.sub_nodes))
+
+        return scan_nodes
+
+    def testGetAndStoreScanContext(self):
+        """Tests the GetScanContext and StoreScanContext functions."""
+        test_scan_cache = source_scan_cache.SourceScanCache(self._cache_path)
+
+        scan_context = test_scan_cache.GetScanContext(self._source_path)
+        self.assertIsNone(scan_context)
+
+        expected_scan_context = source_scanner.SourceScannerContext()
+        expected_scan_context.OpenSourcePath(self._source_path)
+
+        test_source_scanner = source_scanner.SourceScanner()
+        test_source_scanner.Scan(expected_scan_context)
+
+        result = test_scan_cache.StoreScanContext(
+            self._source_path, expected_scan_context
+        )
+        self.assertTrue(result)
+
+        scan_context = test_scan_cache.GetScanContext(self._source_path)
+        self.assertIsNotNone(scan_context)
+        self.assertEqual(
+            scan_context.source_type, definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE
+        )
+        self.assertEqual(
+            self._GetScanNodes(scan_context),
+            self._GetScanNodes(expected_scan_context),
+        )
+        self.assertTrue(scan_context.HasFileSystemScanNodes())
+
+        # Cached scan results are not used when the source changes.
+        with open(self._source_path, "r+b") as file_object:
+            file_object.seek(-1, os.SEEK_END)
+            file_object.write(b"\xff")
+
+        scan_context = test_scan_cache.GetScanContext(self._source_path)
+        self.assertIsNone(scan_context)
+
+    def testStoreScanContextOnDirectory(self):
+        """Tests the StoreScanContext function on a directory."""
+        test_scan_cache = source_scan_cache.SourceScanCache(self._cache_path)
+
+        scan_context = source_scanner.SourceScannerContext()
+        scan_context.OpenSourcePath(self._temporary_directory)
+
+        result = test_scan_cache.StoreScanContext(
+            self._temporary_directory, scan_context
+        )
+        self.assertFalse(result)
+
+        scan_context = test_scan_cache.GetScanContext(self._temporary_directory)
+        self.assertIsNone(scan_context)
+
+    def testStoreScanContextWithLockedScanNode(self):
+        """Tests the StoreScanContext function with a locked scan node."""
+        test_scan_cache = source_scan_cache.SourceScanCache(self._cache_path)
+
+        scan_context = source_scanner.SourceScannerContext()
+        scan_context.OpenSourcePath(self._source_path)
+
+        root_scan_node = scan_context.GetRootScanNode()
+        root_scan_node.scanned = True
+        scan_context.LockScanNode(root_scan_node.path_spec)
+
+        test_scan_cache.StoreScanContext(self._source_path, scan_context)
+
+        scan_context = test_scan_cache.GetScanContext(self._source_path)
+        self.assertIsNotNone(scan_context)
+
+        root_scan_node = scan_context.GetRootScanNode()
+        self.assertTrue(scan_context.IsLockedScanNode(root_scan_node.path_spec))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 """Tests for the source scanner object."""
 
+import os
+import random
+import struct
+import tempfile
 import unittest
 
+from dfvfs.analyzer import block_sampler
 from dfvfs.helpers import source_scanner
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 from dfvfs.volume import tsk_volume_system
 
@@ -478,6 +484,32 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
         self.assertIsNotNone(scan_node)
         self.assertEqual(scan_node.type_indicator, definitions.PREFERRED_EXT_BACK_END)
 
+    def testScanOnGPTInMODI(self):
+        """Test the Scan function on GPT in a MODI image."""
+        test_path = self._GetTestFilePath(["hfsplus_zlib.dmg"])
+        self._SkipIfPathNotExists(test_path)
+
+        scan_context = source_scanner.SourceScannerContext()
+        scan_context.OpenSourcePath(test_path)
+
+        self._source_scanner.Scan(scan_context)
+        self.assertEqual(
+            scan_context.source_type, definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE
+        )
+        scan_node = scan_context.GetRootScanNode().sub_nodes[0]
+        self.assertEqual(scan_node.type_indicator, definitions.TYPE_INDICATOR_MODI)
+        self.assertEqual(len(scan_node.sub_nodes), 1)
+
+        # The image also contains a FAT boot signature at offset 510, which must
+        # not prevent the GPT at offset 512 from being detected.
+        scan_node = scan_node.sub_nodes[0]
+        self.assertEqual(scan_node.type_indicator, definitions.PREFERRED_GPT_BACK_END)
+        self.assertEqual(len(scan_node.sub_nodes), 1)
+
+        scan_node = scan_node.sub_nodes[0].GetSubNodeByLocation("/")
+        self.assertIsNotNone(scan_node)
+        self.assertEqual(scan_node.type_indicator, definitions.PREFERRED_HFS_BACK_END)
+
     def testScanOnEmtpyGPTWithMBR(self):
         """Test the Scan function on an empty GPT with a MBR."""
         test_path = self._GetTestFilePath(["gpt_empty_with_mbr.raw"])
@@ -586,6 +618,149 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
         self.assertIsNotNone(scan_node)
         self.assertEqual(scan_node.type_indicator, definitions.PREFERRED_EXT_BACK_END)
 
+    def testScanOnMBRConcurrently(self):
+        """Test the Scan function on MBR with concurrent scanning of partitions."""
+        test_path = self._GetTestFilePath(["mbr.raw"])
+        self._SkipIfPathNotExists(test_path)
+
+        with self.assertRaises(ValueError):
+            source_scanner.SourceScanner(maximum_number_of_workers=0)
+
+        test_source_scanner = source_scanner.SourceScanner(maximum_number_of_workers=4)
+
+        scan_context = source_scanner.SourceScannerContext()
+        scan_context.OpenSourcePath(test_path)
+
+        test_source_scanner.Scan(scan_context)
+        self.assertEqual(
+            scan_context.source_type, definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE
+        )
+        scan_node = self._GetTestScanNode(scan_context)
+        self.assertIsNotNone(scan_node)
+        self.assertEqual(
+            scan_node.type_indicator, definitions.TYPE_INDICATOR_TSK_PARTITION
+        )
+        self.assertEqual(len(scan_node.sub_nodes), 8)
+
+        # The sub nodes are in the same order as when scanned sequentially.
+        expected_scan_context = source_scanner.SourceScannerContext()
+        expected_scan_context.OpenSourcePath(test_path)
+
+        self._source_scanner.Scan(expected_scan_context)
+        expected_scan_node = self._GetTestScanNode(expected_scan_context)
+
+        self.assertEqual(
+            [sub_scan_node.path_spec for sub_scan_node in scan_node.sub_nodes],
+            [sub_scan_node.path_spec for sub_scan_node in expected_scan_node.sub_nodes],
+        )
+
+        scan_node = scan_node.sub_nodes[6].GetSubNodeByLocation("/")
+        self.assertIsNotNone(scan_node)
+        self.assertEqual(scan_node.type_indicator, definitions.PREFERRED_EXT_BACK_END)
+
+    def testScanWithBlockSampler(self):
+        """Test the Scan function with a block sampler."""
+        # MBR with 2 partitions without a file system, of which the first contains
+        # structured data followed by zero bytes and the second random data.
+        image_data = bytearray(2048 * 512)
+        for partition_index, (start_sector, number_of_sectors) in enumerate(
+            [(64, 512), (1024, 1024)]
+        ):
+            entry_offset = 446 + (partition_index * 16)
+            image_data[entry_offset : entry_offset + 16] = struct.pack(
+                "<B3sB3sII", 0, b"", 0x83, b"", start_sector, number_of_sectors
+            )
+
+        image_data[510:512] = b"\x55\xaa"
+        image_data[64 * 512 : (64 * 512) + 4096] = b"structured data\n" * 256
+        image_data[1024 * 512 :] = random.Random(0).randbytes(1024 * 512)
+
+        resolver_context = context.Context()
+        test_block_sampler = block_sampler.BlockSampler()
+        test_source_scanner = source_scanner.SourceScanner(
+            resolver_context=resolver_context, block_sampler=test_block_sampler
+        )
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_path = os.path.join(temporary_directory, "unformatted.raw")
+            with open(test_path, "wb") as file_object:
+                file_object.write(image_data)
+
+            scan_context = source_scanner.SourceScannerContext()
+            scan_context.OpenSourcePath(test_path)
+
+            test_source_scanner.Scan(scan_context)
+            scan_node = self._GetTestScanNode(scan_context)
+            self.assertIsNotNone(scan_node)
+            self.assertEqual(
+                scan_node.type_indicator, definitions.TYPE_INDICATOR_TSK_PARTITION
+            )
+
+            sub_scan_node = scan_node.GetSubNodeByLocation("/p1")
+            self.assertIsNotNone(sub_scan_node)
+            self.assertIsNotNone(sub_scan_node.block_map)
+
+            regions = list(sub_scan_node.block_map.GetRegions())
+            self.assertEqual(
+                regions,
+                [
+                    (0, 4096, definitions.BLOCK_TYPE_STRUCTURED),
+                    (4096, 258048, definitions.BLOCK_TYPE_ZERO),
+                ],
+            )
+
+            sub_scan_node = scan_node.GetSubNodeByLocation("/p2")
+            self.assertIsNotNone(sub_scan_node)
+            self.assertIsNotNone(sub_scan_node.block_map)
+
+            regions = list(sub_scan_node.block_map.GetRegions())
+            self.assertEqual(
+                regions, [(0, 524288, definitions.BLOCK_TYPE_HIGH_ENTROPY)]
+            )
+
+            # Close the image before the temporary directory is removed.
+            resolver_context.Empty()
+
+        # RAW image without a partition table or file system.
+        image_data = random.Random(1).randbytes(1024 * 1024)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_path = os.path.join(temporary_directory, "random.raw")
+            with open(test_path, "wb") as file_object:
+                file_object.write(image_data)
+
+            scan_context = source_scanner.SourceScannerContext()
+            scan_context.OpenSourcePath(test_path)
+
+            test_source_scanner.Scan(scan_context)
+            self.assertEqual(scan_context.source_type, definitions.SOURCE_TYPE_FILE)
+
+            scan_node = scan_context.GetRootScanNode()
+            self.assertIsNotNone(scan_node)
+            self.assertEqual(scan_node.type_indicator, definitions.TYPE_INDICATOR_OS)
+            self.assertEqual(scan_node.sub_nodes, [])
+            self.assertIsNotNone(scan_node.block_map)
+
+            regions = list(scan_node.block_map.GetRegions())
+            self.assertEqual(
+                regions, [(0, 1048576, definitions.BLOCK_TYPE_HIGH_ENTROPY)]
+            )
+
+            resolver_context.Empty()
+
+        # A scan node with a file system is not sampled.
+        test_path = self._GetTestFilePath(["ext2.qcow2"])
+        self._SkipIfPathNotExists(test_path)
+
+        scan_context = source_scanner.SourceScannerContext()
+        scan_context.OpenSourcePath(test_path)
+
+        test_source_scanner.Scan(scan_context)
+        scan_node = self._GetTestScanNode(scan_context)
+        self.assertEqual(scan_node.type_indicator, definitions.PREFERRED_EXT_BACK_END)
+        self.assertIsNone(scan_node.block_map)
+        self.assertIsNone(scan_node.parent_node.block_map)
+
     def testScanOnVSS(self):
         """Test the Scan function on VSS."""
         test_path = self._GetTestFilePath(["vss.raw"])
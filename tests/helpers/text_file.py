@@ -11,11 +11,6 @@ from dfvfs.resolver import resolver
 
 from tests import test_lib as shared_test_lib
 
-# TODO: Add a test which tests reading a text file which is
-# larger than the buffer size, and read lines until it crosses
-# that original buffer size (to test if the buffer is correctly
-# filled).
-
 
 class TextFileTest(shared_test_lib.BaseTestCase):
     """The unit test for the text file object."""
@@ -113,6 +108,32 @@ class TextFileTest(shared_test_lib.BaseTestCase):
         offset = text_file_object.get_offset()
         self.assertEqual(offset, 24)
 
+    def testReadlineUTF16WithPartialCharacter(self):
+        """Test the readline() function on a partial UTF-16 character."""
+        test_path = self._GetTestFilePath(["another_file.utf16"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        file_object = resolver.Resolver.OpenFileObject(
+            test_os_path_spec, resolver_context=self._resolver_context
+        )
+
+        text_file_object = text_file.TextFile(file_object, encoding="utf-16-le")
+
+        line = text_file_object.readline(size=5)
+        self.assertEqual(line, "T")
+
+        offset = text_file_object.get_offset()
+        self.assertEqual(offset, 5)
+
+        line = text_file_object.readline()
+        self.assertEqual(line, "his is another file.\n")
+
+        offset = text_file_object.get_offset()
+        self.assertEqual(offset, 46)
+
     def testReadlineMultipleLines(self):
         """Test the readline() function on multiple lines."""
         test_path = self._GetTestFilePath(["password.txt"])
@@ -199,6 +220,33 @@ class TextFileTest(shared_test_lib.BaseTestCase):
         self.assertEqual(lines[3], "treasure chest,-,1111\n")
         self.assertEqual(lines[4], "uber secret laire,admin,admin\n")
 
+    def testReadlinesWithSmallReadChunkSize(self):
+        """Test the readlines() function with lines that cross read chunks."""
+        test_path = self._GetTestFilePath(["password.txt"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        file_object = resolver.Resolver.OpenFileObject(
+            test_os_path_spec, resolver_context=self._resolver_context
+        )
+
+        text_file_object = text_file.TextFile(file_object, end_of_line=",-,")
+        text_file_object._READ_CHUNK_SIZE = 2  # pylint: disable=protected-access
+
+        lines = text_file_object.readlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(
+            lines[0], "place,user,password\nbank,joesmith,superrich\nalarm system,-,"
+        )
+        self.assertEqual(lines[1], "1234\ntreasure chest,-,")
+        self.assertEqual(lines[2], "1111\nuber secret laire,admin,admin\n")
+
+        offset = text_file_object.get_offset()
+        self.assertEqual(offset, 116)
+
     def testReadlinesWithSizeHint(self):
         """Test the readlines() function."""
         test_path = self._GetTestFilePath(["password.txt"])
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Tests for the volume scanner objects."""
 
+import tempfile
 import unittest
 
+from dfvfs.helpers import source_scan_cache
 from dfvfs.helpers import source_scanner
 from dfvfs.helpers import volume_scanner
 from dfvfs.lib import definitions
@@ -993,6 +995,42 @@ class VolumeScannerTest(shared_test_lib.BaseTestCase):
         ]
         self.assertEqual(base_path_specs, expected_base_path_specs)
 
+    def testGetBasePathSpecsWithScanCache(self):
+        """Tests the GetBasePathSpecs function with a source scan cache."""
+        test_path = self._GetTestFilePath(["ext2.qcow2"])
+        self._SkipIfPathNotExists(test_path)
+
+        test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=test_path
+        )
+        test_qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_QCOW, parent=test_os_path_spec
+        )
+        test_ext_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.PREFERRED_EXT_BACK_END,
+            location="/",
+            parent=test_qcow_path_spec,
+        )
+        expected_base_path_specs = [test_ext_path_spec.comparable]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_scan_cache = source_scan_cache.SourceScanCache(temporary_directory)
+
+            for _ in range(2):
+                test_mediator = TestVolumeScannerMediator()
+                test_scanner = volume_scanner.VolumeScanner(
+                    mediator=test_mediator, scan_cache=test_scan_cache
+                )
+
+                base_path_specs = test_scanner.GetBasePathSpecs(test_path)
+                base_path_specs = [
+                    base_path_spec.comparable for base_path_spec in base_path_specs
+                ]
+                self.assertEqual(base_path_specs, expected_base_path_specs)
+
+            scan_context = test_scan_cache.GetScanContext(test_path)
+            self.assertIsNotNone(scan_context)
+
 
 class WindowsVolumeScannerTest(shared_test_lib.BaseTestCase):
     """Tests for a Windows volume scanner."""
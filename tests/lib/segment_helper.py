@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for the storage media image segment files support helper classes."""
+
+import os
+import unittest
+
+from dfvfs.lib import definitions
+from dfvfs.lib import segment_helper
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import fake_file_system
+
+from tests import test_lib as shared_test_lib
+
+
+class SegmentFileEntryCheckerTest(shared_test_lib.BaseTestCase):
+    """Tests for the segment file entry checker."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        self._resolver_context = context.Context()
+        path_spec = fake_path_spec.FakePathSpec(location="/")
+        self._file_system = fake_file_system.FakeFileSystem(
+            self._resolver_context, path_spec
+        )
+        self._file_system.AddFileEntry(
+            "/images", file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY
+        )
+        self._file_system.AddFileEntry("/images/image.E01")
+        self._file_system.AddFileEntry("/images/image.E02")
+        self._file_system.AddFileEntry("/image.raw")
+
+    def tearDown(self):
+        """Cleans up the needed objects used throughout the test."""
+        self._resolver_context.Empty()
+
+    def testFileEntryExistsByPathSpec(self):
+        """Tests the FileEntryExistsByPathSpec function."""
+        parent_path_spec = fake_path_spec.FakePathSpec(location="/images/image.E01")
+        checker = segment_helper.SegmentFileEntryChecker(
+            self._file_system, parent_path_spec
+        )
+
+        for location, expected_result in (
+            ("/images/image.E01", True),
+            ("/images/image.E02", True),
+            ("/images/image.E03", False),
+            ("/image.raw", True),
+            ("/image.dd", False),
+            ("/bogus/image.E01", False),
+        ):
+            path_spec = fake_path_spec.FakePathSpec(location=location)
+            result = checker.FileEntryExistsByPathSpec(path_spec)
+            self.assertEqual(result, expected_result, msg=location)
+
+        # The directory of the segment files is listed once.
+        # pylint: disable=protected-access
+        self.assertEqual(
+            sorted(checker._directory_names.keys()), ["/", "/bogus", "/images"]
+        )
+        self.assertIsNone(checker._directory_names["/bogus"])
+
+
+class SegmentFileObjectPoolTest(shared_test_lib.BaseTestCase):
+    """Tests for the segment file object pool."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        self._resolver_context = context.Context()
+
+        self._path_specs = []
+        for filename in ("ext2.splitraw.000", "ext2.splitraw.001"):
+            test_path = self._GetTestFilePath([filename])
+            self._SkipIfPathNotExists(test_path)
+
+            path_spec = path_spec_factory.Factory.NewPathSpec(
+                definitions.TYPE_INDICATOR_OS, location=test_path
+            )
+            self._path_specs.append(path_spec)
+
+    def tearDown(self):
+        """Cleans up the needed objects used throughout the test."""
+        self._resolver_context.Empty()
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with self.assertRaises(ValueError):
+            segment_helper.SegmentFileObjectPool(
+                self._resolver_context, maximum_number_of_open_file_objects=0
+            )
+
+    def testGetFileObject(self):
+        """Tests the GetFileObject function."""
+        file_object_pool = segment_helper.SegmentFileObjectPool(
+            self._resolver_context, maximum_number_of_open_file_objects=1
+        )
+
+        file_objects = [
+            file_object_pool.GetFileObject(path_spec) for path_spec in self._path_specs
+        ]
+        self.assertEqual(file_object_pool.GetOpenFileObjects(), [])
+
+        with open(self._path_specs[0].location, "rb") as file_object:
+            expected_data = file_object.read()
+
+        self.assertEqual(file_objects[0].get_size(), len(expected_data))
+        self.assertEqual(len(file_object_pool.GetOpenFileObjects()), 1)
+
+        file_objects[0].seek(1024, os.SEEK_SET)
+        self.assertEqual(file_objects[0].read(16), expected_data[1024:1040])
+        self.assertEqual(file_objects[0].get_offset(), 1040)
+
+        file_objects[1].seek(-16, os.SEEK_END)
+        file_objects[1].read(16)
+
+        # Reading from the first segment file again reopens it at its offset.
+        self.assertEqual(file_objects[0].read(16), expected_data[1040:1056])
+        self.assertEqual(len(file_object_pool.GetOpenFileObjects()), 1)
+
+        with self.assertRaises(OSError):
+            file_objects[0].seek(-1, os.SEEK_SET)
+
+        file_object_pool.Empty()
+        self.assertEqual(file_object_pool.GetOpenFileObjects(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 
 from tests import test_lib as shared_test_lib
@@ -35,6 +36,36 @@ class ResolverHelperManagerTest(shared_test_lib.BaseTestCase):
             number_of_resolver_helpers,
         )
 
+    def testLazyHelperRegistration(self):
+        """Tests the GetHelper and RegisterLazyHelper functions."""
+        resolver_helper = manager.ResolverHelperManager.GetHelper(
+            definitions.TYPE_INDICATOR_OS
+        )
+        self.assertIsNotNone(resolver_helper)
+        self.assertEqual(resolver_helper.type_indicator, definitions.TYPE_INDICATOR_OS)
+        self.assertNotIn(
+            definitions.TYPE_INDICATOR_OS,
+            manager.ResolverHelperManager._lazy_resolver_helpers,
+        )
+
+        with self.assertRaises(KeyError):
+            manager.ResolverHelperManager.RegisterLazyHelper(
+                definitions.TYPE_INDICATOR_OS,
+                "dfvfs.resolver_helpers.os_resolver_helper",
+            )
+
+        # A resolver helper of which the module cannot be imported, for example
+        # because its back-end library is not available, is not set.
+        manager.ResolverHelperManager.RegisterLazyHelper(
+            "TEST_LAZY", "dfvfs.resolver_helpers.bogus_resolver_helper"
+        )
+        with self.assertRaises(KeyError):
+            manager.ResolverHelperManager.GetHelper("TEST_LAZY")
+
+        self.assertNotIn(
+            "TEST_LAZY", manager.ResolverHelperManager._lazy_resolver_helpers
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Tests for the serializer object implementation using a binary format."""
+
+import os
+import unittest
+
+from dfvfs.path import encrypted_stream_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import sqlite_blob_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.path import vshadow_path_spec
+from dfvfs.serializer import binary_serializer as serializer
+
+from tests import test_lib as shared_test_lib
+
+
+class BinaryPathSpecSerializerTest(shared_test_lib.BaseTestCase):
+    """Tests for the binary path specification serializer."""
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        test_file = self._GetTestFilePath(["ext2.qcow2"])
+        self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+        self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(parent=self._os_path_spec)
+        self._vshadow_path_spec = vshadow_path_spec.VShadowPathSpec(
+            store_index=1, parent=self._qcow_path_spec
+        )
+        self._tsk_path_spec = tsk_path_spec.TSKPathSpec(
+            inode=16,
+            location="/a_directory/another_file",
+            parent=self._vshadow_path_spec,
+        )
+
+        self._tsk_path_spec_dict = {
+            "inode": 16,
+            "location": "/a_directory/another_file",
+            "parent": {
+                "store_index": 1,
+                "parent": {"parent": {"location": os.path.abspath(test_file)}},
+            },
+        }
+
+    def testReadAndWriteSerialized(self):
+        """Test the ReadSerialized and WriteSerialized function."""
+        serialized_path_spec = serializer.BinaryPathSpecSerializer.WriteSerialized(
+            self._tsk_path_spec
+        )
+
+        self.assertIsNotNone(serialized_path_spec)
+
+        path_spec = serializer.BinaryPathSpecSerializer.ReadSerialized(
+            serialized_path_spec
+        )
+
+        self.assertIsNotNone(path_spec)
+
+        path_spec_dict = path_spec.CopyToDict()
+        self.assertEqual(
+            sorted(path_spec_dict.items()), sorted(self._tsk_path_spec_dict.items())
+        )
+
+        with self.assertRaises(ValueError):
+            serializer.BinaryPathSpecSerializer.ReadSerialized(b"")
+
+        with self.assertRaises(ValueError):
+            serializer.BinaryPathSpecSerializer.ReadSerialized(
+                serialized_path_spec[:-4]
+            )
+
+        with self.assertRaises(TypeError):
+            serializer.BinaryPathSpecSerializer.WriteSerialized("bogus")
+
+    def testReadAndWriteSerializedWithPropertyValueTypes(self):
+        """Test the ReadSerialized and WriteSerialized function on value types."""
+        encrypted_stream_path_spec_object = (
+            encrypted_stream_path_spec.EncryptedStreamPathSpec(
+                cipher_mode="cbc",
+                encryption_method="aes",
+                initialization_vector=b"\x00\x01\x02\x03",
+                key=b"\xff" * 16,
+                parent=self._os_path_spec,
+            )
+        )
+        sqlite_blob_path_spec_object = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+            column_name="blob",
+            row_condition=("identifier", "==", -1),
+            table_name="blobs",
+            parent=encrypted_stream_path_spec_object,
+        )
+
+        serialized_path_spec = serializer.BinaryPathSpecSerializer.WriteSerialized(
+            sqlite_blob_path_spec_object
+        )
+
+        path_spec = serializer.BinaryPathSpecSerializer.ReadSerialized(
+            serialized_path_spec
+        )
+        self.assertEqual(path_spec, sqlite_blob_path_spec_object)
+        self.assertEqual(path_spec.row_condition, ("identifier", "==", -1))
+        self.assertEqual(path_spec.parent.initialization_vector, b"\x00\x01\x02\x03")
+
+    def testReadAndWriteSerializedBatch(self):
+        """Test the ReadSerializedBatch and WriteSerializedBatch function."""
+        path_specs = [
+            tsk_path_spec.TSKPathSpec(
+                inode=inode, location=location, parent=self._vshadow_path_spec
+            )
+            for inode, location in (
+                (14, "/passwords.txt"),
+                (15, "/a_directory/another_file"),
+                (16, "/a_directory/a_file"),
+            )
+        ]
+        path_specs.append(self._vshadow_path_spec)
+
+        serialized_path_specs = (
+            serializer.BinaryPathSpecSerializer.WriteSerializedBatch(path_specs)
+        )
+
+        # The shared parent path specifications are only serialized once.
+        serialized_path_spec = serializer.BinaryPathSpecSerializer.WriteSerialized(
+            path_specs[0]
+        )
+        self.assertLess(len(serialized_path_specs), len(serialized_path_spec) * 2)
+
+        read_path_specs = serializer.BinaryPathSpecSerializer.ReadSerializedBatch(
+            serialized_path_specs
+        )
+        self.assertEqual(read_path_specs, path_specs)
+        self.assertIs(read_path_specs[0].parent, read_path_specs[3])
+
+        with self.assertRaises(ValueError):
+            serializer.BinaryPathSpecSerializer.ReadSerialized(serialized_path_specs)
+
+        serialized_path_specs = (
+            serializer.BinaryPathSpecSerializer.WriteSerializedBatch([])
+        )
+        read_path_specs = serializer.BinaryPathSpecSerializer.ReadSerializedBatch(
+            serialized_path_specs
+        )
+        self.assertEqual(read_path_specs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
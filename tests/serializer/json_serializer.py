@@ -6,6 +6,7 @@ import unittest
 
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
+from dfvfs.path import tsk_partition_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.path import vshadow_path_spec
 from dfvfs.serializer import json_serializer as serializer
@@ -58,6 +59,25 @@ class JsonPathSpecSerializerTest(shared_test_lib.BaseTestCase):
             sorted(path_spec_dict.items()), sorted(self._tsk_path_spec_dict.items())
         )
 
+    def testReadAndWriteSerializedWithSectorSize(self):
+        """Test the ReadSerialized and WriteSerialized function with sector size."""
+        test_path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+            location="/p1",
+            part_index=2,
+            sector_size=4096,
+            start_offset=1048576,
+            parent=self._qcow_path_spec,
+        )
+
+        serialized_path_spec = serializer.JsonPathSpecSerializer.WriteSerialized(
+            test_path_spec
+        )
+        path_spec = serializer.JsonPathSpecSerializer.ReadSerialized(
+            serialized_path_spec
+        )
+        self.assertEqual(path_spec, test_path_spec)
+        self.assertEqual(path_spec.sector_size, 4096)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -62,3 +62,108 @@ class BaseTestCase(unittest.TestCase):
         if not os.path.exists(path):
             filename = os.path.basename(path)
             raise unittest.SkipTest(f"missing test file: {filename:s}")
+
+
+class TestVShadowBlock:
+    """VSS block for testing.
+
+    Attributes:
+      original_offset (int): offset of the block in the volume.
+    """
+
+    def __init__(self, original_offset):
+        """Initializes a VSS block.
+
+        Args:
+          original_offset (int): offset of the block in the volume.
+        """
+        super().__init__()
+        self.original_offset = original_offset
+
+
+class TestVShadowStore:
+    """VSS store for testing.
+
+    Attributes:
+      blocks (list[TestVShadowBlock]): blocks stored in the VSS store.
+      volume_size (int): size of the volume of the VSS store.
+    """
+
+    def __init__(self, block_offsets, volume_size):
+        """Initializes a VSS store.
+
+        Args:
+          block_offsets (list[int]): offsets in the volume of the blocks stored in
+              the VSS store or None if the VSS store has no in-volume stored data.
+          volume_size (int): size of the volume of the VSS store.
+        """
+        super().__init__()
+        self._has_in_volume_data = block_offsets is not None
+        self.blocks = [
+            TestVShadowBlock(block_offset) for block_offset in block_offsets or []
+        ]
+        self.volume_size = volume_size
+
+    # pylint: disable=invalid-name
+
+    def has_in_volume_data(self):
+        """Determines if the VSS store has in-volume stored data.
+
+        Returns:
+          bool: True if the VSS store has in-volume stored data.
+        """
+        return self._has_in_volume_data
+
+
+class TestVShadowVolume:
+    """VSS volume for testing."""
+
+    def __init__(self, stores):
+        """Initializes a VSS volume.
+
+        Args:
+          stores (list[TestVShadowStore]): VSS stores.
+        """
+        super().__init__()
+        self._stores = stores
+
+    # pylint: disable=invalid-name
+
+    @property
+    def number_of_stores(self):
+        """int: number of VSS stores."""
+        return len(self._stores)
+
+    def get_store(self, store_index):
+        """Retrieves a VSS store.
+
+        Args:
+          store_index (int): store index.
+
+        Returns:
+          TestVShadowStore: VSS store.
+        """
+        return self._stores[store_index]
+
+
+class TestFileObject:
+    """File-like object of a volume for testing."""
+
+    def __init__(self, size):
+        """Initializes a file-like object.
+
+        Args:
+          size (int): size of the volume.
+        """
+        super().__init__()
+        self._size = size
+
+    # pylint: disable=invalid-name
+
+    def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the volume.
+        """
+        return self._size
@@ -110,6 +110,32 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
 
         self.assertIsNone(file_entry)
 
+    def testGetFileEntriesByInode(self):
+        """Tests the GetFileEntriesByInode function."""
+        file_system = tsk_file_system.TSKFileSystem(
+            self._resolver_context, self._tsk_path_spec
+        )
+        self.assertIsNotNone(file_system)
+
+        file_system.Open()
+
+        file_entries = list(file_system.GetFileEntriesByInode())
+        self.assertGreater(len(file_entries), 0)
+
+        inodes = [file_entry.path_spec.inode for file_entry in file_entries]
+        self.assertEqual(inodes, sorted(inodes))
+        self.assertIn(self._INODE_PASSWORDS_TXT, inodes)
+
+        file_entries = file_system.GetFileEntriesByInode(
+            allocated_only=True, resolve_locations=True
+        )
+        locations = {
+            file_entry.path_spec.inode: getattr(file_entry.path_spec, "location", None)
+            for file_entry in file_entries
+        }
+        self.assertEqual(locations.get(2), "/")
+        self.assertEqual(locations.get(self._INODE_PASSWORDS_TXT), "/passwords.txt")
+
     def testGetRootFileEntry(self):
         """Test the get root file entry functionality."""
         file_system = tsk_file_system.TSKFileSystem(
@@ -6,6 +6,7 @@ import unittest
 from dfvfs.lib import definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 from dfvfs.vfs import tsk_partition_file_system
 
 from tests import test_lib as shared_test_lib
@@ -14,6 +15,8 @@ from tests import test_lib as shared_test_lib
 class TSKPartitionFileSystemTest(shared_test_lib.BaseTestCase):
     """Tests the TSK partition file system."""
 
+    # pylint: disable=protected-access
+
     def setUp(self):
         """Sets up the needed objects used throughout the test."""
         self._resolver_context = context.Context()
@@ -204,6 +207,75 @@ class TSKPartitionFileSystemTest(shared_test_lib.BaseTestCase):
         self.assertIsNotNone(file_entry)
         self.assertEqual(file_entry.name, "")
 
+    def testGetTSKVsPartByPathSpec(self):
+        """Test the get TSK volume system part by path specification functionality."""
+        file_system = tsk_partition_file_system.TSKPartitionFileSystem(
+            self._resolver_context, self._tsk_partition_path_spec
+        )
+        self.assertIsNotNone(file_system)
+
+        file_system.Open()
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK_PARTITION,
+            location="/p2",
+            parent=self._os_path_spec,
+        )
+        tsk_vs_part, partition_index = file_system.GetTSKVsPartByPathSpec(path_spec)
+        self.assertIsNotNone(tsk_vs_part)
+        self.assertEqual(tsk_vs_part.start, 352)
+        self.assertEqual(partition_index, 1)
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK_PARTITION,
+            part_index=2,
+            parent=self._os_path_spec,
+        )
+        tsk_vs_part, partition_index = file_system.GetTSKVsPartByPathSpec(path_spec)
+        self.assertIsNotNone(tsk_vs_part)
+        self.assertEqual(tsk_vs_part.start, 1)
+        self.assertEqual(partition_index, 1)
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK_PARTITION,
+            start_offset=180224,
+            parent=self._os_path_spec,
+        )
+        tsk_vs_part, partition_index = file_system.GetTSKVsPartByPathSpec(path_spec)
+        self.assertIsNotNone(tsk_vs_part)
+        self.assertEqual(tsk_vs_part.start, 352)
+        self.assertEqual(partition_index, 2)
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_TSK_PARTITION,
+            location="/p9",
+            parent=self._os_path_spec,
+        )
+        tsk_vs_part, partition_index = file_system.GetTSKVsPartByPathSpec(path_spec)
+        self.assertIsNone(tsk_vs_part)
+        self.assertIsNone(partition_index)
+
+    def testGetTSKVsPartByPathSpecWithResolver(self):
+        """Test retrieving TSK volume system parts of a referenced file system."""
+        file_system = resolver.Resolver.OpenFileSystem(
+            self._tsk_partition_path_spec, resolver_context=self._resolver_context
+        )
+        tsk_vs_part_table = file_system._tsk_vs_part_table
+
+        for location in ("/p1", "/p2", "/p1"):
+            path_spec = path_spec_factory.Factory.NewPathSpec(
+                definitions.TYPE_INDICATOR_TSK_PARTITION,
+                location=location,
+                parent=self._os_path_spec,
+            )
+            file_object = resolver.Resolver.OpenFileObject(
+                path_spec, resolver_context=self._resolver_context
+            )
+            self.assertIs(file_object._file_system, file_system)
+            del file_object
+
+        self.assertIs(file_system._tsk_vs_part_table, tsk_vs_part_table)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,107 @@ from dfvfs.vfs import vshadow_file_system
 from tests import test_lib as shared_test_lib
 
 
+class VShadowFileSystemPreservedBlockRangesTest(shared_test_lib.BaseTestCase):
+    """Tests the preserved block ranges of the VSS file system."""
+
+    # pylint: disable=protected-access
+
+    _VOLUME_SIZE = 0x100000
+
+    def _CreateTestFileSystem(self, stores):
+        """Creates a VSS file system for testing.
+
+        Args:
+          stores (list[shared_test_lib.TestVShadowStore]): VSS stores.
+
+        Returns:
+          VShadowFileSystem: VSS file system.
+        """
+        test_fake_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_FAKE, location="/"
+        )
+        test_vshadow_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_VSHADOW,
+            location="/",
+            parent=test_fake_path_spec,
+        )
+        file_system = vshadow_file_system.VShadowFileSystem(
+            context.Context(), test_vshadow_path_spec
+        )
+        file_system._file_object = shared_test_lib.TestFileObject(self._VOLUME_SIZE)
+        file_system._vshadow_volume = shared_test_lib.TestVShadowVolume(stores)
+
+        return file_system
+
+    def _GetPreservedBlockRanges(self, file_system, store_index):
+        """Retrieves the preserved block ranges of a VSS store.
+
+        Args:
+          file_system (VShadowFileSystem): VSS file system.
+          store_index (int): store index.
+
+        Returns:
+          list[tuple[int, int]]: offset and size of the ranges or None.
+        """
+        test_fake_path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_FAKE, location="/"
+        )
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_VSHADOW,
+            parent=test_fake_path_spec,
+            store_index=store_index,
+        )
+        return file_system.GetPreservedBlockRangesByPathSpec(path_spec)
+
+    def testGetPreservedBlockRangesByPathSpec(self):
+        """Test the GetPreservedBlockRangesByPathSpec function."""
+        file_system = self._CreateTestFileSystem(
+            [
+                # Original offsets of blocks are not necessarily block aligned.
+                shared_test_lib.TestVShadowStore(
+                    [0x4000, 0x8200, 0xFC000], self._VOLUME_SIZE
+                ),
+                shared_test_lib.TestVShadowStore([0x20000], self._VOLUME_SIZE + 0x2000),
+            ]
+        )
+
+        # The ranges of an older VSS store include the ranges of newer VSS stores.
+        block_ranges = self._GetPreservedBlockRanges(file_system, 0)
+        self.assertEqual(
+            block_ranges, [(0x4000, 0x8000), (0x20000, 0x4000), (0xFC000, 0x4000)]
+        )
+
+        # Data of the VSS store beyond the end of the volume is included.
+        block_ranges = self._GetPreservedBlockRanges(file_system, 1)
+        self.assertEqual(block_ranges, [(0x20000, 0x4000), (self._VOLUME_SIZE, 0x2000)])
+
+        block_ranges = self._GetPreservedBlockRanges(file_system, 2)
+        self.assertIsNone(block_ranges)
+
+        # Blocks beyond the end of the volume of the VSS store are ignored.
+        file_system = self._CreateTestFileSystem(
+            [
+                shared_test_lib.TestVShadowStore([0x4000], 0x8000),
+                shared_test_lib.TestVShadowStore([0x6000, 0x8000], self._VOLUME_SIZE),
+            ]
+        )
+
+        block_ranges = self._GetPreservedBlockRanges(file_system, 0)
+        self.assertEqual(block_ranges, [(0x4000, 0x4000)])
+
+        # The ranges cannot be determined if a VSS store without in-volume stored
+        # data was created after the VSS store.
+        file_system = self._CreateTestFileSystem(
+            [
+                shared_test_lib.TestVShadowStore([0x4000], self._VOLUME_SIZE),
+                shared_test_lib.TestVShadowStore(None, self._VOLUME_SIZE),
+            ]
+        )
+
+        block_ranges = self._GetPreservedBlockRanges(file_system, 0)
+        self.assertIsNone(block_ranges)
+
+
 class VShadowFileSystemTest(shared_test_lib.BaseTestCase):
     """Tests the Volume Shadow Snapshot (VSS) file system."""
 
@@ -114,6 +215,65 @@ class VShadowFileSystemTest(shared_test_lib.BaseTestCase):
         )
         self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    def testGetPreservedBlockRangesByPathSpec(self):
+        """Test the GetPreservedBlockRangesByPathSpec function."""
+        file_system = vshadow_file_system.VShadowFileSystem(
+            self._resolver_context, self._vshadow_path_spec
+        )
+        self.assertIsNotNone(file_system)
+
+        file_system.Open()
+
+        for store_index in range(2):
+            path_spec = path_spec_factory.Factory.NewPathSpec(
+                definitions.TYPE_INDICATOR_VSHADOW,
+                parent=self._raw_path_spec,
+                store_index=store_index,
+            )
+            block_ranges = file_system.GetPreservedBlockRangesByPathSpec(path_spec)
+            self.assertIsNotNone(block_ranges)
+
+            # The ranges are sorted, do not overlap and are within the volume.
+            range_end_offset = 0
+            for range_offset, range_size in block_ranges:
+                self.assertGreaterEqual(range_offset, range_end_offset)
+                self.assertGreater(range_size, 0)
+                range_end_offset = range_offset + range_size
+
+            self.assertLessEqual(range_end_offset, 82771968)
+
+        # The ranges of an older VSS store include the ranges of newer VSS stores.
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_VSHADOW,
+            parent=self._raw_path_spec,
+            store_index=0,
+        )
+        block_ranges = file_system.GetPreservedBlockRangesByPathSpec(path_spec)
+        total_size = sum(range_size for _, range_size in block_ranges)
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_VSHADOW,
+            parent=self._raw_path_spec,
+            store_index=1,
+        )
+        block_ranges = file_system.GetPreservedBlockRangesByPathSpec(path_spec)
+        self.assertLessEqual(
+            sum(range_size for _, range_size in block_ranges), total_size
+        )
+
+        block_ranges = file_system.GetPreservedBlockRangesByPathSpec(
+            self._vshadow_path_spec
+        )
+        self.assertIsNone(block_ranges)
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_VSHADOW,
+            parent=self._raw_path_spec,
+            store_index=9,
+        )
+        block_ranges = file_system.GetPreservedBlockRangesByPathSpec(path_spec)
+        self.assertIsNone(block_ranges)
+
     def testGetFileEntryByPathSpec(self):
         """Tests the GetFileEntryByPathSpec function."""
         file_system = vshadow_file_system.VShadowFileSystem(
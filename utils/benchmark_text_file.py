@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Script to benchmark reading lines with the text file helper."""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, ".")
+
+from dfvfs.helpers import text_file  # pylint: disable=wrong-import-position
+from dfvfs.lib import definitions  # pylint: disable=wrong-import-position
+from dfvfs.path import factory  # pylint: disable=wrong-import-position
+from dfvfs.resolver import resolver  # pylint: disable=wrong-import-position
+
+
+def WriteTestFile(path, size):
+    """Writes a test file with syslog-like lines of text.
+
+    Args:
+      path (str): path of the test file.
+      size (int): size of the test file in bytes.
+    """
+    lines = b"".join(
+        [
+            (
+                f"Jan  1 00:00:{index % 60:02d} host process[{index:d}]: "
+                f"{'message ' * (index % 16):s}\n"
+            ).encode("utf-8")
+            for index in range(1024)
+        ]
+    )
+
+    with open(path, "wb") as file_object:
+        number_of_bytes = 0
+        while number_of_bytes < size:
+            file_object.write(lines)
+            number_of_bytes += len(lines)
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      bool: True if successful or False if not.
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Benchmarks reading lines with the text file helper."
+    )
+
+    argument_parser.add_argument(
+        "--size",
+        dest="size",
+        type=int,
+        default=1024,
+        help="size of the generated test file in MiB.",
+    )
+
+    argument_parser.add_argument(
+        "source",
+        nargs="?",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of the text file, where a test file is generated if not set.",
+    )
+
+    options = argument_parser.parse_args()
+
+    temporary_directory = None
+    path = options.source
+    if not path:
+        temporary_directory = tempfile.mkdtemp()
+        path = os.path.join(temporary_directory, "benchmark.txt")
+
+        WriteTestFile(path, options.size * 1024 * 1024)
+
+    try:
+        path_spec = factory.Factory.NewPathSpec(
+            definitions.TYPE_INDICATOR_OS, location=os.path.abspath(path)
+        )
+        file_object = resolver.Resolver.OpenFileObject(path_spec)
+
+        start_time = time.perf_counter()
+
+        number_of_lines = 0
+        for _ in text_file.TextFile(file_object):
+            number_of_lines += 1
+
+        elapsed_time = time.perf_counter() - start_time
+
+        file_size = file_object.get_size()
+        mebibytes_per_second = (file_size / (1024 * 1024)) / elapsed_time
+
+        print(f"File size\t\t: {file_size:d} bytes")
+        print(f"Number of lines\t\t: {number_of_lines:d}")
+        print(f"Elapsed time\t\t: {elapsed_time:.2f} seconds")
+        print(f"Throughput\t\t: {mebibytes_per_second:.1f} MiB/s")
+
+    finally:
+        if temporary_directory:
+            os.remove(path)
+            os.rmdir(temporary_directory)
+
+    return True
+
+
+if __name__ == "__main__":
+    if not Main():
+        sys.exit(1)
+    else:
+        sys.exit(0)